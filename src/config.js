@@ -35,6 +35,15 @@ const db_port = '5432';
 
 const logLevel = 0;
 
+// constraint solving
+// outcomes of the solver can be cached on disk, such that handlers we see on many sites do not need to be solved again
+const solverCache = process.env.SOLVER_CACHE;
+const solverCacheSize = 100000;
+// race several z3 configurations on every query instead of a single default solver
+const solverPortfolio = process.env.SOLVER_PORTFOLIO === '1';
+// add timings and counters of the solver to the stored outcomes, e.g. to find the hot spots of a crawl
+const solverStats = process.env.SOLVER_STATS === '1';
+
 // chrome flags to be passed on chrome startup
 const DEFAULT_FLAGS = [
   // Disable built-in Google Translate service
@@ -94,6 +103,12 @@ config = {
   clearProfileOnShutdown: clearProfileOnShutdown,
   logLevel: logLevel,
   userAgent: userAgent,
+  solver: {
+    cache: solverCache,
+    cacheSize: solverCacheSize,
+    portfolio: solverPortfolio,
+    stats: solverStats,
+  },
 };
 
 module.exports = {config};
\ No newline at end of file
@@ -346,17 +346,15 @@ async function generateExploitForReport(report, handler_id) {
 
   let origin_constraint = getOriginConstraints();
   let exploit_candidates = [];
-  for (let exploitId of sink_obj_constraints.keys()) {
-    let candidate = sink_obj_constraints.get(exploitId);
-    let cs_cloned = deepClone(cs);
-    // append exploit constraints
-    cs_cloned.push(candidate);
-    // append constraints for origin, e.g. starts with http etc
-    cs_cloned.push(origin_constraint);
-    // solve
-    let res = await window.__trySolveForSat(cs_cloned, inferred_types, constraintId, [candidate, origin_constraint], report['sink']);
-    if (res !== undefined) {
-      exploit_candidates.push({exploitCandidateId: res[1], exploitId: exploitId, payload_sat: res[0]});
+  let exploitIds = Array.from(sink_obj_constraints.keys());
+  // every candidate consists of the exploit constraints and the constraints for origin, e.g. starts with http etc
+  let candidates = exploitIds.map((exploitId) => [sink_obj_constraints.get(exploitId), origin_constraint]);
+  // solve all candidates at once, such that the base constraints only need to be handled once
+  let results = await window.__trySolveBatchForSat(cs, inferred_types, constraintId, candidates, report['sink']);
+  for (let i = 0; i < exploitIds.length; i++) {
+    let res = results[i];
+    if (res !== undefined && res !== null) {
+      exploit_candidates.push({exploitCandidateId: res[1], exploitId: exploitIds[i], payload_sat: res[0]});
     }
   }
   if (exploit_candidates.length === 0) {
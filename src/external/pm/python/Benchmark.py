@@ -0,0 +1,227 @@
+# Copyright (C) 2020  Marius Steffens, CISPA
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Measures translation and solve latency as well as peak memory of the benchmark corpus and the synthetic queries
+# and compares them against a stored baseline, such that changes to the solver or the z3 pin can be judged on numbers:
+#
+#   python3 Benchmark.py                    # fails if a query regressed against benchmark/baseline.json
+#   python3 Benchmark.py --update-baseline  # after an intended change, or on a new machine
+#
+# The corpus holds one query per exploit template of each handler in tests/, any dump of the database in the format
+# of BatchSolve.py can be benchmarked with --corpus as well. The templates of each handler are also solved together as
+# one batch, like the crawler sends them.
+
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import traceback
+
+import z3
+
+from BatchSolve import peakMemory, readRecords
+from ConstraintSolver import BATCH_ERRORS, solveConstrainsBatch, solveQuery
+from SolverStats import SolverStats
+from SyntheticQueries import syntheticSuite
+
+BENCHMARK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark')
+CORPUS = os.path.join(BENCHMARK_DIR, 'corpus.jsonl')
+BASELINE = os.path.join(BENCHMARK_DIR, 'baseline.json')
+
+CONTEXT = multiprocessing.get_context('fork')
+
+# latencies below this many seconds and memory below this many MB on top of the baseline are noise
+LATENCY_SLACK = 0.25
+MEMORY_SLACK = 64
+
+
+def loadCorpus(path):
+    queries = []
+    with open(path) as input:
+        for number, line in readRecords(input):
+            query = json.loads(line)
+            query.setdefault('name', '%s:%s' % (os.path.basename(path), query.get('exploit_id', number)))
+            queries.append(query)
+    return queries
+
+
+def batchSuite(queries):
+    # the exploit templates of a handler share its constraints, thus they make up one batch request of the crawler
+    batches = dict()
+    for query in queries:
+        if 'handler' in query and query.get('exploit_constraints'):
+            batch = batches.setdefault(query['handler'], {'name': 'batch/' + query['handler'],
+                                                          'constraints': query['constraints'],
+                                                          'types': query.get('types') or [], 'candidates': []})
+            batch['candidates'].append(query['exploit_constraints'])
+    return list(batches.values())
+
+
+def phaseTimes(phases):
+    return (phases.get('translation', {'wall': 0.0})['wall'],
+            sum(phases[phase]['wall'] for phase in ['check', 'model'] if phase in phases))
+
+
+BATCH_OUTCOMES = dict((error, outcome) for outcome, error in BATCH_ERRORS.items())
+
+
+def measureBatch(query, timeout, res):
+    stats = SolverStats()
+    results = solveConstrainsBatch(query['constraints'], query['types'], query['candidates'], shouldPrint=False,
+                                   timeout=timeout, stats=stats)
+    res['outcomes'] = ['sat' if 'assignements' in cur else BATCH_OUTCOMES.get(cur['error'], 'error') for cur in results]
+    res['outcome'] = '%d/%d sat' % (res['outcomes'].count('sat'), len(results))
+    # the shared base translation and the work of every candidate, i.e. the whole batch
+    res['translation'], res['solve'] = phaseTimes(stats.phases)
+    for cur in results:
+        translation, solve = phaseTimes(cur['stats']['phases'])
+        res['translation'] += translation
+        res['solve'] += solve
+
+
+def measure(conn, query, timeout):
+    res = dict()
+    try:
+        if 'candidates' in query:
+            measureBatch(query, timeout, res)
+        else:
+            stats = SolverStats()
+            constraints = query['constraints'] + (query.get('exploit_constraints') or [])
+            res['outcome'] = solveQuery(constraints, query.get('types') or [], timeout, stats=stats)[0]
+            res['translation'], res['solve'] = phaseTimes(stats.phases)
+            res['conjuncts'] = stats.conjuncts
+            res['formula_size'] = stats.formula_size
+    except Exception:
+        res['outcome'] = 'error'
+        res['error'] = traceback.format_exc()
+    res['rss'] = peakMemory()
+    conn.send(res)
+
+
+def runQuery(query, timeout):
+    # every run gets a fresh process, such that neither the caches of earlier queries nor their memory distort it
+    conn, child = CONTEXT.Pipe()
+    proc = CONTEXT.Process(target=measure, args=(child, query, timeout), daemon=True)
+    proc.start()
+    child.close()
+    res = None
+    if conn.poll(2 * timeout / 1000 + 10):
+        try:
+            res = conn.recv()
+        except EOFError:
+            pass
+    if proc.is_alive():
+        proc.kill()
+    proc.join()
+    if res is None:
+        res = {'outcome': 'killed', 'translation': 0.0, 'solve': 2 * timeout / 1000 + 10, 'rss': 0.0}
+    return res
+
+
+def benchmark(query, timeout, repeat):
+    runs = [runQuery(query, timeout) for _ in range(repeat)]
+    res = dict(runs[0])
+    for key in ['translation', 'solve', 'rss']:
+        if key in res:
+            res[key] = statistics.median(run[key] for run in runs)
+    outcomes = set(run['outcome'] for run in runs)
+    if len(outcomes) > 1:
+        res['outcome'] = '/'.join(sorted(outcomes))
+    return res
+
+
+def regressions(res, base, threshold):
+    """Returns what got worse compared to the baseline entry of the query."""
+    found = []
+    if 'outcomes' in base:
+        # every template of a batch on its own
+        outcomes = res.get('outcomes') or [res['outcome']] * len(base['outcomes'])
+        for i, (cur, expected) in enumerate(zip(outcomes, base['outcomes'])):
+            if expected in ['sat', 'unsat'] and cur != expected:
+                found.append('outcome of candidate %d %s instead of %s' % (i, cur, expected))
+    elif base['outcome'] in ['sat', 'unsat'] and res['outcome'] != base['outcome']:
+        found.append('outcome %s instead of %s' % (res['outcome'], base['outcome']))
+    for key in ['translation', 'solve']:
+        if key in res and key in base and res[key] > base[key] * threshold + LATENCY_SLACK:
+            found.append('%s %.3fs instead of %.3fs' % (key, res[key], base[key]))
+    if res['rss'] > base['rss'] * threshold + MEMORY_SLACK:
+        found.append('rss %.0fMB instead of %.0fMB' % (res['rss'], base['rss']))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description='benchmark the constraint solver against a stored baseline')
+    parser.add_argument('--corpus', action='append', help='JSONL file of queries, defaults to the benchmark corpus')
+    parser.add_argument('--no-synthetic', action='store_true', help='skip the generated queries')
+    parser.add_argument('--no-batch', action='store_true', help='skip solving the templates of each handler as batch')
+    parser.add_argument('--filter', default='', help='only run queries whose name contains this string')
+    parser.add_argument('--baseline', default=BASELINE, help='JSON file of the expected outcomes and latencies')
+    parser.add_argument('--update-baseline', action='store_true', help='store the measurements as new baseline')
+    parser.add_argument('--threshold', type=float, default=2.0,
+                        help='factor by which a query may be slower or larger than in the baseline')
+    parser.add_argument('--repeat', type=int, default=1, help='runs per query, the median is reported')
+    parser.add_argument('--timeout', type=int, default=10000, help='z3 timeout per query in ms')
+    args = parser.parse_args()
+
+    queries = []
+    for path in args.corpus or [CORPUS]:
+        queries.extend(loadCorpus(path))
+    if not args.no_batch:
+        queries.extend(batchSuite(queries))
+    if not args.no_synthetic:
+        queries.extend(syntheticSuite())
+    queries = [query for query in queries if args.filter in query['name']]
+
+    baseline = dict()
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as input:
+            baseline = json.load(input)['queries']
+
+    print('{:<72} {:>8} {:>8} {:>10} {:>10} {:>8}'.format('query', 'outcome', 'baseline', 'translate', 'solve', 'rss'))
+    results = dict()
+    failed = []
+    for query in queries:
+        res = results[query['name']] = benchmark(query, args.timeout, args.repeat)
+        base = baseline.get(query['name'])
+        print('{:<72} {:>8} {:>8} {:>9.3f}s {:>9.3f}s {:>6.0f}MB'.format(
+            query['name'][:72], res['outcome'], base['outcome'] if base else '-', res.get('translation', 0.0),
+            res.get('solve', 0.0), res['rss']), flush=True)
+        if base is not None and not args.update_baseline:
+            for regression in regressions(res, base, args.threshold):
+                failed.append((query['name'], regression))
+
+    if args.update_baseline:
+        for res in results.values():
+            res.pop('error', None)
+        baseline.update(results)
+        with open(args.baseline, 'w') as output:
+            json.dump({'z3': z3.get_version_string(), 'timeout': args.timeout, 'queries': baseline}, output, indent=1,
+                      sort_keys=True)
+        return
+
+    compared = [name for name in results if name in baseline]
+    agreeing = [name for name in compared if results[name]['outcome'] == baseline[name]['outcome']]
+    print('%d queries, %d of %d agree with the baseline outcome, %d regressions' % (
+        len(results), len(agreeing), len(compared), len(failed)))
+    for name, regression in failed:
+        print('REGRESSION %s: %s' % (name, regression), file=sys.stderr)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,756 @@
+# Copyright (C) 2020  Marius Steffens, CISPA
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import z3
+import logging
+import random
+import string
+from RegexToZ3 import regex_to_z3
+from SolverStats import SolverStats
+from collections import defaultdict as dd
+
+
+class NotSupportedException(Exception):
+    pass
+
+
+def randomString(length=20):
+    return ''.join([random.choice(string.ascii_letters + string.digits) for i in range(length)])
+
+
+BinaryFunctions = {
+    "==": lambda left, right: left == right,
+    "===": lambda left, right: left == right,
+
+    "!=": lambda left, right: left != right,
+    "!==": lambda left, right: left != right,
+
+    "<": lambda left, right: left < right,
+    ">": lambda left, right: left > right,
+
+    "<=": lambda left, right: left <= right,
+    ">=": lambda left, right: left >= right,
+
+    "+": lambda left, right: left + right,
+    "-": lambda left, right: left - right,
+
+    "*": lambda left, right: left * right,
+    "/": lambda left, right: left / right,
+
+    "%": lambda left, right: left % right,
+
+    ">>": lambda left, right: left >> right,
+    "<<": lambda left, right: left << right,
+    # ">>>": lambda left, right: left >>> right,
+
+    "&": lambda left, right: left & right,
+    "&&": lambda left, right: z3.And(left, right),
+
+    "|": lambda left, right: left | right,
+    "||": lambda left, right: z3.Or(left, right),
+
+    "^": lambda left, right: left ^ right,
+    "instanceof": lambda left, right: binary_instanceof(left, right),
+    # needs to emit constraints, see ConstraintTranslator.binary
+    "in": None,
+}
+
+
+def binary_instanceof(left, right):
+    if z3.is_string_value(right) and right.as_string() == '':
+        right = None
+
+    if left.decl().kind() == z3.Z3_OP_UNINTERPRETED:
+        typ_val = z3.String('type:' + str(left.decl()))
+        if right is None:
+            return typ_val == z3.StringVal('undefined')
+        else:
+            raise Exception(
+                'we have not yet seen', right, 'as type')
+    else:
+        raise Exception(
+            'We probably need to introduce intermediary variables here and assert that their type is something specific')
+
+
+PYTHON_TO_JS_TYPES = {
+    str: 'string',
+    int: 'number',
+    dict: 'object',
+}
+
+UnaryFunctions = {
+    "!": lambda val: z3.mk_not(createZ3ForBool(val)),
+    "~": lambda val: -(val + 1),
+    "-": lambda val: -val,
+    "+": lambda val: +val,
+    # "typeof": lambda val: z3.StringVal(PYTHON_TO_JS_TYPES[type(val)]),
+    # "typeof": lambda val: z3.String('type:' + str(val.decl())),
+    "typeof": lambda val: unary_typeof(val),
+}
+
+
+def unary_typeof(val):
+    return z3.String('type:' + str(val.decl()))
+
+
+StringFunctions = {
+    # no op since we assume things to be strings and adjust this later when putting together the event
+    'toString': lambda t, x, args: x,
+    'indexOf': lambda t, x, args: t.string_indexOf(x, args),
+    'search': lambda t, x, args: t.string_search(x, args),
+    'substr': lambda t, x, args: t.string_substring(x, args),
+    'substring': lambda t, x, args: t.string_substring(x, args),
+    'slice': lambda t, x, args: t.string_slice(x, args),
+    'split': lambda t, x, args: t.string_split(x, args),
+
+    'match': lambda t, x, args: t.string_match(x, args),
+    'startsWith': lambda t, x, args: z3.PrefixOf(t.translate(args[0]), x),
+    'endsWith': lambda t, x, args: z3.SuffixOf(t.translate(args[0]), x),
+    'replace': lambda t, x, args: t.string_replace(x, args),
+    # these functions should in our case of exploiting things make no difference in constraint solving
+    'toLowerCase': lambda t, x, args: x,
+    'trim': lambda t, x, args: x,
+    'includes': lambda t, x, args: t.includes(x, args),
+    'concat': lambda t, x, args: t.string_concat(x, args),
+
+    # FIXME technically not a string function
+    # map is a noop operation for us, as the constraints that are mapped on the single values will have
+    # the correct operations on them after the map call anyway
+    'map': lambda t, x, args: x,
+    # assumption: on checked properties we find other traces
+    'hasOwnProperty': lambda t, x, args: z3.BoolVal(True),
+
+}
+
+ArrayFunctions = {
+    'pop': lambda t, x, args: t.array_handler[x][-1]
+}
+
+
+def lenOfZ3(obj):
+    if type(obj) == str or type(obj) == list:
+        return len(obj)
+
+    if z3.is_string(obj):
+        return z3.Length(obj)
+
+    raise Exception('Need to calculate length of unknown object')
+
+
+def createZ3ForBool(var):
+    if z3.is_int(var):
+        return var != z3.IntVal(0)
+    elif z3.is_string(var):
+        return var != z3.StringVal('')
+    elif z3.is_array(var):
+        return z3.BoolVal(True)
+    elif z3.is_bool(var):
+        return var
+    elif var is None:
+        # this should be the case when we have a JSON value that is just inside a conditional etc
+        return None
+    elif z3.is_seq(var):
+        # not string but still something ref-like we only found cases where this was string comparisons using <, >, etc.
+        return var
+    else:
+        raise Exception('unhandled type in uninterpreted if')
+
+
+def checkForTypeEqualToString(var, other_var, op):
+    res = None
+    if var.decl().kind() == z3.Z3_OP_UNINTERPRETED and str(var.decl()).startswith('type:') and \
+            op['val'] == 'string' and op['op'] in ['==', '===']:
+        res = z3.Or(var == other_var, var == z3.StringVal('JSON'))
+    elif other_var.decl().kind() == z3.Z3_OP_UNINTERPRETED and str(other_var.decl()).startswith('type:') and \
+            op['val'] == 'string' and op['op'] in ['==', '===']:
+        res = z3.Or(var == other_var, other_var == z3.StringVal('JSON'))
+    elif var.decl().kind() == z3.Z3_OP_UNINTERPRETED and str(var.decl()).startswith('type:') and \
+            op['val'] == 'string' and op['op'] in ['!=', '!==']:
+        res = z3.And(var == other_var, var == z3.StringVal('JSON'))
+    elif other_var.decl().kind() == z3.Z3_OP_UNINTERPRETED and str(other_var.decl()).startswith('type:') and \
+            op['val'] == 'string' and op['op'] in ['!=', '!==']:
+        res = z3.And(var == other_var, other_var == z3.StringVal('JSON'))
+    return res
+
+
+class ConstraintTranslator:
+    """Translates the JSON constraints of one query into z3 and owns everything that is collected on the way.
+
+    Structurally equal JSON subtrees are interned to a single object, such that their translation (and the one of
+    parent chains) is only done once as long as the inferred types do not change in between.
+    """
+
+    def __init__(self, types, stats=None):
+        self.types = types
+        # counts what is translated and enforces the budget of the query, if any
+        self.stats = stats if stats is not None else SolverStats()
+        # constraints that are emitted as side effects of the translation
+        self.global_constraints = []
+        self.global_constraint_ids = set()
+        self.identifiers = set()
+        self.make_unsolvable = set()
+        self.array_lengths = dict()
+        self.identifier_substitutions = dict()
+        self.array_handler = dd(list)
+        self.infered_types = dd(lambda: '')
+        # bumped whenever a type changes, as translations depend on the types known at that point
+        self.types_version = 0
+        self.interned = dict()
+        self.memo = dict()
+        self.loadTypes(types)
+
+    def fork(self):
+        """Returns a translator that continues from the current state without affecting this one."""
+        other = ConstraintTranslator.__new__(ConstraintTranslator)
+        other.types = self.types
+        other.stats = self.stats
+        other.global_constraints = list(self.global_constraints)
+        other.global_constraint_ids = set(self.global_constraint_ids)
+        other.identifiers = set(self.identifiers)
+        other.make_unsolvable = set(self.make_unsolvable)
+        other.array_lengths = dict(self.array_lengths)
+        other.identifier_substitutions = dict(self.identifier_substitutions)
+        other.array_handler = dd(list, ((arr, list(vals)) for arr, vals in self.array_handler.items()))
+        other.infered_types = dd(lambda: '', self.infered_types)
+        other.types_version = self.types_version
+        other.interned = self.interned
+        other.memo = dict(self.memo)
+        return other
+
+    def loadTypes(self, types):
+        if type(types) == dict:
+            self.addTypesFromTaintAnalysis('event', types['event'])
+        else:
+            for [iden, typo] in types:
+                if type(iden) == str:
+                    self.setType(iden, typo)
+        logging.debug(self.infered_types)
+
+    def addTypesFromTaintAnalysis(self, accessorpath, types):
+        for entry in types:
+            if type(types[entry]) != dict:
+                self.setType(accessorpath + '.' + entry, types[entry])
+            else:
+                self.addTypesFromTaintAnalysis(accessorpath + '.' + entry, types[entry])
+
+    def setType(self, identifier, typ):
+        if self.infered_types[identifier] != typ:
+            self.infered_types[identifier] = typ
+            self.types_version += 1
+
+    def emit(self, constraint):
+        if constraint.get_id() not in self.global_constraint_ids:
+            self.global_constraint_ids.add(constraint.get_id())
+            self.global_constraints.append(constraint)
+
+    def intern(self, obj):
+        if type(obj) == dict:
+            obj = dict((k, self.intern(v)) for k, v in obj.items())
+            key = ('dict', tuple(sorted((k, id(v)) for k, v in obj.items())))
+        elif type(obj) == list:
+            obj = [self.intern(v) for v in obj]
+            key = ('list', tuple(id(v) for v in obj))
+        else:
+            key = (type(obj).__name__, obj)
+        if key not in self.interned:
+            self.interned[key] = obj
+        return self.interned[key]
+
+    def translateConstraints(self, constraints):
+        res = []
+        for constraint in self.intern(constraints):
+            self.stats.checkBudget()
+            cc = self.translateIf(constraint)
+            logging.debug(cc)
+            if z3.is_int(cc):
+                cc = cc != 0
+            elif z3.is_string(cc):
+                cc = cc != z3.StringVal('')
+            res.append(cc)
+        return res
+
+    def getStateConstraints(self, global_offset=0):
+        # constraints which were emitted as side effects of the translation, plus the inferred types
+        res = []
+        for cc in self.global_constraints[global_offset:]:
+            logging.debug(cc)
+            res.append(cc)
+
+        for type_info in self.infered_types:
+            if self.infered_types[type_info] == '':
+                continue
+            cc = z3.String('type:' + type_info) == z3.StringVal(self.infered_types[type_info])
+            logging.debug(cc)
+            res.append(cc)
+
+        for identifier in self.make_unsolvable:
+            cc = z3.String(identifier) == z3.StringVal('')
+            logging.debug(cc)
+            res.append(cc)
+        return res
+
+    def binary(self, op, left, right):
+        if op == 'in':
+            return self.binary_in(left, right)
+        return BinaryFunctions[op](left, right)
+
+    def binary_in(self, left, right):
+        if right.decl().kind() == z3.Z3_OP_UNINTERPRETED and z3.is_string_value(left):
+            identifer = str(right.decl())
+            accessed = left.as_string()
+            st = z3.String(identifer + '.' + accessed)
+            self.emit(createZ3ForBool(st))
+        else:
+            # When this is not the case we cannot enforce any constraints so it is up to the application ot have these properties
+            pass
+
+        return z3.BoolVal(True)
+
+    def includes(self, x, args):
+        if z3.is_string(x):
+            return self.string_indexOf(x, args) > -1
+        elif z3.is_array(x):
+            if str(x.decl()) not in self.array_lengths:
+                raise Exception('We do not know how large the underlying array should be thus we cannot include on it')
+            cc = None
+            searched = self.translate(args[0])
+            for i in range(self.array_lengths[str(x.decl())]):
+                c = z3.Select(x, i) == searched
+                if cc is None:
+                    cc = c
+                else:
+                    cc = z3.Or(cc, c)
+            return cc
+        else:
+            raise Exception('What else should we expect to be called includes on instead of strings and arrays')
+
+    def string_concat(self, x, args):
+        cc = x
+        if z3.is_string(x):
+            for y in args:
+                cc = z3.Concat(cc, self.translate(y))
+            return cc
+        else:
+            raise NotSupportedException('We only support concat on stirngs as arrays are difficult in z3.')
+
+    def string_indexOf(self, x, args):
+        if z3.is_array(x):
+            if str(x.decl()) not in self.array_lengths:
+                raise Exception('We do not know how large the underlying array should be thus we cannot include on it')
+            helper_int = z3.Int('__ignore_arr_indexOf_helper_' + randomString())
+            search_string = self.translate(args[0])
+            all = []
+            presentImplications = []
+            for i in range(self.array_lengths[str(x.decl())]):
+                conditional = z3.Select(x, i) == search_string
+                all.append(conditional)
+                true_imply = z3.Implies(conditional, helper_int <= i)
+                false_imply = z3.Implies(z3.Not(conditional), helper_int > i)
+                presentImplications.append(true_imply)
+                presentImplications.append(false_imply)
+            all = z3.Or(all)
+            self.emit(z3.And(z3.Implies(all, z3.And(presentImplications)), z3.Implies(all, helper_int >= 0),
+                             z3.Implies(z3.mk_not(all), helper_int == -1)))
+            return helper_int
+
+        else:
+            if len(args) > 1:
+                return z3.IndexOf(x, self.translate(args[0]), self.translate(args[1]))
+            else:
+                return z3.IndexOf(x, self.translate(args[0]), 0)
+
+    def string_match(self, x, args):
+        if type(args[0]) == dict:
+            # we know that they used some parts of the tainted data as regex
+            val = self.translate(args[0])
+            # we know that its a direct flow and thus we can handle this with ease
+            return z3.IndexOf(x, val, 0) > -1
+
+        else:
+            with self.stats.phase('regex'):
+                regex = regex_to_z3(args[0])
+            return z3.InRe(x, regex)
+
+    def string_substring(self, x, args):
+        startIndex = self.translate(args[0])
+        endIndex = lenOfZ3(x)
+        if len(args) == 2:
+            endIndex = self.translate(args[1])
+
+        return z3.SubString(x, startIndex, endIndex)
+
+    def string_replace(self, x, args):
+        search_val = self.translate(args[0])
+        replace_val = self.translate(args[1])
+        if replace_val is None:
+            replace_val = ''
+        return z3.Replace(x, search_val, replace_val)
+
+    def string_split(self, x, args):
+        st = x
+        split_val = z3.StringVal(args[0].encode())
+        x = self.transformNonBooleanLazyEvaluations(x)
+        arr = z3.Array('__ignore_{}.split({})'.format(str(x), str(args[0])), z3.IntSort(), z3.StringSort())
+        for i in range(3):
+            index = z3.IndexOf(st, split_val, 0)
+            s = z3.SubString(st, 0, index)
+            st = z3.SubString(st, index + z3.Length(split_val), z3.Length(st))
+            self.emit(z3.Select(arr, i) == s)
+            self.emit(s != z3.StringVal(''))
+            self.array_handler[arr].append(s)
+        self.emit(z3.Select(arr, 3) == st)
+        self.emit(st != z3.StringVal(''))
+        self.array_handler[arr].append(st)
+        # We just guess the length here and hope that this works for the program
+        self.array_lengths[str(arr.decl())] = 4
+
+        self.emit(z3.IndexOf(self.array_handler[arr][-1], split_val, 0) == -1)
+        # self.emit(z3.PrefixOf(self.array_handler[arr][0], x))
+
+        return arr
+
+    def string_search(self, x, args):
+        new_val = z3.String('__ignore_search_helper_' + randomString())
+        regex = args[0]
+        startsWith = False
+        endsWith = False
+
+        if regex[0] == '^':
+            startsWith = True
+            regex = regex[1:]
+        if regex[-1] == '$':
+            endsWith = True
+            regex = regex[:-1]
+        with self.stats.phase('regex'):
+            self.emit(z3.InRe(new_val, regex_to_z3(args[0])))
+
+        if startsWith and endsWith:
+            # we need to return the index which should be 0 iff it matches
+            self.emit(x == new_val)
+            return z3.IntVal(0)
+        elif startsWith:
+            self.emit(z3.PrefixOf(new_val, x))
+        elif endsWith:
+            self.emit(z3.SuffixOf(new_val, x))
+        return z3.IndexOf(x, new_val, 0)
+
+    def string_slice(self, x, args):
+        if len(args) == 2:
+            start = args[0]
+            end = args[1]
+        else:
+            start = args[0]
+            end = lenOfZ3(x)
+
+        if type(start) != int:
+            start = self.translate(start)
+        if type(end) != int and not z3.is_int(end):
+            end = self.translate(end)
+
+        if type(start) == int and start < 0:
+            self.emit(z3.Length(x) > -start)
+            start = end + start
+
+        if (z3.is_int(start) or type(start) == int) and (z3.is_int(start) or type(start) == int):
+            return z3.SubString(x, start, end)
+        else:
+            raise NotSupportedException('')
+
+    def constantArray(self, values):
+        arr = z3.Array('ignore_helper_constant_array_' + randomString(), z3.IntSort(), z3.StringSort())
+        for i, arg in enumerate(values):
+            self.emit(z3.Select(arr, i) == self.translate(arg))
+        self.array_lengths[str(arr.decl())] = len(values)
+        return arr
+
+    def getTypedZ3ValFromIdentifier(self, identifier):
+        if type(identifier) == dict:
+            # FIXME how can we handle this here
+            raise NotSupportedException('Complex objects as base for operations cannot be modelled in z3')
+        if type(identifier) == list:
+            return self.constantArray(identifier)
+
+        self.identifiers.add(identifier)
+        cur_types = self.infered_types[identifier]
+        # if cur_types == 'object':
+        #    infered_types[identifier] = ''
+        #    cur_types = ''
+        if identifier.endswith('.length'):
+            return z3.Length(z3.String(identifier[:-7]))
+
+        if cur_types == 'string':
+            return z3.String(identifier)
+        elif cur_types == 'number':
+            return z3.Int(identifier)
+        elif cur_types == 'boolean':
+            return z3.Bool(identifier)
+        elif cur_types == 'array':
+            return z3.Array(identifier, z3.IntSort(), z3.StringSort())
+
+        if 'event.data' in identifier or 'event.origin' in identifier or 'event' == identifier:
+            return z3.String(identifier)
+        else:
+            self.make_unsolvable.add(identifier)
+            return z3.String(identifier)
+
+    def resolveOpsOnParent(self, op_obj):
+        # this is parent or nothing
+        if len(op_obj['old_ops']) < 1:
+            return None
+        key = ('parent', id(op_obj), self.types_version)
+        if key not in self.memo:
+            self.memo[key] = self._resolveOpsOnParent(op_obj)
+        return self.memo[key]
+
+    def _resolveOpsOnParent(self, op_obj):
+        val = self.translate(self.intern({'identifier': op_obj['old_identifier'], 'ops': op_obj['old_ops']}))
+
+        if val is None or (val.decl().kind() == z3.Z3_OP_UNINTERPRETED and not z3.is_array(val)):
+            # this is the case when the parent elems have no ops on them
+            return None
+        if z3.is_bool(val) and len(val.children()) and val.children()[0].decl().kind() == z3.Z3_OP_UNINTERPRETED:
+            return None
+        val = self.transformNonBooleanLazyEvaluations(val)
+        return val
+
+    def translateIf(self, constraint):
+        var = self.translate(constraint)
+        return createZ3ForBool(var)
+
+    def transformNonBooleanLazyEvaluations(self, var):
+        if z3.is_or(var):
+            # in this case it needs to be the first child since we are using it as a first child when coercing any expression to bool
+            left = var.children()[0].children()[0]
+            if len(var.children()[1].children()) == 0:
+                if str(var.children()[1]) == 'False':
+                    return left
+                else:
+
+                    raise Exception('Why would the lazy side of the or be a truthy value?')
+            else:
+                right = var.children()[1].children()[0]
+            sub = z3.String('__ignore({}||{})'.format(str(left), str(right)))
+
+            self.emit(z3.Or(left == sub, right == sub))
+            return sub
+
+        if z3.is_and(var):
+            # FIXME what about the first child
+            # in this case it needs to be the first child since we are using it as a first child when coercing any expression to bool
+            right = var.children()[1].children()[0]
+            # this is by construction the not null of the first
+            self.emit(var.children()[0])
+
+            return right
+
+        return var
+
+    def coerceTypesIfPossible(self, var, other_var):
+        if z3.is_or(other_var) and not z3.is_bool(var):
+            other_var = self.transformNonBooleanLazyEvaluations(other_var)
+        if z3.is_or(var) and not z3.is_bool(other_var):
+            var = self.transformNonBooleanLazyEvaluations(var)
+
+        if z3.is_and(other_var) and not z3.is_bool(var):
+            other_var = self.transformNonBooleanLazyEvaluations(other_var)
+        if z3.is_and(var) and not z3.is_bool(other_var):
+            var = self.transformNonBooleanLazyEvaluations(var)
+        if var.decl().kind() == z3.Z3_OP_UNINTERPRETED:
+            if z3.is_bool(other_var) and not z3.is_bool(var):
+                self.setType(str(var), 'boolean')
+                return z3.Bool(str(var)), other_var
+            if z3.is_string(other_var) and not z3.is_string(var):
+                if other_var.as_string() == '':
+                    # we probably dont want to coerce in this specific case as this is merely a non empty check
+                    if z3.is_bool(var):
+                        return var, z3.BoolVal(False)
+                    if z3.is_int(var):
+                        return var, z3.IntVal(0)
+                else:
+                    self.setType(str(var), 'string')
+                    return z3.String(str(var)), other_var
+            if z3.is_int(other_var) and not z3.is_int(var):
+                self.setType(str(var), 'number')
+                return z3.Int(str(var)), other_var
+        elif var.decl().kind() == z3.Z3_OP_UNINTERPRETED:
+            if z3.is_bool(var):
+                self.setType(str(var), 'boolean')
+            if z3.is_string(var):
+                self.setType(str(var), 'string')
+            if z3.is_int(var):
+                self.setType(str(var), 'number')
+        else:
+            # this means that it is non-interpreted and we need to coerce other var to the type of var
+            if z3.is_string(var) and z3.is_int_value(other_var):
+                other_var = z3.StringVal(str(other_var))
+            if z3.is_arith(var) and z3.is_string(other_var):
+                other_var = z3.IntVal(int(other_var.as_string()))
+
+        return var, other_var
+
+    def getZ3ValFromJSVal(self, val):
+        if type(val) == str:
+            return z3.StringVal(val)
+        if type(val) == bool:
+            return z3.BoolVal(val)
+        if type(val) == int:
+            return z3.IntVal(val)
+        if type(val) == list:
+            return self.constantArray(val)
+        if type(val) == dict:
+            raise NotSupportedException('Complex Objects as base for operations with proxy strings are not yet supported!')
+
+        raise Exception('Could not transform Js val to Z3 Val' + repr(val))
+
+    def translate(self, constraint):
+        if type(constraint) != dict:
+            if type(constraint) == str:
+                return z3.StringVal(constraint)
+            if type(constraint) == int:
+                return z3.IntVal(constraint)
+            if type(constraint) == bool:
+                return z3.BoolVal(constraint)
+            if constraint is None:
+                return None
+            raise Exception('Dealing with non-int non-string basic values, aborting!', constraint)
+        key = ('constraint', id(constraint), self.types_version)
+        if key not in self.memo:
+            self.memo[key] = self._translate(constraint)
+        return self.memo[key]
+
+    def _translate(self, constraint):
+        if 'type' in constraint:
+            self.stats.countOp(constraint)
+        if 'type' not in constraint:
+            if 'isRealValue' in constraint:
+                if 'value' in constraint:
+                    var = self.getZ3ValFromJSVal(constraint['value'])
+                elif 'val' in constraint:
+                    var = self.getZ3ValFromJSVal(constraint['val'])
+                else:
+                    raise Exception('Should not encounter realValue without reference to the real value...')
+            else:
+                if 'identifier' in constraint:
+                    var = self.getTypedZ3ValFromIdentifier(constraint['identifier'])
+                else:
+                    # probably the empty object when we have something || {}
+                    return None
+
+            for op in constraint['ops']:
+                self.stats.countOp(op)
+                self.stats.checkBudget()
+                if 'val' not in op:
+                    op['val'] = ''
+                if op['type'] == 'ops_on_parent_element':
+                    val = self.resolveOpsOnParent(op)
+                    if z3.is_array(val):
+                        accesed = constraint['identifier'].split('.')[-1]
+                        if accesed == 'length':
+                            raise NotSupportedException(
+                                'z3 cannot use the length of arrays due to their representation as functions')
+                        if int(accesed) < 0 and str(val.decl()) in self.array_lengths:
+                            var = z3.Select(val, self.array_lengths[str(val.decl())] + int(accesed))
+                        else:
+                            var = z3.Select(val, int(accesed))
+                    elif val is not None:
+                        key = str(val)
+                        if key not in self.identifier_substitutions:
+                            self.identifier_substitutions[key] = '__substitute_values_' + randomString()
+                        identifier = self.identifier_substitutions[key]
+                        self.emit(val == z3.StringVal(identifier))
+                        accesed = constraint['identifier'].split('.')[-1]
+                        if accesed == 'length':
+                            var = z3.Length(z3.String(identifier))
+                        else:
+                            var = z3.String(identifier + '.' + accesed)
+
+                    #     self.emit(var == val)
+                elif op['type'] == 'member_function':
+                    var = self.transformNonBooleanLazyEvaluations(var)
+                    if op['function_name'] in StringFunctions:
+                        var = StringFunctions[op['function_name']](self, var, op['args'])
+                    elif op['function_name'] in ArrayFunctions:
+                        var = ArrayFunctions[op['function_name']](self, var, op['args'])
+                    else:
+                        if op['function_name'] in ['call', 'apply', 'bind']:
+                            raise NotSupportedException('We do not support function calls over function pointer')
+                        raise Exception('String function not supported! ' + op['function_name'])
+                elif op['type'] == 'Binary':
+                    other_var = self.translate(op['val'])
+                    if other_var is None:
+                        # this is the case when we compare something to null
+                        if op['op'] == '===' or op['op'] == '==':
+                            var = createZ3ForBool(var)
+                            var = z3.Not(var)
+                        continue
+                    var, other_var = self.coerceTypesIfPossible(var, other_var)
+                    changed = checkForTypeEqualToString(var, other_var, op)
+                    if changed is not None:
+                        var = changed
+                    elif op['side'] == 'left':
+                        var = self.binary(op['op'], var, other_var)
+                    elif op['side'] == 'right':
+                        var = self.binary(op['op'], other_var, var)
+                    else:
+                        var = self.binary(op['op'], var, other_var)
+                elif op['type'] == 'Unary':
+                    var = UnaryFunctions[op['op']](var)
+                elif op['type'] == 'iterator':
+                    if z3.is_array(var):
+                        var = z3.Select(var, op['accessed_elem'])
+                    else:
+                        raise Exception('This should always be an array', var, self.infered_types)
+                elif op['type'] == 'external_function':
+                    if op['function_name'] == 'JSON.parse':
+                        self.setType(constraint['identifier'], 'JSON')
+                        var = z3.String(constraint['identifier'])
+                    else:
+                        logging.debug('Arbitrary external functions not yet support ' + op['function_name'])
+                elif op['type'] == 'Logical':
+                    if op['side'] == 'left' or op['side'] == 'both':
+                        l_c = createZ3ForBool(var)
+                        r_c = createZ3ForBool(self.translate(op['val']))
+                    else:
+                        l_c = createZ3ForBool(self.translate(op['val']))
+                        r_c = createZ3ForBool(var)
+                    if l_c is None or r_c is None:
+                        if l_c is None:
+                            var = r_c
+                        if r_c is None:
+                            var = l_c
+                        continue
+                    if op['op'] == '&&':
+                        var = z3.And(l_c, r_c)
+                    else:
+                        var = z3.Or(l_c, r_c)
+                else:
+                    logging.debug('Not supported type ' + op['type'])
+            return var
+        elif constraint['type'] == 'Logical':
+            l_c = createZ3ForBool(self.translate(constraint['l_val']))
+            r_c = createZ3ForBool(self.translate(constraint['r_val']))
+            if l_c is None or r_c is None:
+                return l_c or r_c
+            if constraint['op'] == '&&':
+                return z3.And(l_c, r_c)
+            else:
+                return z3.Or(l_c, r_c)
+        elif constraint['type'] == 'Binary':
+            return self.binary(constraint['op'], self.translate(constraint['l_val']),
+                               self.translate(constraint['r_val']))
+        elif constraint['type'] == 'Unary':
+            return UnaryFunctions[constraint['op']](self.translate(constraint['val']))
+        else:
+            raise Exception('Unexpected constraint type')
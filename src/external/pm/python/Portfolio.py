@@ -0,0 +1,171 @@
+# Copyright (C) 2020  Marius Steffens, CISPA
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import multiprocessing
+import os
+import queue
+import time
+
+import z3
+
+# string queries are notoriously sensitive to the choice of the string solver and to randomization, thus we race a
+# couple of configurations against each other and take whichever gives a definitive answer first. With fewer cores
+# than configurations the first ones are raced first, thus the default solver leads.
+PORTFOLIO = [
+    {'name': 'default'},
+    {'name': 'seq', 'params': {'smt.string_solver': 'seq'}},
+    {'name': 'z3str3', 'params': {'smt.string_solver': 'z3str3'}},
+    {'name': 'simplify-smt', 'tactics': ['simplify', 'propagate-values', 'solve-eqs', 'smt']},
+    {'name': 'qf-s', 'logic': 'QF_S'},
+    {'name': 'seq-seed-1', 'params': {'smt.string_solver': 'seq', 'smt.random_seed': 1, 'sat.random_seed': 1}},
+    {'name': 'seq-seed-2', 'params': {'smt.string_solver': 'seq', 'smt.random_seed': 2, 'sat.random_seed': 2}},
+    # not known to every z3 version, e.g. 4.8.7 only has QF_S, see availableConfigs
+    {'name': 'qf-slia', 'logic': 'QF_SLIA'},
+]
+
+# the workers are forked so that they inherit the loaded z3 library and the model conversion function
+CONTEXT = multiprocessing.get_context('fork')
+
+AVAILABLE = None
+
+
+def createSolver(config, ctx, timeout=None):
+    for name, value in config.get('params', dict()).items():
+        z3.set_param(name, value)
+    if 'tactics' in config:
+        # solvers made from tactics do not take a timeout parameter, the tactic itself is bounded instead
+        tactic = z3.Then(*config['tactics'], ctx=ctx)
+        if timeout is not None:
+            tactic = z3.TryFor(tactic, timeout, ctx=ctx)
+        return tactic.solver()
+    if 'logic' in config:
+        solver = z3.SolverFor(config['logic'], ctx=ctx)
+    else:
+        solver = z3.Solver(ctx=ctx)
+    if timeout is not None:
+        solver.set('timeout', timeout)
+    return solver
+
+
+def availableConfigs():
+    """Returns the configurations of the portfolio that the installed z3 supports, the others are logged once."""
+    # anything logged by default ends up on stderr, which clients take for a failed query, thus only with debug logging
+    global AVAILABLE
+    if AVAILABLE is None:
+        AVAILABLE = []
+        for config in PORTFOLIO:
+            if 'params' in config:
+                # global parameters are only ever set within the workers, unknown ones show up as their errors
+                AVAILABLE.append(config)
+                continue
+            try:
+                createSolver(config, z3.Context(), 1000)
+            except z3.Z3Exception as e:
+                logging.debug('portfolio configuration %s is not supported by z3 %s: %s', config['name'],
+                              z3.get_version_string(), e)
+                continue
+            AVAILABLE.append(config)
+    return AVAILABLE
+
+
+def runConfig(results, config, smt2, timeout, addModelAssignements):
+    try:
+        # a fresh context, nothing of the parent's z3 state is touched after the fork
+        ctx = z3.Context()
+        solver = createSolver(config, ctx, timeout)
+        solver.from_string(smt2)
+        r = solver.check()
+        assignement = dict()
+        types = dict()
+        if r == z3.unsat:
+            outcome = 'unsat'
+        elif r == z3.unknown:
+            outcome = 'unknown'
+        else:
+            outcome = 'sat'
+            addModelAssignements(solver.model(), assignement, types)
+        results.put((config['name'], outcome, assignement, types))
+    except Exception as e:
+        results.put((config['name'], 'error', repr(e), None))
+
+
+def stopWorkers(workers):
+    for worker in workers:
+        if worker.is_alive():
+            worker.terminate()
+    for worker in workers:
+        worker.join()
+
+
+def solvePortfolio(conjuncts, addModelAssignements, timeout=None, portfolio=None, parallel=None):
+    """Races the configurations of the portfolio on the conjuncts, returns (outcome, assignement, types, winner).
+
+    At most `parallel` configurations, by default one per core, run at once. Once one of them gives up, the next one
+    is started with the time that is left of the timeout.
+    """
+    portfolio = list(availableConfigs() if portfolio is None else portfolio)
+    parallel = parallel if parallel is not None else os.cpu_count() or 1
+    solver = z3.Solver()
+    solver.add(conjuncts)
+    smt2 = solver.to_smt2()
+
+    results = CONTEXT.Queue()
+    start = time.time()
+    workers = []
+    running = dict()
+    errors = []
+
+    def remaining():
+        return None if timeout is None else int(timeout - (time.time() - start) * 1000)
+
+    def startWorkers():
+        while portfolio and len(running) < parallel and (timeout is None or remaining() > 0):
+            config = portfolio.pop(0)
+            worker = CONTEXT.Process(target=runConfig, args=(results, config, smt2, remaining(), addModelAssignements))
+            worker.daemon = True
+            worker.start()
+            workers.append(worker)
+            running[config['name']] = worker
+
+    # every worker enforces the timeout itself, the deadline only guards against workers that hang after it
+    deadline = None if timeout is None else start + timeout / 1000 + 5
+    try:
+        startWorkers()
+        while running and (deadline is None or time.time() < deadline):
+            try:
+                name, outcome, assignement, types = results.get(timeout=0.1)
+            except queue.Empty:
+                # a worker that crashed within z3 never answers
+                for name, worker in list(running.items()):
+                    if not worker.is_alive() and results.empty():
+                        errors.append((name, 'exited with %s' % worker.exitcode))
+                        del running[name]
+                startWorkers()
+                continue
+            running.pop(name, None)
+            if outcome == 'error':
+                errors.append((name, assignement))
+            elif outcome != 'unknown':
+                for failed, error in errors:
+                    logging.debug('portfolio configuration %s failed: %s', failed, error)
+                return outcome, assignement, types, name
+            startWorkers()
+        # without a definitive answer the errors might be the reason for it
+        for failed, error in errors:
+            logging.debug('portfolio configuration %s failed: %s', failed, error)
+        return 'unknown', dict(), dict(), None
+    finally:
+        stopWorkers(workers)
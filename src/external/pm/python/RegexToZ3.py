@@ -14,9 +14,17 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import z3
-from regex_parser import RegexParser, EMPTY, CHAR, DOT, STAR, BAR, CONCAT, GROUP, BACKREF, CARET, DOLLAR, CHARSET
+from regex_parser import RegexParser, EMPTY, CHAR, DOT, STAR, BAR, CONCAT, GROUP, BACKREF, CARET, DOLLAR, CHARSET, \
+    SET, PLUS, OPTION, REPEAT
 import string
+from collections import OrderedDict
 parser = RegexParser()
+compact_parser = RegexParser(compact=True)
+
+# the regexes of origin checks are the same for every query of a handler, thus we only compile them once per process,
+# the least recently used ones are dropped such that a long running server does not keep every regex of a crawl
+REGEX_CACHE = OrderedDict()
+REGEX_CACHE_SIZE = 1024
 
 class NotSupportedException(Exception):
     pass
@@ -37,10 +45,56 @@ def getZ3(tuple):
         return getZ3(tuple[2])
     elif tuple[0] == EMPTY:
         return z3.Empty(z3.ReSort(z3.StringSort()))
+    elif tuple[0] == SET:
+        return getZ3Set(tuple[1], tuple[2])
+    elif tuple[0] == PLUS:
+        return z3.Plus(getZ3(tuple[1]))
+    elif tuple[0] == OPTION:
+        return z3.Option(getZ3(tuple[1]))
+    elif tuple[0] == REPEAT:
+        return getZ3Repeat(getZ3(tuple[1]), tuple[2], tuple[3])
     raise NotSupportedException('not yet supported', tuple[0])
 
 
-def regex_to_z3(regex):
+def getZ3Set(chars, negated):
+    # consecutive characters are merged into a single range
+    ranges = []
+    for c in sorted(map(ord, chars)):
+        if ranges and ranges[-1][1] == c - 1:
+            ranges[-1][1] = c
+        else:
+            ranges.append([c, c])
+    res = [z3.Re(chr(lo)) if lo == hi else z3.Range(chr(lo), chr(hi)) for lo, hi in ranges]
+    res = res[0] if len(res) == 1 else z3.Union(res)
+    if negated:
+        # any single character that is not part of the set, restricted to the same characters as DOT
+        res = z3.Intersect(z3.Complement(res), z3.Range(chr(32), chr(127)))
+    return res
+
+
+def getZ3Repeat(inner, lo, hi):
+    if hi is None:
+        if lo == 0:
+            return z3.Star(inner)
+        return z3.Concat(z3.Loop(inner, lo, lo), z3.Star(inner))
+    if hi == 0:
+        # z3 treats an upper bound of 0 as unbounded
+        return z3.Re('')
+    return z3.Loop(inner, lo, hi)
+
+
+def regex_to_z3(regex, compact=True):
+    key = (regex, compact)
+    if key in REGEX_CACHE:
+        REGEX_CACHE.move_to_end(key)
+        return REGEX_CACHE[key]
+    REGEX_CACHE[key] = compile_regex(regex, compact)
+    if len(REGEX_CACHE) > REGEX_CACHE_SIZE:
+        REGEX_CACHE.popitem(last=False)
+    return REGEX_CACHE[key]
+
+
+def compile_regex(regex, compact=True):
     free_start = True
     free_end = True
     if regex[0] == '^':
@@ -54,7 +108,10 @@ def regex_to_z3(regex):
     regex = regex.replace('\\d', '[0-9]')
     regex = regex.replace('\\W', '[^A-Za-z0-9_]')
 
-    parsed = parser.parse(regex)
+    if compact:
+        parsed = compact_parser.parse(regex)
+    else:
+        parsed = parser.parse(regex)
     z3_regex = getZ3(parsed['root'])
 
     if free_start:
@@ -0,0 +1,188 @@
+# Copyright (C) 2020  Marius Steffens, CISPA
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import hashlib
+import json
+import re
+import sqlite3
+import time
+
+import z3
+
+# names that the solver itself generates with a random suffix, see randomString in ConstraintSolver.py
+HELPER_PREFIXES = ['__ignore_search_helper_', '__substitute_values_', 'ignore_helper_constant_array_',
+                   '__ignore_arr_indexOf_helper_']
+HELPER_SUFFIX_LENGTH = 20
+HELPER_NAME = re.compile('(' + '|'.join(map(re.escape, HELPER_PREFIXES)) + ')[A-Za-z0-9]{%d}' % HELPER_SUFFIX_LENGTH)
+
+# the exploit templates of ExploitGenerator.js mark their payloads with randomString() of util.js, which are 20
+# alphanumeric characters. Only literals in exactly the places the templates put them are taken for markers, any other
+# literal is part of the key as it is, since renaming it could map queries with different outcomes onto one key.
+MARKER_LENGTH = 20
+MARKER = '[A-Za-z0-9]{%d}' % MARKER_LENGTH
+# __crawly__("nonce") of the JS templates and __crawly__(`nonce`) of the HTML ones
+CRAWLY_MARKER = re.compile(r'__crawly__\((["`])(%s)\1\)' % MARKER)
+# nonce=nonce; of the cookie template
+COOKIE_MARKER = re.compile(r'(%s)=\1;' % MARKER)
+
+
+def storageMarker(constraint):
+    # key === nonce && val === nonce of the storage template
+    if constraint.get('type') != 'Logical' or constraint.get('op') != '&&':
+        return None
+    vals = []
+    for side in [constraint.get('l_val'), constraint.get('r_val')]:
+        if not isinstance(side, dict) or not side.get('ops'):
+            return None
+        op = side['ops'][-1]
+        if op.get('type') != 'Binary' or op.get('op') != '===' or not isinstance(op.get('val'), str):
+            return None
+        vals.append(op['val'])
+    if vals[0] == vals[1] and re.fullmatch(MARKER, vals[0]):
+        return vals[0]
+    return None
+
+
+def templateMarkers(constraints):
+    """Returns the nonces of the exploit templates in the query, in the order of its canonical JSON."""
+    markers = []
+
+    def add(marker):
+        if marker not in markers:
+            markers.append(marker)
+
+    def walk(value):
+        if isinstance(value, str):
+            for match in CRAWLY_MARKER.finditer(value):
+                add(match.group(2))
+            match = COOKIE_MARKER.fullmatch(value)
+            if match:
+                add(match.group(1))
+        elif isinstance(value, list):
+            for cur in value:
+                walk(cur)
+        elif isinstance(value, dict):
+            marker = storageMarker(value)
+            if marker is not None:
+                add(marker)
+            for _, cur in sorted(value.items()):
+                walk(cur)
+
+    walk(constraints)
+    return markers
+
+
+def markerPlaceholder(index):
+    # keeps length and character class of the marker so that the canonical query is solved alike
+    return 'M' + str(index).zfill(MARKER_LENGTH - 1)
+
+
+def helperPlaceholder(prefix, index):
+    return prefix + str(index).zfill(HELPER_SUFFIX_LENGTH)
+
+
+def normalizeHelperNames(text):
+    seen = dict()
+
+    def substitute(match):
+        if match.group(0) not in seen:
+            seen[match.group(0)] = helperPlaceholder(match.group(1), len(seen))
+        return seen[match.group(0)]
+
+    return HELPER_NAME.sub(substitute, text)
+
+
+def canonicalize(constraints, types, timeout=None):
+    """Returns the cache key of a query together with the marker literals that were renamed to compute it."""
+    text = json.dumps({'constraints': constraints, 'types': types}, sort_keys=True, separators=(',', ':'))
+    text = normalizeHelperNames(text)
+    markers = templateMarkers(constraints)
+    if markers:
+        placeholders = dict((marker, markerPlaceholder(i)) for i, marker in enumerate(markers))
+        occurrence = re.compile('(?<![A-Za-z0-9])(%s)(?![A-Za-z0-9])' % '|'.join(markers))
+        text = occurrence.sub(lambda match: placeholders[match.group(0)], text)
+    key = hashlib.sha256('\0'.join([z3.get_version_string(), str(timeout), text]).encode()).hexdigest()
+    return key, markers
+
+
+def canonicalizeResult(result, markers):
+    text = normalizeHelperNames(json.dumps(result, sort_keys=True))
+    for i, marker in enumerate(markers):
+        text = text.replace(marker, markerPlaceholder(i))
+    return text
+
+
+def restoreResult(text, markers):
+    for i, marker in enumerate(markers):
+        text = text.replace(markerPlaceholder(i), marker)
+    return json.loads(text)
+
+
+class SolverCache:
+    """On disk cache of solver outcomes, keyed by canonicalize() and evicting the least recently used entries."""
+
+    def __init__(self, path, max_entries=100000):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+        self.conn = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, outcome TEXT, result TEXT, '
+                          'last_used REAL)')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS results_last_used ON results(last_used)')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER)')
+        self.conn.execute("INSERT OR IGNORE INTO counters VALUES ('hits', 0), ('misses', 0), ('rejected', 0)")
+
+    def _count(self, name):
+        self.conn.execute('UPDATE counters SET value = value + 1 WHERE name = ?', (name,))
+
+    def lookup(self, key, markers):
+        """Returns (outcome, result) for a previously stored query or None."""
+        row = self.conn.execute('SELECT outcome, result FROM results WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            self._count('misses')
+            return None
+        self.hits += 1
+        self._count('hits')
+        self.conn.execute('UPDATE results SET last_used = ? WHERE key = ?', (time.time(), key))
+        outcome, result = row
+        if result is not None:
+            result = restoreResult(result, markers)
+        return outcome, result
+
+    def reject(self, key):
+        # a model that does not satisfy the query it was looked up for, the entry is replaced once the query is solved
+        self.rejected += 1
+        self._count('rejected')
+        self.conn.execute('DELETE FROM results WHERE key = ?', (key,))
+
+    def store(self, key, markers, outcome, result=None):
+        if result is not None:
+            result = canonicalizeResult(result, markers)
+        self.conn.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)', (key, outcome, result, time.time()))
+        excess = self.conn.execute('SELECT COUNT(*) FROM results').fetchone()[0] - self.max_entries
+        if excess > 0:
+            self.conn.execute('DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY last_used LIMIT ?)',
+                              (excess,))
+
+    def stats(self):
+        counters = dict(self.conn.execute('SELECT name, value FROM counters').fetchall())
+        counters['entries'] = self.conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+        counters['session_hits'] = self.hits
+        counters['session_misses'] = self.misses
+        counters['session_rejected'] = self.rejected
+        return counters
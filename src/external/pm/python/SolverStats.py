@@ -0,0 +1,124 @@
+# Copyright (C) 2020  Marius Steffens, CISPA
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+
+class BudgetExceeded(Exception):
+    pass
+
+
+def formulaSize(exprs):
+    # number of distinct nodes of the DAG, shared subterms are counted once
+    seen = set()
+    todo = list(exprs)
+    while todo:
+        cur = todo.pop()
+        if cur.get_id() in seen:
+            continue
+        seen.add(cur.get_id())
+        todo.extend(cur.children())
+    return len(seen)
+
+
+class SolverStats:
+    """Timings and counters of solving a single query, optionally bounded by a budget in ms for the whole query.
+
+    Phases may be nested, e.g. the regex compilation is part of the translation.
+    """
+
+    def __init__(self, budget=None):
+        self.phases = dict()
+        self.ops = Counter()
+        self.functions = Counter()
+        self.z3 = dict()
+        self.conjuncts = 0
+        self.formula_size = 0
+        self.components = 0
+        self.cached_components = 0
+        self.cache_hit = False
+        self.budget_exceeded = None
+        # a z3 check gave up within a timeout that the budget had cut short, thus its unknown must not be cached
+        self.limited = False
+        self.current = None
+        self.setBudget(budget)
+
+    def setBudget(self, budget):
+        self.budget = budget
+        self.deadline = None if budget is None else time.time() + budget / 1000
+
+    @contextmanager
+    def phase(self, name):
+        wall = time.time()
+        cpu = time.process_time()
+        outer = self.current
+        self.current = name
+        try:
+            yield
+        finally:
+            self.current = outer
+            cur = self.phases.setdefault(name, {'wall': 0.0, 'cpu': 0.0, 'count': 0})
+            cur['wall'] += time.time() - wall
+            cur['cpu'] += time.process_time() - cpu
+            cur['count'] += 1
+
+    def countOp(self, op):
+        self.ops[op['type']] += 1
+        if 'function_name' in op:
+            self.functions[op['function_name']] += 1
+
+    def addSolverStatistics(self, statistics):
+        # counters are summed up over all components of the query, memory is a high watermark
+        for key in statistics.keys():
+            if 'memory' in key:
+                self.z3[key] = max(self.z3.get(key, 0), statistics.get_key_value(key))
+            else:
+                self.z3[key] = self.z3.get(key, 0) + statistics.get_key_value(key)
+
+    def remaining(self):
+        if self.deadline is None:
+            return None
+        return int((self.deadline - time.time()) * 1000)
+
+    def checkBudget(self):
+        if self.deadline is not None and time.time() > self.deadline:
+            self.budget_exceeded = self.current
+            raise BudgetExceeded('budget exceeded during ' + str(self.current))
+
+    def limitTimeout(self, timeout):
+        """Returns the z3 timeout that keeps the solver within the budget."""
+        self.checkBudget()
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        return max(1, remaining if timeout is None else min(timeout, remaining))
+
+    def toJSON(self):
+        res = {
+            'phases': self.phases,
+            'ops': dict(self.ops),
+            'functions': dict(self.functions),
+            'conjuncts': self.conjuncts,
+            'formula_size': self.formula_size,
+            'components': self.components,
+            'cached_components': self.cached_components,
+            'cache_hit': self.cache_hit,
+            'z3': self.z3,
+        }
+        if self.budget_exceeded is not None:
+            res['budget_exceeded'] = self.budget_exceeded
+        return res
@@ -0,0 +1,184 @@
+# Copyright (C) 2020  Marius Steffens, CISPA
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Builds queries in the format the analysis reports them, see makeProxy in util.js and ExploitGenerator.js, and
+# generates synthetic ones that scale along the dimensions which are expensive for the solver.
+
+import copy
+import random
+import string
+
+EVENT = {'identifier': 'event', 'ops': []}
+
+
+def access(parent, key):
+    # property access on a proxy, e.g. event.data -> event.data.foo
+    return {
+        'identifier': parent['identifier'] + '.' + str(key),
+        'ops': [{'type': 'ops_on_parent_element', 'old_identifier': parent['identifier'],
+                 'old_ops': copy.deepcopy(parent['ops'])}],
+    }
+
+
+def accessor(path):
+    value = EVENT
+    for key in path.split('.')[1:]:
+        value = access(value, key)
+    return value
+
+
+def apply(value, *ops):
+    res = copy.deepcopy(value)
+    res['ops'].extend(copy.deepcopy(ops))
+    return res
+
+
+def call(function_name, *args):
+    return {'type': 'member_function', 'function_name': function_name, 'args': list(args)}
+
+
+def external(function_name, *args):
+    return {'type': 'external_function', 'function_name': function_name, 'args': list(args)}
+
+
+def binary(op, val, side='left'):
+    return {'type': 'Binary', 'op': op, 'val': val, 'side': side}
+
+
+def unary(op):
+    return {'type': 'Unary', 'op': op}
+
+
+def logical(op, left, right):
+    return {'type': 'Logical', 'op': op, 'l_val': left, 'r_val': right}
+
+
+def negate(constraint):
+    return {'type': 'Unary', 'op': '!', 'val': constraint}
+
+
+def nonce(rng):
+    # like randomString of util.js
+    return ''.join(rng.choice(string.ascii_letters + string.digits) for _ in range(18)) + rng.choice('abc') + \
+        rng.choice('XYZ')
+
+
+# the exploit templates of ExploitGenerator.js, keyed by a stable name instead of their nonce
+
+def jsExploits(sink, rng):
+    nonces = [nonce(rng) for _ in range(9)]
+    crawly = ['__crawly__("' + n + '")' for n in nonces]
+    return [
+        ('js-comment', logical('&&', apply(sink, call('startsWith', crawly[0] + '/*')),
+                               apply(sink, call('endsWith', ' */')))),
+        ('js-paren-comment', logical('&&', apply(sink, call('startsWith', '(' + crawly[1] + '/*')),
+                                     apply(sink, call('endsWith', ' */)')))),
+        ('js-comment-end', logical('&&', apply(sink, call('startsWith', '/*')),
+                                   apply(sink, call('endsWith', ' */' + crawly[2])))),
+        ('js-kameleoon', apply(sink, binary('===', 'Kameleoon=1,' + crawly[3]))),
+        ('js-tostring', apply(sink, call('endsWith', '.toString(),' + crawly[4]))),
+        ('js-assignment', apply(sink, call('endsWith', '1;' + crawly[5] + ';'))),
+        ('js-assignment-equal', apply(sink, call('endsWith', '=1;' + crawly[6] + ';'))),
+        ('js-line-comment', apply(sink, call('startsWith', crawly[7] + ';//'))),
+        ('js-wrapped', apply(sink, call('startsWith', '(function(){' + crawly[8] + '})();//'))),
+    ]
+
+
+def htmlExploits(sink, rng):
+    img = '<img src="foo" onerror="__crawly__(`{0}`)" onload="__crawly__(`{0}`)"><textarea>'.format(nonce(rng))
+    polyglot = "`'\">--!></stYle/</titLe/</teXtarEa/</scRipt/><img/src=foo oNloAd=__crawly__(`{}`)//>\x3e\n".format(
+        nonce(rng))
+    return [
+        ('html-img', apply(sink, call('indexOf', img), binary('>', 0))),
+        ('html-polyglot', apply(sink, call('indexOf', polyglot), binary('>', 0))),
+    ]
+
+
+def storageExploits(key, val, rng):
+    marker = nonce(rng)
+    return [('storage', logical('&&', apply(key, binary('===', marker)), apply(val, binary('===', marker))))]
+
+
+def cookieExploits(sink, rng):
+    marker = nonce(rng)
+    return [('cookie', apply(sink, call('startsWith', marker + '=' + marker + ';')))]
+
+
+def originConstraint():
+    origin = accessor('event.origin')
+    return logical('||', apply(origin, call('substring', 0, 7), binary('===', 'http://')),
+                   apply(origin, call('substring', 0, 8), binary('===', 'https://')))
+
+
+def exploitQueries(name, constraints, types, exploits):
+    # every template is solved on top of the base constraints together with the origin constraint, like
+    # generateExploitForReport does it
+    return [{'name': name + '/' + template, 'handler': name, 'constraints': constraints,
+             'exploit_constraints': [candidate, originConstraint()], 'types': types}
+            for template, candidate in exploits]
+
+
+def generateQuery(conjuncts=1, depth=1, splits=0, regex_size=0, nesting=0, seed=0):
+    """A handler that checks `conjuncts` properties in `depth` deep accessors, compares fields of `splits` split
+    arrays, matches the origin against a regex with `regex_size` alternatives and nests ||/&& `nesting` deep."""
+    rng = random.Random(seed)
+    data = accessor('event.data')
+    constraints = []
+    types = []
+    for i in range(conjuncts):
+        value = data
+        for j in range(depth):
+            value = access(value, 'f%d_%d' % (i, j))
+        constraints.append(apply(value, binary('===', 'v%d' % i)))
+        types.append([value['identifier'], 'string'])
+    for i in range(splits):
+        parent = access(data, 's%d' % i)
+        separator = '|%d|' % i
+        for index in range(1, 3):
+            element = access(apply(parent, call('split', separator)), index)
+            constraints.append(apply(element, binary('===', nonce(rng))))
+    if regex_size:
+        domains = '|'.join('d%d\\.example%d\\.com' % (i, i) for i in range(regex_size))
+        constraints.append(apply(accessor('event.origin'), call('match', '^https?:\\/\\/(' + domains + ')$')))
+    if nesting:
+        kind = access(data, 'kind')
+        tree = apply(kind, binary('===', 'k0'))
+        for i in range(1, nesting + 1):
+            # alternating operators, e.g. (((k0 || k1) && k2) || k3)
+            op = '||' if i % 2 else '&&'
+            tree = logical(op, tree, apply(kind, binary('===' if op == '||' else '!==', 'k%d' % i)))
+        constraints.append(tree)
+    name = 'synthetic/conjuncts=%d,depth=%d,splits=%d,regex=%d,nesting=%d' % (conjuncts, depth, splits, regex_size,
+                                                                               nesting)
+    return exploitQueries(name, constraints, types, jsExploits(access(data, 'fun'), rng)[:1])[0]
+
+
+# every dimension is scaled on its own, while the others stay at their default
+SCALES = {
+    'conjuncts': [1, 8, 32, 128],
+    'depth': [1, 4, 16, 64],
+    'splits': [1, 2, 4],
+    'regex_size': [1, 8, 32, 128],
+    'nesting': [1, 4, 16, 64],
+}
+
+
+def syntheticSuite(scales=SCALES):
+    queries = dict()
+    for parameter, values in scales.items():
+        for value in values:
+            query = generateQuery(**{parameter: value})
+            queries[query['name']] = query
+    return list(queries.values())
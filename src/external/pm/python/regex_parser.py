@@ -30,7 +30,7 @@ from functools import reduce
 import ply.lex as lex
 import ply.yacc as yacc
 
-[EMPTY, CHAR, DOT, STAR, BAR, CONCAT, GROUP, BACKREF, CARET, DOLLAR] = range(10)
+[EMPTY, CHAR, DOT, STAR, BAR, CONCAT, GROUP, BACKREF, CARET, DOLLAR, SET, PLUS, OPTION, REPEAT] = range(14)
 CHARSET = string.ascii_lowercase + string.ascii_uppercase + string.digits + " :/'!" + ".*+?|()[]^-{},\\_<>"
 
 character_classes = {
@@ -52,7 +52,7 @@ class RegexLexer:
     )
 
     def t_NON_META_CHAR(self, t):
-        r"[a-zA-Z :/'!_`<>=\"-]"
+        r"[a-zA-Z :/'!_`<>=\"]"
         return t
 
     def t_DIGIT(self, t):
@@ -127,11 +127,17 @@ class RegexParser:
 
     def p_factor_plus(self, p):
         """factor : factor PLUS"""
-        p[0] = (CONCAT, p[1], (STAR, p[1]))
+        if self.compact:
+            p[0] = (PLUS, p[1])
+        else:
+            p[0] = (CONCAT, p[1], (STAR, p[1]))
 
     def p_factor_question(self, p):
         """factor : factor QUESTION"""
-        p[0] = (BAR, p[1], (EMPTY,))
+        if self.compact:
+            p[0] = (OPTION, p[1])
+        else:
+            p[0] = (BAR, p[1], (EMPTY,))
 
     def p_factor_group(self, p):
         """factor : LPAREN regex RPAREN"""
@@ -145,6 +151,10 @@ class RegexParser:
 
     def p_factor_set(self, p):
         """factor : set"""
+        if self.compact:
+            # already a (SET, chars, negated) node
+            p[0] = p[1]
+            return
         chars = list(p[1])
         chars = map(lambda x: (CHAR, x), chars)
         p[0] = reduce(lambda x, y: (BAR, x, y), chars)
@@ -175,6 +185,8 @@ class RegexParser:
         """
         if p[2] in ",-/'!":
             p[0] = (CHAR, p[2])
+        elif p[2] in character_classes and self.compact:
+            p[0] = (SET, frozenset(character_classes[p[2]]), False)
         elif p[2] in character_classes:
             chars = map(lambda x: (CHAR, x), character_classes[p[2]])
             p[0] = reduce(lambda x, y: (BAR, x, y), chars)
@@ -185,13 +197,18 @@ class RegexParser:
         """factor : factor LBRACE number RBRACE"""
         inner = p[1]
         times = int(p[3])
+        if self.compact:
+            p[0] = (REPEAT, inner, times, times)
+            return
         p[0] = reduce(lambda x, y: (CONCAT, x, y), [inner for _ in range(times)])
 
     def p_factor_brace_2(self, p):
         """factor : factor LBRACE number COMMA RBRACE"""
         inner = p[1]
         times = int(p[3])
-        if times == 0:
+        if self.compact:
+            p[0] = (REPEAT, inner, times, None)
+        elif times == 0:
             p[0] = (STAR, inner)
         else:
             prefix = reduce(lambda x, y: (CONCAT, x, y), [inner for _ in range(times)])
@@ -202,6 +219,9 @@ class RegexParser:
         inner = p[1]
         times1 = int(p[3])
         times2 = int(p[5])
+        if self.compact:
+            p[0] = (REPEAT, inner, times1, times2)
+            return
         cases = []
         for l in range(times1, times2 + 1):
             case = reduce(lambda x, y: (CONCAT, x, y), [inner for _ in range(l)])
@@ -218,11 +238,17 @@ class RegexParser:
 
     def p_set_positive(self, p):
         """set : LBRACKET set_items RBRACKET"""
-        p[0] = p[2]
+        if self.compact:
+            p[0] = (SET, frozenset(p[2]), False)
+        else:
+            p[0] = p[2]
 
     def p_set_negative(self, p):
         """set : LBRACKET CARET set_items RBRACKET"""
-        p[0] = set(set(CHARSET) - p[3])
+        if self.compact:
+            p[0] = (SET, frozenset(p[3]), True)
+        else:
+            p[0] = set(set(CHARSET) - p[3])
 
     def p_set_items_single(self, p):
         """set_items : set_item"""
@@ -242,6 +268,16 @@ class RegexParser:
         end = ord(p[3])
         p[0] = set(map(chr, range(begin, end + 1)))
 
+    def p_set_item_dash(self, p):
+        """set_item : DASH"""
+        # a dash that does not denote a range, e.g. [-a] or [a-z-]
+        p[0] = set(['-'])
+
+    def p_set_item_trailing_dash(self, p):
+        """set_item : set_non_meta_char DASH"""
+        # only reduced when the set ends right after the dash, e.g. [+-]
+        p[0] = set([p[1], '-'])
+
     def p_set_item_escape(self, p):
         """
         set_item : BACKSLASH RBRACKET
@@ -281,7 +317,9 @@ class RegexParser:
     def p_error(self, p):
         print("Parse error at '%s'" % p.value)
 
-    def __init__(self):
+    def __init__(self, compact=False):
+        # the compact mode keeps sets, repetitions and optionals as single nodes instead of expanding them
+        self.compact = compact
         self.lexer = RegexLexer()
         self.tokens = self.lexer.tokens
         self.parser = yacc.yacc(module=self)
@@ -0,0 +1,71 @@
+# Copyright (C) 2020  Marius Steffens, CISPA
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Checks the benchmark inputs themselves, the benchmark is run with Benchmark.py.
+
+import os
+
+from Benchmark import CORPUS, batchSuite, loadCorpus, regressions
+from ConstraintSolver import flatConjunction
+from ConstraintTranslator import ConstraintTranslator
+from SolverStats import formulaSize
+from SyntheticQueries import generateQuery
+
+TESTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', '..', 'tests')
+
+
+def translate(query):
+    translator = ConstraintTranslator(query['types'])
+    conjuncts = translator.translateConstraints(query['constraints'] + query['exploit_constraints'])
+    return flatConjunction(conjuncts + translator.getStateConstraints())
+
+
+def test_corpus_covers_all_handlers():
+    handlers = set(query['handler'] for query in loadCorpus(CORPUS))
+    assert handlers == set(name for name in os.listdir(TESTS_DIR) if name.endswith('.html'))
+
+
+def test_corpus_translates():
+    for query in loadCorpus(CORPUS):
+        assert translate(query), query['name']
+
+
+def test_batches_cover_all_templates():
+    queries = loadCorpus(CORPUS)
+    batches = batchSuite(queries)
+    assert len(batches) == len(set(query['handler'] for query in queries))
+    assert sum(len(batch['candidates']) for batch in batches) == len(queries)
+
+
+def test_generator_scales():
+    assert len(translate(generateQuery(conjuncts=16))) > len(translate(generateQuery(conjuncts=2)))
+    assert len(translate(generateQuery(splits=4))) > len(translate(generateQuery(splits=1)))
+    assert formulaSize(translate(generateQuery(regex_size=16))) > formulaSize(translate(generateQuery(regex_size=2)))
+    assert formulaSize(translate(generateQuery(nesting=16))) > formulaSize(translate(generateQuery(nesting=2)))
+    deep = generateQuery(depth=8)
+    assert deep['types'][0][0].count('.') == 9
+    assert translate(deep)
+
+
+def test_regressions():
+    base = {'outcome': 'sat', 'translation': 0.01, 'solve': 1.0, 'rss': 100}
+    assert regressions(dict(base), base, 2.0) == []
+    assert regressions(dict(base, solve=1.5, translation=0.2, rss=150), base, 2.0) == []
+    assert len(regressions(dict(base, outcome='unknown'), base, 2.0)) == 1
+    assert len(regressions(dict(base, solve=3.0), base, 2.0)) == 1
+    assert regressions(dict(base, outcome='sat'), dict(base, outcome='unknown'), 2.0) == []
+    batch = dict(base, outcome='1/2 sat', outcomes=['sat', 'unknown'])
+    assert regressions(dict(batch, outcomes=['sat', 'sat']), batch, 2.0) == []
+    assert len(regressions(dict(batch, outcomes=['unsat', 'unknown']), batch, 2.0)) == 1
@@ -0,0 +1,55 @@
+# Copyright (C) 2020  Marius Steffens, CISPA
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import random
+
+from ConstraintSolver import solveQuery
+from SolverCache import SolverCache, canonicalize
+from SolverStats import SolverStats
+from SyntheticQueries import accessor, apply, binary, call, cookieExploits, jsExploits, logical, storageExploits
+
+DATA = accessor('event.data')
+TYPES = [['event.data', 'string']]
+
+
+def literalQuery(literal):
+    return [logical('&&', apply(DATA, binary('===', literal)), apply(DATA, call('startsWith', 'Abc')))]
+
+
+def test_only_template_markers_are_renamed():
+    rng = random.Random(0)
+    for exploits in [jsExploits(DATA, rng), cookieExploits(DATA, rng), storageExploits(DATA, DATA, rng)]:
+        for _, candidate in exploits:
+            assert len(canonicalize([candidate], TYPES)[1]) == 1
+    assert canonicalize(literalQuery('AbcdefghijKLMNOPQRST'), TYPES)[1] == []
+    key = canonicalize(literalQuery('AbcdefghijKLMNOPQRST'), TYPES)[0]
+    assert key != canonicalize(literalQuery('XbcdefghijKLMNOPQRST'), TYPES)[0]
+
+
+def test_cached_model_is_checked(tmp_path):
+    cache = SolverCache(str(tmp_path / 'cache.sqlite'))
+    assert solveQuery(literalQuery('AbcdefghijKLMNOPQRST'), TYPES, 10000, cache)[0] == 'sat'
+    stats = SolverStats()
+    assert solveQuery(literalQuery('AbcdefghijKLMNOPQRST'), TYPES, 10000, cache, stats=stats)[0] == 'sat'
+    assert stats.cache_hit
+
+    # a model that does not fit the query is not handed out but solved again
+    key, markers = canonicalize(literalQuery('AbcdefghijKLMNOPQRST'), TYPES, 10000)
+    cache.store(key, markers, 'sat', {'assignements': {'event.data': 'XbcdefghijKLMNOPQRST'}, 'types': {}})
+    stats = SolverStats()
+    outcome, res = solveQuery(literalQuery('AbcdefghijKLMNOPQRST'), TYPES, 10000, cache, stats=stats)
+    assert outcome == 'sat' and res['assignements']['event.data'] == 'AbcdefghijKLMNOPQRST'
+    assert not stats.cache_hit
+    assert cache.stats()['rejected'] == 1
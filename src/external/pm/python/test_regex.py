@@ -0,0 +1,129 @@
+# Copyright (C) 2020  Marius Steffens, CISPA
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Compares the compact regex encoding against the expanded one for the regexes of our test cases.
+# Run with pytest or directly to get a table of formula sizes and solve times.
+
+import time
+
+import z3
+
+from RegexToZ3 import regex_to_z3, compile_regex
+
+# regexes as our analysis extracts them from the handlers in tests/
+REGEXES = {
+    'regexMatch.html': r'\.foobar\.com',
+    'regexObj.html': r'^(http:\/\/|https:\/\/)+([a-zA-Z0-9_+-]+\.){0,}(foo.com|bar.org)$',
+    'sliceAndSearch.html': r'([foo|bar].[com|org]+)\/?$',
+}
+
+# strings on which both encodings have to agree
+MEMBERS = {
+    'regexMatch.html': ['https://www.foobar.com', 'http://a.foobar.com/b'],
+    'regexObj.html': ['https://a.foo.com', 'http://http://a-b.c_d.bar.org'],
+    'sliceAndSearch.html': ['http://o.com/', 'https://xa.org/'],
+}
+NON_MEMBERS = {
+    'regexMatch.html': ['https://foobar.com', 'https://www.foobar.co'],
+    'regexObj.html': ['https://a.foo.org', 'ftp://foo.com', 'https://a..foo.com'],
+    'sliceAndSearch.html': ['http://x.de/', 'http://'],
+}
+
+
+def formulaSize(expr):
+    seen = set()
+    todo = [expr]
+    while todo:
+        cur = todo.pop()
+        if cur.get_id() in seen:
+            continue
+        seen.add(cur.get_id())
+        todo.extend(cur.children())
+    return len(seen)
+
+
+def isMember(regex, value):
+    solver = z3.Solver()
+    solver.add(z3.InRe(z3.StringVal(value), regex))
+    return solver.check() == z3.sat
+
+
+def timeSolve(regex, timeout=5000):
+    # the kind of query an origin check produces: a https origin that matches the regex
+    start = time.time()
+    x = z3.String('event.origin')
+    solver = z3.Solver()
+    solver.set('timeout', timeout)
+    solver.add(z3.InRe(x, regex), z3.PrefixOf(z3.StringVal('https://'), x))
+    res = solver.check()
+    return res, time.time() - start
+
+
+def test_compact_is_not_larger():
+    for name, regex in REGEXES.items():
+        assert formulaSize(compile_regex(regex)) <= formulaSize(compile_regex(regex, compact=False)), name
+
+
+def test_encodings_agree():
+    for name, regex in REGEXES.items():
+        compact = compile_regex(regex)
+        expanded = compile_regex(regex, compact=False)
+        for value in MEMBERS[name]:
+            assert isMember(compact, value), (name, value)
+            assert isMember(expanded, value), (name, value)
+        for value in NON_MEMBERS[name]:
+            assert not isMember(compact, value), (name, value)
+            assert not isMember(expanded, value), (name, value)
+
+
+def test_encodings_solve_alike():
+    for name, regex in REGEXES.items():
+        compact = timeSolve(compile_regex(regex))[0]
+        expanded = timeSolve(compile_regex(regex, compact=False))[0]
+        assert compact == z3.sat, name
+        # the expanded encoding of regexObj.html runs into the timeout with z3 4.8.7
+        assert expanded == z3.unknown or expanded == compact, name
+
+
+def test_optional_may_be_absent():
+    # the expanded encoding unions with the empty language, thus it requires the optional part to be present
+    regex = REGEXES['sliceAndSearch.html']
+    assert isMember(compile_regex(regex), 'http://o.com')
+    assert not isMember(compile_regex(regex, compact=False), 'http://o.com')
+
+
+def test_ranges():
+    regex = compile_regex('^[a-c-]\\d{2,3}[^x]$')
+    assert isMember(regex, 'b12y')
+    assert isMember(regex, '-123y')
+    assert not isMember(regex, 'd12y')
+    assert not isMember(regex, 'b12345')
+    assert not isMember(regex, 'b12x')
+
+
+def test_memoized():
+    assert regex_to_z3(REGEXES['regexMatch.html']) is regex_to_z3(REGEXES['regexMatch.html'])
+
+
+if __name__ == '__main__':
+    print('{:<20} {:>10} {:>10} {:>20} {:>20}'.format('test case', 'size', 'compact', 'time', 'compact'))
+    for name, regex in REGEXES.items():
+        expanded = compile_regex(regex, compact=False)
+        compact = compile_regex(regex)
+        expanded_res, expanded_time = timeSolve(expanded)
+        compact_res, compact_time = timeSolve(compact)
+        print('{:<20} {:>10} {:>10} {:>11.4f}s {:>7} {:>11.4f}s {:>7}'.format(
+            name, formulaSize(expanded), formulaSize(compact), expanded_time, str(expanded_res), compact_time,
+            str(compact_res)))
@@ -17,12 +17,39 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 const util = require('../util/Util');
 const {BaseModule} = require('./BaseModule');
 const md5 = require('md5');
-const exec = require('child_process').exec;
+const {getSolverServer} = require('../util/SolverServer');
+const {config} = require('../config');
 
 const TEST_TIMEOUT = 1000 * 60 * 2;
 const SAT_TIMEOUT = 1000 * 30;
+// with stats enabled the solver gives up on its own before it is killed, such that we still learn where the time went
+const STATS_BUDGET = SAT_TIMEOUT - 1000 * 5;
 const HANDLER_PATH = '/handlers';
 
+function solverRequest(request) {
+  if (config.solver.stats) {
+    request.stats = true;
+    request.budget = STATS_BUDGET;
+  }
+  return request;
+}
+
+// failed queries print their instrumentation on stdout
+function statsOf(stdout) {
+  try {
+    return JSON.parse(stdout)['stats'];
+  } catch (e) {
+    return undefined;
+  }
+}
+
+function withStats(addInfo, stats) {
+  if (stats === undefined) {
+    return addInfo;
+  }
+  return addInfo + '\n' + JSON.stringify({stats: stats});
+}
+
 class PMModule extends BaseModule {
   constructor(chrome, page, job, db, logger) {
     super(chrome, page, job, db, logger);
@@ -85,6 +112,7 @@ class PMModule extends BaseModule {
 
     // export most of the interactions between analysis and db/constraint solving
     await this.pupPage.exposeFunction('__trySolveForSat', this.trySolveForSat.bind(this));
+    await this.pupPage.exposeFunction('__trySolveBatchForSat', this.trySolveBatchForSat.bind(this));
     await this.pupPage.exposeFunction('__reportBaseConstraint', this.reportBaseConstraint.bind(this));
     await this.pupPage.exposeFunction('__report_manual_exploit', this.reportForManualExploitation.bind(this));
     await this.pupPage.exposeFunction('__shouldAnalyzeHandler', this.shouldAnalyzeHandler.bind(this));
@@ -306,30 +334,22 @@ class PMModule extends BaseModule {
   async trySolveForSat(constraints, types, constraintId, exp_constraints, sink) {
     let p;
     try {
-      p = await new Promise((resolve) => {
-        let process = exec('python3 ./external/pm/python/ConstraintSolver.py', {
-          timeout: SAT_TIMEOUT,
-        }, (err, stdout, stderr) => {
-          resolve({stdout: stdout, stderr: stderr, err: err})
-        });
-        process.stdin.write(JSON.stringify({constraints: constraints, types: types}));
-        process.stdin.end()
-      })
+      p = await getSolverServer().solve(solverRequest({constraints: constraints, types: types}), SAT_TIMEOUT);
     } catch (e) {
       await this.reportConstraintSatisfiability(constraintId, constraints, exp_constraints, types, 0, e, sink);
       return undefined
     }
     if (p.err) {
       if (p.err.killed) {
-        // this captures kills by the exec function due to timeouts
+        // this captures kills of the solver process due to timeouts
         await this.reportConstraintSatisfiability(constraintId, constraints, exp_constraints, types, 0, 'Timeout', sink);
       } else {
-        await this.reportConstraintSatisfiability(constraintId, constraints, exp_constraints, types, 0, p.stderr, sink);
+        await this.reportConstraintSatisfiability(constraintId, constraints, exp_constraints, types, 0, withStats(p.stderr, statsOf(p.stdout)), sink);
       }
       return undefined
     } else if (p.stderr.length > 0) {
       // we have some info on stderr
-      await this.reportConstraintSatisfiability(constraintId, constraints, exp_constraints, types, 0, p.stderr, sink);
+      await this.reportConstraintSatisfiability(constraintId, constraints, exp_constraints, types, 0, withStats(p.stderr, statsOf(p.stdout)), sink);
       return undefined;
     } else {
       let assignments = JSON.parse(p.stdout);
@@ -339,6 +359,42 @@ class PMModule extends BaseModule {
     }
   };
 
+  async trySolveBatchForSat(constraints, types, constraintId, candidates, sink) {
+    // the base constraints are only translated once by the solver and every candidate is checked on top of them
+    let p;
+    try {
+      p = await getSolverServer().solve(solverRequest({
+        constraints: constraints,
+        types: types,
+        candidates: candidates,
+        timeout: SAT_TIMEOUT
+      }), SAT_TIMEOUT * Math.max(candidates.length, 1));
+    } catch (e) {
+      p = {stdout: '', stderr: e, err: {killed: false}};
+    }
+    let results = [];
+    if (p.err || p.stderr.length > 0) {
+      let addInfo = p.err && p.err.killed ? 'Timeout' : p.stderr;
+      for (let exp_constraints of candidates) {
+        await this.reportConstraintSatisfiability(constraintId, constraints, exp_constraints, types, 0, addInfo, sink);
+        results.push(undefined);
+      }
+      return results;
+    }
+    let solved = JSON.parse(p.stdout)['results'];
+    for (let i = 0; i < candidates.length; i++) {
+      if (solved[i]['error'] !== undefined) {
+        await this.reportConstraintSatisfiability(constraintId, constraints, candidates[i], types, 0, withStats(solved[i]['error'], solved[i]['stats']), sink);
+        results.push(undefined);
+      } else {
+        this.logger.log('Assignements', solved[i]);
+        let eId = await this.reportConstraintSatisfiability(constraintId, constraints, candidates[i], types, 1, solved[i], sink);
+        results.push([solved[i], eId]);
+      }
+    }
+    return results;
+  };
+
   async reportExternalFun(funString, handlerId) {
     try {
       if (this.save) {
@@ -0,0 +1,158 @@
+/*
+Copyright (C) 2020  Marius Steffens, CISPA
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*/
+const spawn = require('child_process').spawn;
+const {config} = require('../config');
+
+const SOLVER_CMD = 'python3';
+const SOLVER_ARGS = ['./external/pm/python/ConstraintSolver.py', '--server'];
+
+// Keeps one ConstraintSolver.py process alive so that z3 and the regex parser only have to be loaded once.
+// Queries are answered strictly one after another, a query that runs into the timeout kills the process
+// which is then respawned for the next query.
+class SolverServer {
+  constructor(args = []) {
+    this.args = args;
+    this.proc = undefined;
+    this.pending = undefined;
+    this.queue = Promise.resolve();
+    this.nextId = 0;
+  }
+
+  _spawn() {
+    let proc = spawn(SOLVER_CMD, SOLVER_ARGS.concat(this.args), {stdio: ['pipe', 'pipe', 'pipe']});
+    // one buffer per process, such that output of a killed process is never taken for the answer of the next one
+    let buffer = '';
+    proc.stdout.setEncoding('utf8');
+    proc.stdout.on('data', (chunk) => {
+      if (this.proc !== proc) {
+        return;
+      }
+      buffer += chunk;
+      let idx;
+      while ((idx = buffer.indexOf('\n')) >= 0) {
+        let line = buffer.slice(0, idx);
+        buffer = buffer.slice(idx + 1);
+        let answer;
+        try {
+          answer = JSON.parse(line);
+        } catch (e) {
+          // e.g. native output of z3, which the per query capture of the server does not see
+          this._kill();
+          this._answer({stdout: '', stderr: 'unexpected solver output: ' + line, failed: true});
+          return;
+        }
+        // answers to queries we already gave up on are dropped
+        if (this.pending !== undefined && answer.id === this.pending.id) {
+          this._answer(answer);
+        }
+      }
+    });
+    // stderr of the server itself is only written to when the server crashes, the one of each query is part of the answer
+    let stderr = '';
+    proc.stderr.setEncoding('utf8');
+    proc.stderr.on('data', (chunk) => {
+      stderr += chunk;
+    });
+    proc.on('exit', () => {
+      if (this.proc === proc) {
+        this.proc = undefined;
+        this._answer({stdout: '', stderr: stderr, failed: true});
+      }
+    });
+    // e.g. python3 could not be spawned at all, in which case there might never be an exit event
+    proc.on('error', (err) => {
+      if (this.proc === proc) {
+        this.proc = undefined;
+        this._answer({stdout: '', stderr: stderr + String(err), failed: true});
+      }
+    });
+    proc.stdin.on('error', () => {
+      // the exit handler takes care of answering the pending query
+    });
+    this.proc = proc;
+  }
+
+  _answer(res) {
+    if (this.pending === undefined) {
+      return;
+    }
+    let pending = this.pending;
+    this.pending = undefined;
+    clearTimeout(pending.timer);
+    pending.resolve(res);
+  }
+
+  _kill() {
+    if (this.proc !== undefined) {
+      let proc = this.proc;
+      this.proc = undefined;
+      proc.kill('SIGKILL');
+    }
+  }
+
+  _query(request, timeout) {
+    return new Promise((resolve) => {
+      if (this.proc === undefined) {
+        this._spawn();
+      }
+      request.id = this.nextId++;
+      this.pending = {
+        id: request.id,
+        resolve: resolve,
+        timer: setTimeout(() => {
+          this._kill();
+          this._answer({stdout: '', stderr: '', failed: true, killed: true});
+        }, timeout)
+      };
+      this.proc.stdin.write(JSON.stringify(request) + '\n');
+    });
+  }
+
+  // resolves to the same {stdout, stderr, err} triple that exec would hand us for a single shot run
+  solve(request, timeout) {
+    let res = this.queue.then(() => this._query(request, timeout));
+    this.queue = res.catch(() => undefined);
+    return res.then((answer) => {
+      let err = null;
+      if (answer.failed) {
+        err = {killed: answer.killed === true};
+      }
+      return {stdout: answer.stdout, stderr: answer.stderr, err: err};
+    });
+  }
+}
+
+let server;
+
+function getSolverServer() {
+  if (server === undefined) {
+    let args = [];
+    if (config.solver.cache) {
+      args.push('--cache', config.solver.cache, '--cache-size', String(config.solver.cacheSize));
+    }
+    if (config.solver.portfolio) {
+      args.push('--portfolio');
+    }
+    server = new SolverServer(args);
+  }
+  return server;
+}
+
+module.exports = {
+  SolverServer,
+  getSolverServer
+};